@@ -10,11 +10,15 @@ Bit of a Factory thing going on here...
 
 from typing import (TYPE_CHECKING,
                     Optional, Union, Type, NewType, Any, Mapping,
-                    Callable, Iterable, Dict, Set, List)
+                    Callable, Iterable, Iterator, Dict, Set, List, Tuple)
 if TYPE_CHECKING:
     from veredi.data.config.context import ConfigContext
 
 
+import importlib
+from contextlib import contextmanager
+
+
 from veredi.base.strings       import label, labeler, mixin
 from veredi.base.strings.mixin import NamesMixin
 from veredi.base               import types
@@ -37,6 +41,77 @@ Can register either a Type (class), or a Callable (function).
 '''
 
 
+RecordType = NewType('RecordType',
+                     Tuple[label.DotStr, Optional[label.DotStr], bool])
+'''
+What `recording()` records for each registration:
+  (registrar dotted, registree dotted, registrar allows lazy registration)
+
+Registree dotted is None for an `ignore()`.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Variables
+# -----------------------------------------------------------------------------
+
+_recorded: Optional[List[RecordType]] = None
+'''
+If not None, all registrars append what they register/ignore here.
+See `recording()`.
+'''
+
+
+_deferred: Dict[label.DotStr, Dict[label.DotStr, str]] = {}
+'''
+Registrees that haven't been imported yet, to be imported on first
+`get_by_dotted()` miss:
+  registrar dotted -> registree dotted -> module name to import
+'''
+
+
+# -----------------------------------------------------------------------------
+# Registration Recording & Lazy Registration
+# -----------------------------------------------------------------------------
+
+@contextmanager
+def recording() -> Iterator[List[RecordType]]:
+    '''
+    Context manager for recording everything registered/ignored (by any
+    registrar) while inside the context.
+
+    Yields the list that gets appended to; see `RecordType`.
+    '''
+    global _recorded
+    previous = _recorded
+    _recorded = []
+    try:
+        yield _recorded
+    finally:
+        _recorded = previous
+
+
+def defer(registrar_dotted: label.LabelInput,
+          dotted:           label.LabelInput,
+          module:           str) -> None:
+    '''
+    Defer registration of `dotted` with the registrar `registrar_dotted` until
+    someone asks for it via `get_by_dotted()`. Then `module` will be imported,
+    which should register it.
+    '''
+    registrar_dotted = label.normalize(registrar_dotted)
+    _deferred.setdefault(registrar_dotted, {})[label.normalize(dotted)] = module
+
+
+def deferred(registrar_dotted: label.LabelInput) -> Dict[label.DotStr, str]:
+    '''
+    Returns the registrees still waiting to be imported for the registrar
+    `registrar_dotted`: registree dotted -> module name.
+    '''
+    return _deferred.get(label.normalize(registrar_dotted), {})
+
+
+
 # -----------------------------------------------------------------------------
 # Registrar Sub-Class Creation
 # -----------------------------------------------------------------------------
@@ -118,6 +193,13 @@ class BaseRegistrar(LogMixin, NamesMixin):
         + name_klass_xform:  Optional[Callable[[str], str]] = to_lower_lambda,
     '''
 
+    _LAZY_REGISTRATION: bool = True
+    '''
+    Can our registrees be registered lazily (imported on first
+    `get_by_dotted()`)? Registrars that find registrees any other way (e.g.
+    searching the registry) must set this to False.
+    '''
+
     # -------------------------------------------------------------------------
     # Registrar Creation Helper
     # -------------------------------------------------------------------------
@@ -438,6 +520,11 @@ class BaseRegistrar(LogMixin, NamesMixin):
         self._finalize_register(cls_or_func, dotted_list,
                                 registry_our, registry_bg)
 
+        if _recorded is not None:
+            _recorded.append((self.dotted,
+                              label.normalize(dotted_list),
+                              self._LAZY_REGISTRATION))
+
     def ignore(self,
                ignore_klass: Type,
                # dotted:       label.InputType  # TODO: should we use dotted to check registry?
@@ -450,6 +537,9 @@ class BaseRegistrar(LogMixin, NamesMixin):
         # registered?
         self._ignore.add(ignore_klass)
 
+        if _recorded is not None:
+            _recorded.append((self.dotted, None, self._LAZY_REGISTRATION))
+
     def ignored(self, check: Type) -> bool:
         '''
         Is `check` in our set of classes that should be ignored?
@@ -471,6 +561,9 @@ class BaseRegistrar(LogMixin, NamesMixin):
 
         Context just used for errors/exceptions.
 
+        If `dotted` was deferred for lazy registration, this imports its
+        module (once) and tries again.
+
         Raises:
           KeyError - dotted string not found in our registry.
         '''
@@ -488,6 +581,8 @@ class BaseRegistrar(LogMixin, NamesMixin):
             try:
                 registration = registration[key]
             except KeyError as error:
+                if self._import_deferred(dotted):
+                    return self.get_by_dotted(dotted, context)
                 raise log.exception(
                     RegistryError,
                     "Registry has nothing at: {} (full path: {})",
@@ -511,6 +606,22 @@ class BaseRegistrar(LogMixin, NamesMixin):
         # Good; return the leaf value (a RegisterType).
         return registration
 
+    def _import_deferred(self, dotted: label.LabelInput) -> bool:
+        '''
+        If `dotted` is waiting on lazy registration, import its module so it
+        can register itself.
+
+        Returns True if a module was imported.
+        '''
+        module = deferred(self.dotted).pop(label.normalize(dotted), None)
+        if not module:
+            return False
+
+        self._log_debug("Lazy registration of '{}': importing {}...",
+                        label.normalize(dotted), module)
+        importlib.import_module(module)
+        return True
+
     def get_from_data(self,
                       data:    Mapping[str, Any],
                       context: Optional[VerediContext]) -> 'RegisterType':
@@ -588,6 +699,7 @@ class BaseRegistrar(LogMixin, NamesMixin):
         '''
         self._store_registry = None
         self._store_ignore = None
+        _deferred.pop(self.dotted, None)
 
 
 # -----------------------------------------------------------------------------
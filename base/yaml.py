@@ -11,7 +11,7 @@ Custom YAML Formatter for:
 # -----------------------------------------------------------------------------
 
 from typing import (Optional, Union, Any, Type, NewType,
-                    Callable, TextIO, Mapping, Dict)
+                    Callable, TextIO, Mapping, Iterable, Dict)
 
 
 import yaml
@@ -46,6 +46,19 @@ they came from.
 '''
 
 
+LIBYAML: bool = bool(getattr(yaml, '__with_libyaml__', False))
+'''
+True if PyYAML was built with libyaml, so we can use its (much faster) C
+loader and dumper.
+'''
+
+
+_use_libyaml: bool = LIBYAML
+'''
+Use libyaml's C loader and dumper? Only if we have them. See `use_libyaml()`.
+'''
+
+
 # -----------------------------------------------------------------------------
 # Types
 # -----------------------------------------------------------------------------
@@ -404,6 +417,95 @@ def constructors() -> None:
               __file__)
 
 
+# -----------------------------------------------------------------------------
+# Loader/Dumper: libyaml if available.
+# -----------------------------------------------------------------------------
+
+_LOADER_REGISTRIES = ('yaml_constructors',
+                      'yaml_multi_constructors',
+                      'yaml_implicit_resolvers',
+                      'yaml_path_resolvers')
+'''
+Loader class variables that `yaml.add_constructor()`, etc. register into.
+'''
+
+_DUMPER_REGISTRIES = ('yaml_representers',
+                      'yaml_multi_representers',
+                      'yaml_implicit_resolvers',
+                      'yaml_path_resolvers')
+'''
+Dumper class variables that `yaml.add_representer()`, etc. register into.
+'''
+
+
+if LIBYAML:
+    class CSafeLoader(yaml.CSafeLoader):
+        '''
+        libyaml's safe loader, with everything registered to
+        `yaml.SafeLoader`. See `loader()`.
+        '''
+        pass
+
+    class CSafeDumper(yaml.CSafeDumper):
+        '''
+        libyaml's safe dumper, with everything registered to
+        `yaml.SafeDumper`. See `dumper()`.
+        '''
+        pass
+
+else:
+    CSafeLoader = None
+    CSafeDumper = None
+
+
+def _share(fast:       Type,
+           slow:       Type,
+           registries: Iterable[str]) -> Type:
+    '''
+    Point `fast`'s registries at `slow`'s.
+
+    Everything registers its tags with `yaml.SafeLoader` / `yaml.SafeDumper`,
+    but the C classes don't derive from those. So share the registries. Done
+    each time, since PyYAML replaces a class's registry with a copy on its
+    first registration.
+    '''
+    for registry in registries:
+        setattr(fast, registry, getattr(slow, registry))
+    return fast
+
+
+def use_libyaml(enabled: bool) -> bool:
+    '''
+    Use libyaml's C loader and dumper (if `enabled` and available), or
+    PyYAML's pure Python ones.
+
+    Returns True if libyaml will be used.
+    '''
+    global _use_libyaml
+    _use_libyaml = bool(enabled) and LIBYAML
+    return _use_libyaml
+
+
+def loader() -> Type[yaml.SafeLoader]:
+    '''
+    Returns the safe loader class to use: libyaml's if available and enabled,
+    else PyYAML's pure Python one.
+    '''
+    if _use_libyaml:
+        return _share(CSafeLoader, yaml.SafeLoader, _LOADER_REGISTRIES)
+    return yaml.SafeLoader
+
+
+def dumper() -> Type[yaml.SafeDumper]:
+    '''
+    Returns the safe dumper class to use: libyaml's if available and enabled,
+    else PyYAML's pure Python one.
+    '''
+    if _use_libyaml:
+        return _share(CSafeDumper, yaml.SafeDumper, _DUMPER_REGISTRIES)
+    return yaml.SafeDumper
+
+
 # -----------------------------------------------------------------------------
 # Dump/Load with some default args.
 # -----------------------------------------------------------------------------
@@ -415,28 +517,30 @@ def safe_dump(data:             Any,
               indent:           Optional[int] = None,
               width:            Optional[int] = None) -> None:
     '''
-    Call `yaml.safe_dump()` with these args and/or some defaults.
+    Safe dump (with libyaml if available) with these args and/or some
+    defaults.
 
     If `indent` is None, uses yaml default.
 
     If `width` is None, uses yaml default (which is sort of
     'no width restriction').
     '''
-    yaml.safe_dump(data,
-                   stream=stream,
-                   default_style=default_scalar.value,
-                   default_flow_style=default_sequence.value,
-                   indent=indent,
-                   width=width,
-                   # Just using yaml defaults right now [2021-03-03].
-                   encoding=None,  # utf-8 in Python 3
-                   explicit_start=None,
-                   explicit_end=None,
-                   version=None,
-                   tags=None,
-                   canonical=None,
-                   allow_unicode=None,
-                   line_break=None)
+    yaml.dump(data,
+              stream=stream,
+              Dumper=dumper(),
+              default_style=default_scalar.value,
+              default_flow_style=default_sequence.value,
+              indent=indent,
+              width=width,
+              # Just using yaml defaults right now [2021-03-03].
+              encoding=None,  # utf-8 in Python 3
+              explicit_start=None,
+              explicit_end=None,
+              version=None,
+              tags=None,
+              canonical=None,
+              allow_unicode=None,
+              line_break=None)
 
 
 def safe_dump_all(data:             Any,
@@ -446,45 +550,47 @@ def safe_dump_all(data:             Any,
                   indent:           Optional[int] = None,
                   width:            Optional[int] = None) -> None:
     '''
-    Call `yaml.safe_dump_all()` with these args and/or some defaults.
+    Safe dump all (with libyaml if available) with these args and/or some
+    defaults.
 
     If `indent` is None, uses yaml default.
 
     If `width` is None, uses yaml default (which is sort of
     'no width restriction').
     '''
-    yaml.safe_dump_all(data,
-                       stream=stream,
-                       default_style=default_scalar.value,
-                       default_flow_style=default_sequence.value,
-                       indent=indent,
-                       width=width,
-                       # Just using yaml defaults right now [2021-03-03].
-                       encoding=None,  # utf-8 in Python 3
-                       explicit_start=None,
-                       explicit_end=None,
-                       version=None,
-                       tags=None,
-                       canonical=None,
-                       allow_unicode=None,
-                       line_break=None)
+    yaml.dump_all(data,
+                  stream=stream,
+                  Dumper=dumper(),
+                  default_style=default_scalar.value,
+                  default_flow_style=default_sequence.value,
+                  indent=indent,
+                  width=width,
+                  # Just using yaml defaults right now [2021-03-03].
+                  encoding=None,  # utf-8 in Python 3
+                  explicit_start=None,
+                  explicit_end=None,
+                  version=None,
+                  tags=None,
+                  canonical=None,
+                  allow_unicode=None,
+                  line_break=None)
 
 
 def safe_load(stream: TextIO) -> Any:
     '''
-    Call `yaml.safe_load()` with the stream of data and returns the parsed
-    Python object.
+    Safe load (with libyaml if available) the stream of data and returns the
+    parsed Python object.
     '''
-    data = yaml.safe_load(stream)
+    data = yaml.load(stream, Loader=loader())
     return data
 
 
 def safe_load_all(stream: TextIO) -> Any:
     '''
-    Call `yaml.safe_load_all()` with the stream of data and returns the parsed
-    Python object.
+    Safe load all (with libyaml if available) the stream of data and returns
+    the parsed Python object.
     '''
-    data = yaml.safe_load_all(stream)
+    data = yaml.load_all(stream, Loader=loader())
     return data
 
 
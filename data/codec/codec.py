@@ -708,8 +708,8 @@ class Codec(LogMixin, NamesMixin,
                 reg_find_dotted,
                 reg_find_types,
                 error_squelch,
-                log.format_pretty(data, prefix='    '),
-                log.format_pretty(fallback, prefix='    '))
+                log.lazy_pretty(data, prefix='    '),
+                log.lazy_pretty(fallback, prefix='    '))
             decoded = self._decode_with_registry(data,
                                                  dotted=reg_find_dotted,
                                                  data_types=reg_find_types,
@@ -951,7 +951,7 @@ class Codec(LogMixin, NamesMixin,
                     "  fallback:\n"
                     "{}",
                     data,
-                    log.format_pretty(fallback, prefix='    '))
+                    log.lazy_pretty(fallback, prefix='    '))
                 return fallback
             # `None` is an acceptable enough value for us... Lots of things are
             # optional. Errors for unexpectedly None things should happen in
@@ -974,8 +974,8 @@ class Codec(LogMixin, NamesMixin,
             dotted,
             data_types,
             error_squelch,
-            log.format_pretty(data, prefix='    '),
-            log.format_pretty(fallback, prefix='    '))
+            log.lazy_pretty(data, prefix='    '),
+            log.lazy_pretty(fallback, prefix='    '))
 
         # When no ENCODABLE_REG_FIELD, we can't do anything since we don't
         # know how to decode. But only deal with fallback case here. If they
@@ -1109,8 +1109,8 @@ class Codec(LogMixin, NamesMixin,
                 "  expecting: {}\n"
                 "  mapping: {}",
                 expected,
-                log.format_pretty(mapping,
-                                  prefix='  '))
+                log.lazy_pretty(mapping,
+                                prefix='  '))
             return None
 
         self._log_data_processing(
@@ -1119,8 +1119,8 @@ class Codec(LogMixin, NamesMixin,
             "  expecting: {}\n"
             "{}",
             expected,
-            log.format_pretty(mapping,
-                              prefix='  '))
+            log.lazy_pretty(mapping,
+                            prefix='  '))
 
         # ---
         # Decode the Base Level
@@ -0,0 +1,318 @@
+# coding: utf-8
+
+'''
+Claim index for EncodableRegistry.
+
+Without a dotted name to go on, the registry has to find an Encodable that
+will `claim()` the data. Asking every registered Encodable (in registry
+order) for every string in a document adds up, so index them once instead:
+  - Simple (regex) claimers, bucketed by the first character their regex
+    requires.
+  - Complex claimers, by their `type_field()`.
+  - Everything, by the dotted name it encodes into the
+    `Encodable.ENCODABLE_REG_FIELD`.
+  - Strings already searched for, and what (if anything) claimed them.
+
+Candidates still have to `claim()` the data, in the same order the registry
+would have asked them, so the answers are the same - just without asking
+Encodables that can't possibly claim it.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import (Optional, Any, Type, Iterator, Mapping,
+                    Tuple, List, Set, Dict)
+
+
+import re
+
+
+from veredi.base.strings import label
+
+from .const              import EncodedEither, Encoding
+from .encodable          import Encodable
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+CLAIM_CACHE_MAX = 4096
+'''
+Max number of strings to remember claims (or non-claims) for. The cache is
+emptied when full.
+'''
+
+_RX_LITERAL_CHARS = '_:-'
+'''
+Non-alphanumeric chars we'll take as literals at the start of a regex.
+'''
+
+_RX_QUANTIFIERS = '*?{'
+'''
+Quantifiers that could make a regex's first char optional.
+'''
+
+_RX_UNBRACKETED = re.compile(r'\\.|\[(?:\\.|[^\]])*\]')
+'''
+Matches escapes and character sets in a regex, so we can strip them out to
+look for top-level alternations.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+def first_char(rx: Optional[re.Pattern]) -> Optional[str]:
+    '''
+    Returns the (lowercased) ASCII character that anything `rx` matches must
+    start with, if there obviously is one. E.g.:
+      r'^uid:(?P<value>\\d+)$' -> 'u'
+
+    Returns None if `rx` could match strings starting with anything else (or
+    we can't tell).
+    '''
+    if rx is None or not isinstance(rx.pattern, str):
+        return None
+    if rx.flags & re.VERBOSE:
+        return None
+
+    pattern = rx.pattern
+    # Alternation means more than one first char.
+    if '|' in _RX_UNBRACKETED.sub('', pattern):
+        return None
+
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    elif pattern.startswith('\\A'):
+        pattern = pattern[2:]
+
+    if not pattern:
+        return None
+    char = pattern[0]
+    if not (char.isascii()
+            and (char.isalnum() or char in _RX_LITERAL_CHARS)):
+        return None
+    if len(pattern) > 1 and pattern[1] in _RX_QUANTIFIERS:
+        return None
+
+    # Bucket case-insensitively; `claim()` sorts out the rest.
+    return char.lower()
+
+
+# -----------------------------------------------------------------------------
+# Code
+# -----------------------------------------------------------------------------
+
+class ClaimIndex:
+    '''
+    Index of an EncodableRegistry's registry dict for finding what will
+    `claim()` data.
+
+    Built once from the registry; make a new one whenever the registry
+    changes.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._order: List[Type[Encodable]] = []
+        '''
+        All registered Encodables, in the order the registry dict would be
+        searched.
+        '''
+
+        self._position: Dict[Type[Encodable], int] = {}
+        '''Encodable -> its (first) index in `_order`.'''
+
+        self._rx_all: List[Type[Encodable]] = []
+        '''Encodables that could claim strings, in order.'''
+
+        self._rx_any: List[Type[Encodable]] = []
+        '''
+        Encodables that could claim strings starting with any char, in order.
+        '''
+
+        self._rx_by_char: Dict[str, List[Type[Encodable]]] = {}
+        '''
+        First (lowercased ASCII) char -> Encodables that could claim strings
+        starting with it (including `_rx_any`), in order.
+        '''
+
+        self._by_field: Dict[str, List[Type[Encodable]]] = {}
+        '''
+        `type_field()` -> Encodables that could claim mappings with it, in
+        order.
+        '''
+
+        self._field_names: Set[str] = set()
+        '''All the different `TYPE_FIELD_NAME`s of `_by_field`'s Encodables.'''
+
+        self._by_dotted: Dict[str, Type[Encodable]] = {}
+        '''
+        Dotted name (registry keys and/or Encodable's `dotted`) -> Encodable.
+        '''
+
+        self._claims: Dict[str, Optional[Type[Encodable]]] = {}
+        '''String -> what claimed it, or None for nothing.'''
+
+        self.hits: int = 0
+        '''Number of strings answered from `_claims`.'''
+
+        self.misses: int = 0
+        '''Number of strings that had to be searched for.'''
+
+    def __init__(self, registry: Mapping[str, Any]) -> None:
+        self._define_vars()
+
+        rx_chars = {}
+        for keys, encodable in self._walk(registry, ()):
+            self._by_dotted.setdefault(label.normalize(*keys), encodable)
+            if encodable.dotted:
+                self._by_dotted.setdefault(encodable.dotted, encodable)
+            if encodable in self._position:
+                continue
+            self._position[encodable] = len(self._order)
+            self._order.append(encodable)
+
+            # Simple claimers.
+            try:
+                rx = encodable._get_decode_rx()
+                char = first_char(rx)
+            except Exception:
+                # Let `claim()` raise it, same as without an index.
+                rx = True
+                char = None
+            if rx:
+                self._rx_all.append(encodable)
+                rx_chars[encodable] = char
+                if char is None:
+                    self._rx_any.append(encodable)
+
+            # Complex claimers.
+            if encodable.encoding().has(Encoding.COMPLEX):
+                self._by_field.setdefault(encodable.type_field(),
+                                          []).append(encodable)
+                self._field_names.add(encodable.TYPE_FIELD_NAME)
+
+        for char in set(rx_chars.values()):
+            if char is None:
+                continue
+            self._rx_by_char[char] = [encodable
+                                      for encodable in self._rx_all
+                                      if rx_chars[encodable] in (char, None)]
+
+    def _walk(self,
+              place: Mapping[str, Any],
+              keys:  Tuple[str, ...]
+              ) -> Iterator[Tuple[Tuple[str, ...], Type[Encodable]]]:
+        '''
+        Yields (registry keys, Encodable) for each leaf of the registry,
+        depth-first in dict order (same as `EncodableRegistry._search()`).
+        '''
+        for key, node in place.items():
+            if isinstance(node, dict):
+                yield from self._walk(node, keys + (key, ))
+            elif isinstance(node, type) and issubclass(node, Encodable):
+                yield keys + (key, ), node
+
+    # -------------------------------------------------------------------------
+    # Claims
+    # -------------------------------------------------------------------------
+
+    def claimer(self, data: EncodedEither) -> Optional[Type[Encodable]]:
+        '''
+        Returns the first registered Encodable (in registry order) that
+        claims `data`, or None.
+        '''
+        if isinstance(data, str):
+            return self.simple(data)
+        if isinstance(data, Mapping):
+            return self.complex(data)
+        return self._first(self._order, data)
+
+    def simple(self, data: str) -> Optional[Type[Encodable]]:
+        '''
+        Returns the first registered Encodable that claims the string
+        `data`, or None.
+        '''
+        try:
+            claimer = self._claims[data]
+            self.hits += 1
+            return claimer
+        except KeyError:
+            self.misses += 1
+
+        char = data[:1]
+        if char.isascii():
+            candidates = self._rx_by_char.get(char.lower(), self._rx_any)
+        else:
+            # Non-ASCII can case-fold into ASCII (e.g. the Kelvin sign).
+            candidates = self._rx_all
+
+        claimer = self._first(candidates, data)
+        if len(self._claims) >= CLAIM_CACHE_MAX:
+            self._claims.clear()
+        self._claims[data] = claimer
+        return claimer
+
+    def complex(self, data: Mapping[str, Any]) -> Optional[Type[Encodable]]:
+        '''
+        Returns the registered Encodable that `data` was encoded with (via
+        its `Encodable.ENCODABLE_REG_FIELD`), or else the first that claims
+        the mapping `data`, or None.
+        '''
+        dotted = data.get(Encodable.ENCODABLE_REG_FIELD, None)
+        if isinstance(dotted, str):
+            encodable = self._by_dotted.get(dotted, None)
+            if encodable and encodable.encoding().has(Encoding.COMPLEX):
+                return encodable
+
+        candidates = set()
+        for key in data:
+            if isinstance(key, str):
+                candidates.update(self._by_field.get(key, ()))
+        for name in self._field_names:
+            field = data.get(name, None)
+            if isinstance(field, str):
+                candidates.update(self._by_field.get(field, ()))
+
+        return self._first(sorted(candidates, key=self._position.get), data)
+
+    def _first(self,
+               candidates: List[Type[Encodable]],
+               data:       EncodedEither) -> Optional[Type[Encodable]]:
+        '''
+        Returns the first of `candidates` to claim `data`, or None.
+        '''
+        for encodable in candidates:
+            claiming, _, _ = encodable.claim(data)
+            if claiming:
+                return encodable
+        return None
+
+    def __len__(self) -> int:
+        '''Number of registered Encodables.'''
+        return len(self._order)
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"encodables: {len(self._order)}, "
+                f"simple: {len(self._rx_all)}, "
+                f"type fields: {len(self._by_field)}, "
+                f"hits: {self.hits}, misses: {self.misses})")
+
+    def __repr__(self) -> str:
+        return '<v.codec.index:' + str(self) + '>'
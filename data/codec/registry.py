@@ -25,6 +25,7 @@ from veredi.base.exceptions import RegistryError
 
 from .const                 import EncodedComplex, EncodedSimple, EncodedEither
 from .encodable             import Encodable
+from .index                 import ClaimIndex
 
 
 # -----------------------------------------------------------------------------
@@ -67,10 +68,38 @@ class EncodableRegistry(CallRegistrar,
     Registry for all the encodable types.
     '''
 
+    _LAZY_REGISTRATION: bool = False
+    '''
+    Encodables are found by searching for who claims the data, not just by
+    dotted, so they all need to be registered up front.
+    '''
+
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
 
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        super()._define_vars()
+
+        self._store_claims: Optional[ClaimIndex] = None
+        '''
+        Index of our registry for finding claimers of data. Built on demand;
+        reset to None whenever the registry changes.
+        '''
+
+    @property
+    def _claims(self) -> ClaimIndex:
+        '''
+        Get the `self._store_claims`. (Re)build if it is None.
+        '''
+        if self._store_claims is None:
+            self._store_claims = ClaimIndex(self._registry)
+
+        return self._store_claims
+
     def _init_register(self,
                        encodable: Type[Encodable],
                        reg_args:  Iterable[str]) -> bool:
@@ -123,6 +152,7 @@ class EncodableRegistry(CallRegistrar,
 
         # Set as registered cls/func.
         reg_ours[leaf_key] = encodable
+        self._store_claims = None
 
         # Save to the background as a thing that has been registered at this
         # level.
@@ -145,8 +175,9 @@ class EncodableRegistry(CallRegistrar,
         if data is None:
             return None
 
-        self._log_debug(f"EncodableRegistry.simple: data: {type(data)}, "
-                        f"data_type: {data_type}")
+        self._log_debug("EncodableRegistry.simple: data: {}, "
+                        "data_type: {}",
+                        type(data), data_type)
 
         registree = None
 
@@ -194,8 +225,9 @@ class EncodableRegistry(CallRegistrar,
         if data is None:
             return None
 
-        self._log_debug(f"EncodableRegistry.get: data: {type(data)}, "
-                        f"dotted: {dotted}, data_type: {data_type}")
+        self._log_debug("EncodableRegistry.get: data: {}, "
+                        "dotted: {}, data_type: {}",
+                        type(data), dotted, data_type)
 
         registree = None
 
@@ -205,8 +237,9 @@ class EncodableRegistry(CallRegistrar,
         if isinstance(data, (str, *numbers.NumberTypesTuple)):
             self._log_debug("EncodableRegistry.get: Shouldn't be asking the "
                             "registry for registered class for simple data types. "
-                            f"data: {type(data)}, "
-                            f"dotted: {dotted}, data_type: {data_type}")
+                            "data: {}, "
+                            "dotted: {}, data_type: {}",
+                            type(data), dotted, data_type)
             return None
 
         # ---
@@ -236,10 +269,11 @@ class EncodableRegistry(CallRegistrar,
             if claiming:
                 return registree
             else:
-                self._log_debug(f"EncodableRegistry.get: Found registree for data, "
+                self._log_debug("EncodableRegistry.get: Found registree for data, "
                                 "but registree will not claim it. "
-                                f"registree: {registree}, data: {type(data)}, "
-                                f"dotted: {dotted}, data_type: {data_type}")
+                                "registree: {}, data: {}, "
+                                "dotted: {}, data_type: {}",
+                                registree, type(data), dotted, data_type)
 
         # ---
         # Not Found: Fallback if provided?
@@ -281,8 +315,9 @@ class EncodableRegistry(CallRegistrar,
         If `dotted` is provided, walks that keypath and
         returns whatever is registered to that.
 
-        Otherwise, recursively walk our registry dict to find something that
-        will claim() `data`.
+        Otherwise, find something that will claim() `data`: via our claim
+        index if `place` is `self._registry`, else by recursively walking
+        `place`.
 
         Returns registree or None.
         '''
@@ -315,6 +350,10 @@ class EncodableRegistry(CallRegistrar,
         # ---
         # Search for a claimer...
         # ---
+        # Whole registry? Use the index.
+        if place is self._store_registry:
+            return self._claims.claimer(data)
+
         for key in place:
             node = place[key]
             # If we got a sub-tree/branch, recurse into it.
@@ -348,3 +387,14 @@ class EncodableRegistry(CallRegistrar,
         # Nothing found.
         # ---
         return None
+
+    # -------------------------------------------------------------------------
+    # Unit Testing
+    # -------------------------------------------------------------------------
+
+    def _ut_unregister(self) -> None:
+        '''
+        Removes everything from registry, and our claim index.
+        '''
+        super()._ut_unregister()
+        self._store_claims = None
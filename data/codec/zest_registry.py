@@ -0,0 +1,171 @@
+# coding: utf-8
+
+'''
+Tests for registry.py (EncodableRegistry class) and its claim index.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Type, Tuple, Literal
+
+import re
+
+
+from veredi.zest.base.unit import ZestBase
+from veredi.logs           import log
+
+from .const                import Encoding
+from .encodable            import Encodable
+from .registry             import EncodableRegistry
+from .index                import ClaimIndex, first_char
+
+
+# -----------------------------------------------------------------------------
+# Mockups
+# -----------------------------------------------------------------------------
+
+class ZestSimple(Encodable,
+                 name_dotted='veredi.data.codec.zest_registry.simple',
+                 name_string='zest-simple'):
+    '''Claims 'zest-simple:<digits>' strings.'''
+
+    _RX = re.compile(r'^zest-simple:(?P<value>\d+)$', re.IGNORECASE)
+
+    @classmethod
+    def encoding(klass: Type['ZestSimple']) -> Encoding:
+        return Encoding.SIMPLE
+
+    @classmethod
+    def _get_decode_rx(klass: Type['ZestSimple']) -> Optional[re.Pattern]:
+        return klass._RX
+
+
+class ZestAnything(ZestSimple,
+                   name_dotted='veredi.data.codec.zest_registry.anything',
+                   name_string='zest-anything'):
+    '''Claims strings ending in '!'.'''
+
+    _RX = re.compile(r'.*!$')
+
+
+class ZestComplex(Encodable,
+                  name_dotted='veredi.data.codec.zest_registry.complex',
+                  name_string='zest-complex'):
+    '''Claims mappings with 'zest-complex' in them.'''
+    pass
+
+
+class ZestOther(Encodable,
+                name_dotted='veredi.data.codec.zest_registry.other',
+                name_string='zest-other'):
+    '''Claims mappings with 'zest-other' in them.'''
+    pass
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_EncodableRegistry(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.registry = EncodableRegistry(None)
+        with log.LoggingManager.on_or_off(self.debugging):
+            self.registry.register(ZestComplex, 'zest', 'b', 'complex')
+            self.registry.register(ZestSimple, 'zest', 'a', 'simple')
+            self.registry.register(ZestAnything, 'anything')
+            self.registry.register(ZestOther, 'zest', 'b', 'other')
+
+    def tear_down(self):
+        self.registry._ut_unregister()
+        self.registry = None
+
+    def search(self, data, indexed):
+        '''
+        Search the whole registry for a claimer of `data`, with or without
+        the index.
+        '''
+        place = (self.registry._registry
+                 if indexed else
+                 dict(self.registry._registry))
+        return self.registry._search(place, None, data, None)
+
+    def test_first_char(self):
+        self.assertEqual(first_char(re.compile(r'^uid:(?P<v>\d+)$')), 'u')
+        self.assertEqual(first_char(re.compile(r'Uid:\d+', re.I)), 'u')
+        self.assertEqual(first_char(re.compile(r'^jeff:[|\w]+$')), 'j')
+        self.assertIsNone(first_char(re.compile(r'^u?id:\d+$')))
+        self.assertIsNone(first_char(re.compile(r'^uid|jeff$')))
+        self.assertIsNone(first_char(re.compile(r'^(uid):\d+$')))
+        self.assertIsNone(first_char(re.compile(r'.*!$')))
+        self.assertIsNone(first_char(None))
+
+    def test_claims(self):
+        for data in ('zest-simple:42',
+                     'ZEST-SIMPLE:42',
+                     'zest-simple:jeff',
+                     'zest-simple:42!',
+                     'jeff!',
+                     'jeff',
+                     '',
+                     {'zest-complex': {'x': 1}},
+                     {'zest-other': {}, 'zest-complex': {}},
+                     {Encodable.TYPE_FIELD_NAME: 'zest-other'},
+                     {'jeff': 1}):
+            with self.subTest(data=data):
+                self.assertIs(self.search(data, True),
+                              self.search(data, False))
+
+        self.assertIs(self.registry.simple('Zest-Simple:1'), ZestSimple)
+        self.assertIs(self.registry.simple('zest-simple:1!'), ZestAnything)
+        self.assertIs(self.registry.simple('jeff!'), ZestAnything)
+        self.assertIsNone(self.registry.simple('jeff'))
+        self.assertIs(self.search({'zest-other': {}, 'zest-complex': {}},
+                                  True),
+                      ZestComplex)
+
+    def test_index(self):
+        claims = self.registry._claims
+        self.assertIsInstance(claims, ClaimIndex)
+        self.assertEqual(len(claims), 4)
+
+        # Bucketed: only things that could claim 'z...' get asked.
+        self.assertEqual(claims._rx_by_char['z'], [ZestSimple, ZestAnything])
+        self.assertEqual(claims._rx_any, [ZestAnything])
+
+        # Cached, including what nothing claims.
+        self.assertIsNone(self.registry.simple('jeff'))
+        self.assertIsNone(self.registry.simple('jeff'))
+        self.assertIn('jeff', claims._claims)
+        self.assertEqual(claims.hits, 1)
+
+        # Encoded with registry field -> direct lookup.
+        self.assertIs(claims.complex({
+            Encodable.ENCODABLE_REG_FIELD: ZestOther.dotted,
+            Encodable.ENCODABLE_PAYLOAD_FIELD: {},
+        }), ZestOther)
+
+        # Registering drops the index.
+        self.registry.register(ZestOther, 'zest', 'c', 'other')
+        self.assertIsNot(self.registry._claims, claims)
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.data.codec.zest_registry
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
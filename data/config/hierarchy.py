@@ -190,9 +190,19 @@ class ConfigHierarchy(Hierarchy):
                 'type': Info.LEAF,
                 'directory': Info.LEAF,
                 'sanitize': Info.LEAF,
+                'cache': {
+                    'entries': Info.LEAF,
+                    'bytes': Info.LEAF,
+                },
+                'journal': {
+                    'enabled': Info.LEAF,
+                    'seconds': Info.LEAF,
+                    'sync': Info.LEAF,
+                },
             },
             'serdes': Info.LEAF,
             'codec': Info.LEAF,
+            'workers': Info.LEAF,
         },
 
         # Actually a list of stuff, but this doesn't support that...
@@ -221,6 +231,19 @@ class ConfigHierarchy(Hierarchy):
                     'autophagy': Info.LEAF,
                     'apoptosis': Info.LEAF,
                 },
+                'pace': {
+                    'ticks-per-second': Info.LEAF,
+                    'max-behind': Info.LEAF,
+                },
+            },
+            'events': {
+                'publish': {
+                    'batched': Info.LEAF,
+                },
+                'budget': {
+                    'count': Info.LEAF,
+                    'seconds': Info.LEAF,
+                },
             },
         },
 
@@ -232,6 +255,12 @@ class ConfigHierarchy(Hierarchy):
                 'hostname': Info.LEAF,
                 'port': Info.LEAF,
                 'ssl': Info.LEAF,
+                'ipc': {
+                    'batched': Info.LEAF,
+                    'compress': Info.LEAF,
+                    'transport': Info.LEAF,
+                    'shm-size': Info.LEAF,
+                },
             },
 
             'input': {
@@ -248,6 +277,16 @@ class ConfigHierarchy(Hierarchy):
             },
         },
 
+        'logging': {
+            'format': Info.LEAF,
+            'client': {
+                'batched': Info.LEAF,
+                'compress': Info.LEAF,
+                'buffer': Info.LEAF,
+                'seconds': Info.LEAF,
+            },
+        },
+
         'client': {
             'mediator': {
                 'type': Info.LEAF,
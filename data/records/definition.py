@@ -10,9 +10,13 @@ Record can have multiple documents, like 'metadata' and 'definition.system'.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import List
+from typing import (Optional, Any, NamedTuple,
+                    Mapping, Iterable, List, Tuple, Dict)
 from veredi.base.null import Null, Nullable
 
+from collections import OrderedDict
+from types       import MappingProxyType
+
 
 from veredi.logs           import log
 from veredi.base.strings   import label
@@ -25,6 +29,19 @@ from ..serdes.adapter.dict import DataDict
 # Constants
 # -----------------------------------------------------------------------------
 
+class Canon(NamedTuple):
+    '''
+    A canonicalized name: its dotted string and its path of names.
+
+    E.g. for 'str.mod': Canon('strength.modifier', ('strength', 'modifier'))
+    '''
+    dotted: Optional[str]
+    path:   Tuple[str, ...]
+
+
+_CANON_NOT_OURS = Canon(None, ())
+'''Cached result for names that don't belong to the definition at all.'''
+
 
 # -----------------------------------------------------------------------------
 # Mappings
@@ -40,6 +57,42 @@ class Definition(Record):
 
     ALIAS = 'alias'
 
+    CANON_CACHE_SIZE = 1024
+    '''
+    Max number of canonicalized names to keep in the LRU cache (for names not
+    in the lookup table, e.g. 'this.score' in milieu 'strength.modifier').
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        super()._define_vars()
+
+        self._key_prime: str = None
+        '''
+        The key the system cares about most. E.g. 'skill' for SkillSystem.
+        '''
+
+        self._canon_table: Mapping[str, Canon] = MappingProxyType({})
+        '''
+        Every name and alias of a name (e.g. 'str.mod', 'strength.mod',
+        'strength.modifier'...) under the primary key -> its canonical name.
+        Built by `configure()`; definitions don't change once loaded.
+        '''
+
+        self._canon_cache: OrderedDict[Tuple[str, Optional[str]], Canon] = (
+            OrderedDict()
+        )
+        '''
+        LRU cache of (name, milieu) -> canonical name, for names not in the
+        lookup table.
+        '''
+
     # -------------------------------------------------------------------------
     # System's Set-Up
     # -------------------------------------------------------------------------
@@ -52,6 +105,63 @@ class Definition(Record):
         E.g. 'skill' for SkillSystem.
         '''
         self._key_prime = primary_key
+        self._canon_table = MappingProxyType(self._canon_build())
+        self._canon_cache.clear()
+
+    def _canon_build(self) -> Dict[str, Canon]:
+        '''
+        Build the lookup table of names (with all their alias variations) to
+        canonical names, by walking our definitions under the primary key.
+
+        Only plain string keys are walked; anything else (e.g. KeyGroups) is
+        left to `_canon_make()`.
+        '''
+        alias = self.get(self.ALIAS) or {}
+        aliases_of: Dict[str, List[str]] = {}
+        for name, standard in alias.items():
+            if isinstance(name, str) and isinstance(standard, str):
+                aliases_of.setdefault(standard, []).append(name)
+
+        default = self.get('default', 'key')
+
+        table = {}
+
+        def build(bookmark: Mapping[Any, Any],
+                  canon:    Tuple[str, ...],
+                  inputs:   Iterable[Tuple[str, ...]]) -> None:
+            for key, value in bookmark.items():
+                if not isinstance(key, str):
+                    continue
+
+                # What can be typed in to mean `key`: itself (unless that's an
+                # alias for something else) and its aliases.
+                names = aliases_of.get(key, [])
+                if key not in alias:
+                    names = [key] + names
+                key_canon = canon + (key, )
+                key_inputs = [each + (name, )
+                              for each in inputs
+                              for name in names]
+
+                # Same as `_canon_make()`: if not at a leaf, add the default.
+                path = key_canon
+                if not isinstance(value, (str, int, float)):
+                    if not default:
+                        path = None
+                    else:
+                        path = key_canon + (default, )
+                if path:
+                    entry = Canon(label.normalize(*path), path)
+                    for each in key_inputs:
+                        table.setdefault(label.normalize(*each), entry)
+
+                if isinstance(value, Mapping):
+                    build(value, key_canon, key_inputs)
+
+        prime = self.get(self._key_prime)
+        if isinstance(prime, Mapping):
+            build(prime, (), [()])
+        return table
 
     # -------------------------------------------------------------------------
     # Helpers
@@ -243,11 +353,71 @@ class Definition(Record):
             See AbilitySystem for how it deals with things so that its 'mod'
             alias doesn't get registered as an ability command.
         '''
+        canon = self._canon(string, milieu,
+                            no_error_log=no_error_log,
+                            raise_error=raise_error)
+        return canon.dotted or Null()
+
+    def canonical_path(self,
+                       string: str,
+                       milieu: str,
+                       no_error_log: bool = False,
+                       raise_error: bool = True) -> Tuple[str, ...]:
+        '''
+        Same as `canonical()`, but returns the canonical name's path instead
+        of its dotted string:
+          'str.mod' -> ('strength', 'modifier')
+
+        Returns an empty tuple if `string` isn't ours.
+        '''
+        return self._canon(string, milieu,
+                           no_error_log=no_error_log,
+                           raise_error=raise_error).path
+
+    def _canon(self,
+               string: str,
+               milieu: str,
+               no_error_log: bool = False,
+               raise_error: bool = True) -> Canon:
+        '''
+        Canonicalize from the lookup table, then the LRU cache, and finally by
+        walking the definitions with `_canon_make()`.
+        '''
+        # 'this' needs the milieu; anything else is in the table if it's ours.
+        if not milieu or 'this' not in string:
+            canon = self._canon_table.get(string, None)
+            if canon is not None:
+                return canon
+
+        key = (string, milieu)
+        canon = self._canon_cache.get(key, None)
+        if canon is not None:
+            self._canon_cache.move_to_end(key)
+            return canon
+
+        canon = self._canon_walk(string, milieu, no_error_log, raise_error)
+        if canon is not None:
+            self._canon_cache[key] = canon
+            if len(self._canon_cache) > self.CANON_CACHE_SIZE:
+                self._canon_cache.popitem(last=False)
+        return canon or _CANON_NOT_OURS
+
+    def _canon_walk(self,
+                    string: str,
+                    milieu: str,
+                    no_error_log: bool,
+                    raise_error: bool) -> Optional[Canon]:
+        '''
+        Canonicalize by walking the definitions.
+
+        Returns `_CANON_NOT_OURS` if `string` isn't ours, or None if it
+        failed some other way (so don't cache it).
+        '''
         names, check_this = label.this(string, milieu)
 
         # Is the first part even a thing?
         if not names or not names[0]:
-            return Null()
+            return _CANON_NOT_OURS
 
         check = names[0]
         if not isinstance(check, str):
@@ -257,8 +427,11 @@ class Definition(Record):
 
         # Is the first part even our's?
         if not self.exists(check):
-            return Null()
+            return _CANON_NOT_OURS
         # else, it's a valid name/alias.
-        return self._canon_make(names,
-                                no_error_log=no_error_log,
-                                raise_error=raise_error)
+        dotted = self._canon_make(names,
+                                  no_error_log=no_error_log,
+                                  raise_error=raise_error)
+        if not dotted:
+            return None
+        return Canon(dotted, tuple(label.regularize(dotted)))
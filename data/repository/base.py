@@ -10,7 +10,7 @@ various backend implementations (db, file, etc).
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Union, Any, Type, Dict, List, Tuple)
+                    Optional, Union, Any, Type, Callable, Dict, List, Tuple)
 if TYPE_CHECKING:
     from veredi.data.config.context import ConfigContext
 
@@ -183,6 +183,19 @@ class BaseRepository(ABC, LogMixin, NamesMixin):
         raise NotImplementedError(f"{self.klass}.load() "
                                   "is not implemented.")
 
+    def load_deserialized(self,
+                          context:     'BaseDataContext',
+                          deserialize: Callable[['TextIOBase'], Any]) -> Any:
+        '''
+        Loads data from the repository based on data in the `context`, and
+        returns `deserialize(loaded_stream)`.
+
+        Repositories that can tell when their data hasn't changed can cache
+        the deserialized result instead of loading and deserializing again.
+        '''
+        # Default: No caching; load and deserialize every time.
+        return deserialize(self.load(context))
+
     @abstractmethod
     def save(self,
              data:    'TextIOBase',
@@ -195,6 +208,17 @@ class BaseRepository(ABC, LogMixin, NamesMixin):
         raise NotImplementedError(f"{self.klass}.load() "
                                   "is not implemented.")
 
+    def flush(self, force: bool = False) -> int:
+        '''
+        Finish any saves the repository has put off (e.g. write-behind
+        saves). Called every tick; repositories should only do work if it's
+        due, or if `force` is True (e.g. shutting down).
+
+        Returns number of saves finished.
+        '''
+        # Default: all saves are done immediately; nothing to flush.
+        return 0
+
     # -------------------------------------------------------------------------
     # Load and/or Save Methods
     # -------------------------------------------------------------------------
@@ -0,0 +1,307 @@
+# coding: utf-8
+
+'''
+Directory listing index and loaded documents cache for file repositories.
+
+Loads search for their file with a glob (e.g. 'skill_guy.*'), and the same
+files tend to be loaded over and over (e.g. the same monster for every
+spawned entity). So remember what's in each directory and what each file
+deserialized to, and only go back to the disk (and the serdes) when a
+directory or file's stat says it changed.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Any, List, Tuple, Dict
+
+
+import os
+import copy
+import fnmatch
+import threading
+from collections import OrderedDict
+
+
+from veredi.base import paths
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+CACHE_ENTRIES_DEFAULT = 256
+'''Default max number of files in a DocumentCache.'''
+
+CACHE_BYTES_DEFAULT = 16 * 1024 * 1024
+'''Default max total size (in bytes, on disk) of a DocumentCache's files.'''
+
+
+# -----------------------------------------------------------------------------
+# Directory Index
+# -----------------------------------------------------------------------------
+
+class DirectoryIndex:
+    '''
+    Directory -> names of its entries, refreshed whenever the directory's
+    modification time changes.
+
+    Costs one `stat` per `glob()` instead of listing and matching the whole
+    directory.
+
+    Thread-safe, so loads can run in worker threads.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._dirs: Dict[paths.Path, Tuple[int, Tuple[str, ...]]] = {}
+        '''Directory -> (mtime (ns) when listed, entry names).'''
+
+        self.hits: int = 0
+        '''Number of `glob()` calls answered without listing the directory.'''
+
+        self.misses: int = 0
+        '''Number of `glob()` calls that had to (re)list the directory.'''
+
+        self._lock: threading.Lock = threading.Lock()
+        '''Guards `_dirs` and the counters.'''
+
+    def __init__(self) -> None:
+        self._define_vars()
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def _names(self, directory: paths.Path) -> Tuple[str, ...]:
+        '''
+        Returns the names of `directory`'s entries, listing it if it's new or
+        changed since last time.
+
+        Returns empty tuple if the directory doesn't exist.
+        '''
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            self.forget(directory)
+            return ()
+
+        with self._lock:
+            entry = self._dirs.get(directory, None)
+            if entry is not None and entry[0] == mtime:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        try:
+            names = tuple(sorted(os.listdir(directory)))
+        except (FileNotFoundError, NotADirectoryError):
+            self.forget(directory)
+            return ()
+        with self._lock:
+            self._dirs[directory] = (mtime, names)
+        return names
+
+    def glob(self,
+             directory: paths.Path,
+             pattern:   str) -> List[paths.Path]:
+        '''
+        Returns paths of `directory`'s entries whose names match the glob
+        `pattern` (case-sensitive, same as `paths.Path.glob()` on a single
+        directory level).
+        '''
+        return [directory / name
+                for name in self._names(directory)
+                if fnmatch.fnmatchcase(name, pattern)]
+
+    def forget(self, directory: Optional[paths.Path] = None) -> None:
+        '''
+        Forget `directory`'s listing, or all listings if `directory` is None.
+
+        Modification times can be coarse, so call this after adding or
+        removing files.
+        '''
+        with self._lock:
+            if directory is None:
+                self._dirs.clear()
+            else:
+                self._dirs.pop(directory, None)
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"dirs: {len(self._dirs)}, "
+                f"hits: {self.hits}, misses: {self.misses})")
+
+    def __repr__(self) -> str:
+        return '<v.repo.index:' + str(self) + '>'
+
+
+# -----------------------------------------------------------------------------
+# Loaded Documents Cache
+# -----------------------------------------------------------------------------
+
+class DocumentCache:
+    '''
+    Bounded LRU cache of files' deserialized documents, keyed by (path, mtime,
+    size) so anything changed on disk is re-read and deserialized again.
+
+    Stores and hands out deep copies, so no one can change the cached
+    documents out from under anyone else.
+
+    Thread-safe, so loads can run in worker threads.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._files: 'OrderedDict[paths.Path, Tuple[int, int, Any]]' = (
+            OrderedDict())
+        '''
+        Path -> (mtime (ns), size (bytes), deserialized documents). Least
+        recently used first.
+        '''
+
+        self._bytes: int = 0
+        '''Total size (in bytes, on disk) of the cached files.'''
+
+        self._max_entries: int = CACHE_ENTRIES_DEFAULT
+        '''Max number of files to cache. Zero disables the cache.'''
+
+        self._max_bytes: int = CACHE_BYTES_DEFAULT
+        '''Max total size (in bytes, on disk) of the cached files.'''
+
+        self.hits: int = 0
+        '''Number of `get()` calls answered from the cache.'''
+
+        self.misses: int = 0
+        '''Number of `get()` calls that weren't.'''
+
+        self._lock: threading.Lock = threading.Lock()
+        '''Guards `_files`, `_bytes`, and the counters.'''
+
+    def __init__(self,
+                 max_entries: int = CACHE_ENTRIES_DEFAULT,
+                 max_bytes:   int = CACHE_BYTES_DEFAULT) -> None:
+        self._define_vars()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        '''True if this cache will cache anything.'''
+        return self._max_entries > 0 and self._max_bytes > 0
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def get(self,
+            path: paths.Path,
+            stat: os.stat_result) -> Optional[Any]:
+        '''
+        Returns a copy of `path`'s cached documents if it hasn't changed since
+        they were cached (according to `stat`), else None.
+        '''
+        with self._lock:
+            entry = self._files.get(path, None)
+            if (entry is None
+                    or entry[0] != stat.st_mtime_ns
+                    or entry[1] != stat.st_size):
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._files.move_to_end(path)
+            documents = entry[2]
+        return copy.deepcopy(documents)
+
+    def put(self,
+            path:      paths.Path,
+            stat:      os.stat_result,
+            documents: Any) -> bool:
+        '''
+        Cache a copy of `path`'s deserialized `documents`. `stat` must be from
+        /before/ reading the file, so a file changed mid-read is just re-read
+        next time.
+
+        Returns True if cached; False if disabled or too big to cache.
+        '''
+        self.forget(path)
+        size = stat.st_size
+        if not self.enabled or size > self._max_bytes:
+            return False
+
+        documents = copy.deepcopy(documents)
+        with self._lock:
+            self._forget(path)
+            self._files[path] = (stat.st_mtime_ns, size, documents)
+            self._bytes += size
+
+            # Evict least recently used until we're back under our limits.
+            while (len(self._files) > self._max_entries
+                   or self._bytes > self._max_bytes):
+                _, evicted = self._files.popitem(last=False)
+                self._bytes -= evicted[1]
+        return True
+
+    def forget(self, path: Optional[paths.Path] = None) -> None:
+        '''
+        Drop `path` from the cache, or everything if `path` is None.
+        '''
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._bytes = 0
+                return
+            self._forget(path)
+
+    def _forget(self, path: paths.Path) -> None:
+        '''
+        Drop `path` from the cache. Caller must hold `_lock`.
+        '''
+        entry = self._files.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    @property
+    def size(self) -> int:
+        '''Total size (in bytes, on disk) of the cached files.'''
+        return self._bytes
+
+    def __contains__(self, path: paths.Path) -> bool:
+        return path in self._files
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"files: {len(self._files)}/{self._max_entries}, "
+                f"bytes: {self._bytes}/{self._max_bytes}, "
+                f"hits: {self.hits}, misses: {self.misses})")
+
+    def __repr__(self) -> str:
+        return '<v.repo.cache:' + str(self) + '>'
@@ -0,0 +1,303 @@
+# coding: utf-8
+
+'''
+Write-behind save journal for file repositories.
+
+Saves are appended to one journal file instead of each rewriting its own
+file, and then compacted into their actual files every so often (and at
+shutdown). If we crash before compacting, the journal is replayed the next
+time it's opened.
+
+Journal file format is a series of records, each:
+  - A JSON header line: {"path": <target path>, "size": <bytes>}
+  - `size` bytes of UTF-8 file contents.
+  - A newline.
+
+A record cut off by a crash mid-append is ignored when replaying.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, BinaryIO, Dict, Set
+
+
+import os
+import json
+import time
+import threading
+
+
+from veredi.base import paths
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+JOURNAL_NAME = '.save-journal'
+'''File name of a repository root's save journal.'''
+
+JOURNAL_SECONDS_DEFAULT = 5.0
+'''Default seconds to let saves sit in the journal before compacting.'''
+
+
+# -----------------------------------------------------------------------------
+# Code
+# -----------------------------------------------------------------------------
+
+class SaveJournal:
+    '''
+    Append-only journal of pending saves for files under one directory (e.g.
+    a repository's root).
+
+    Thread-safe.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._path: paths.Path = None
+        '''The journal file.'''
+
+        self._sync: bool = False
+        '''
+        If True, fsync after every append. Otherwise appends are only flushed
+        to the OS, and compaction fsyncs.
+        '''
+
+        self._stream: Optional[BinaryIO] = None
+        '''Open journal file, for appending. Opened on first append.'''
+
+        self._pending: Dict[paths.Path, str] = {}
+        '''Target file -> latest contents saved for it, not yet compacted.'''
+
+        self._oldest: Optional[float] = None
+        '''`time.monotonic()` of the oldest pending save.'''
+
+        self._lock: threading.RLock = threading.RLock()
+        '''Guards everything.'''
+
+    def __init__(self,
+                 path: paths.Path,
+                 sync: bool = False) -> None:
+        self._define_vars()
+        self._path = path
+        self._sync = sync
+
+    @property
+    def path(self) -> paths.Path:
+        '''The journal file.'''
+        return self._path
+
+    # -------------------------------------------------------------------------
+    # Saving
+    # -------------------------------------------------------------------------
+
+    def append(self, target: paths.Path, contents: str) -> None:
+        '''
+        Journal saving `contents` to the file `target`.
+        '''
+        data = contents.encode('utf-8')
+        header = json.dumps({
+            'path': self._relative(target),
+            'size': len(data),
+        })
+        with self._lock:
+            if self._stream is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._stream = self._path.open('ab')
+            self._stream.write(header.encode('utf-8') + b'\n' + data + b'\n')
+            self._stream.flush()
+            if self._sync:
+                os.fsync(self._stream.fileno())
+
+            self._pending[target] = contents
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def pending(self, target: paths.Path) -> Optional[str]:
+        '''
+        Returns contents journaled for `target` but not yet compacted, or
+        None.
+        '''
+        with self._lock:
+            return self._pending.get(target, None)
+
+    def pending_in(self, directory: paths.Path) -> bool:
+        '''
+        Returns True if any not yet compacted save is in `directory`.
+        '''
+        with self._lock:
+            return any(target.parent == directory
+                       for target in self._pending)
+
+    def due(self, seconds: float) -> bool:
+        '''
+        Returns True if the oldest pending save is at least `seconds` old.
+        '''
+        with self._lock:
+            return (self._oldest is not None
+                    and time.monotonic() - self._oldest >= seconds)
+
+    def __contains__(self, target: paths.Path) -> bool:
+        with self._lock:
+            return target in self._pending
+
+    def __len__(self) -> int:
+        '''Number of files with pending saves.'''
+        with self._lock:
+            return len(self._pending)
+
+    # -------------------------------------------------------------------------
+    # Compacting
+    # -------------------------------------------------------------------------
+
+    def compact(self) -> int:
+        '''
+        Write all pending saves to their files, then empty the journal.
+
+        Returns number of files written.
+        '''
+        with self._lock:
+            directories = set()
+            for target, contents in self._pending.items():
+                directories.update(self._write(target, contents))
+            written = len(self._pending)
+
+            # Renames aren't durable until their directories are synced; do
+            # that before the journal is gone.
+            for directory in directories:
+                self._sync_dir(directory)
+
+            # Everything's safely in its file; journal no longer needed.
+            self._close()
+            if self._path.exists():
+                self._path.unlink()
+            self._pending.clear()
+            self._oldest = None
+            return written
+
+    def recover(self) -> int:
+        '''
+        Replay a journal left behind (e.g. by a crash) into the pending saves
+        and compact it.
+
+        Returns number of records replayed.
+        '''
+        with self._lock:
+            if not self._path.exists():
+                return 0
+
+            replayed = 0
+            with self._path.open('rb') as stream:
+                while True:
+                    header = stream.readline()
+                    if not header.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(header)
+                        size = int(record['size'])
+                        target = self._absolute(record['path'])
+                    except (ValueError, KeyError, TypeError):
+                        break
+                    data = stream.read(size + 1)
+                    if len(data) != size + 1 or not data.endswith(b'\n'):
+                        # Torn write at the end.
+                        break
+                    self._pending[target] = data[:-1].decode('utf-8')
+                    replayed += 1
+
+            self.compact()
+            return replayed
+
+    def close(self) -> None:
+        '''
+        Close the journal file. Pending saves stay in it until the next
+        `recover()`.
+        '''
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        '''
+        Close the journal file. Caller must hold `_lock`.
+        '''
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write(self, target: paths.Path, contents: str) -> Set[paths.Path]:
+        '''
+        Write `contents` to `target` atomically: write a temp file, sync it,
+        and then rename it over `target`.
+
+        Returns the directories changed (target's, and the parents of any
+        directories created for it), which need syncing for the write to
+        survive a power loss.
+        '''
+        directories = {target.parent}
+        created = target.parent
+        while not created.exists():
+            directories.add(created.parent)
+            created = created.parent
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        temp = target.with_name(target.name + '.tmp')
+        with temp.open('w') as stream:
+            stream.write(contents)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temp, target)
+        return directories
+
+    def _sync_dir(self, directory: paths.Path) -> None:
+        '''
+        fsync `directory`, so renames and new entries in it are durable.
+        '''
+        if os.name == 'nt':
+            # Windows can't open directories to sync them.
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # -------------------------------------------------------------------------
+    # Paths
+    # -------------------------------------------------------------------------
+
+    def _relative(self, target: paths.Path) -> str:
+        '''
+        Target path as stored in the journal: relative to the journal's
+        directory if it's under it.
+        '''
+        try:
+            return str(target.relative_to(self._path.parent))
+        except ValueError:
+            return str(target)
+
+    def _absolute(self, stored: str) -> paths.Path:
+        '''
+        Target path from the journal.
+        '''
+        return self._path.parent / stored
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"{paths.to_str(self._path)}, "
+                f"pending: {len(self._pending)})")
+
+    def __repr__(self) -> str:
+        return '<v.repo.journal:' + str(self) + '>'
@@ -9,17 +9,20 @@ various backend implementations (db, file, etc).
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional, List
+from typing import Optional, Any, Callable, List, Dict
 
 
+import os
 import shutil
 import re
+import threading
 from io import StringIO, TextIOBase
 
 
 from veredi.logs                 import log
 
 from veredi.base                 import paths
+from veredi.base.null            import null_or_none
 from veredi.base.strings         import label
 from veredi.data                 import background
 from veredi.data.context         import (DataAction,
@@ -31,6 +34,13 @@ from veredi.data.config.context  import ConfigContext
 
 from ...exceptions               import LoadError, SaveError
 from .base                       import FileRepository
+from .index                      import (DirectoryIndex,
+                                         DocumentCache,
+                                         CACHE_ENTRIES_DEFAULT,
+                                         CACHE_BYTES_DEFAULT)
+from .journal                    import (SaveJournal,
+                                         JOURNAL_NAME,
+                                         JOURNAL_SECONDS_DEFAULT)
 from ..taxon                     import Rank
 
 
@@ -59,10 +69,69 @@ class FileTreeRepository(FileRepository,
 
     _TEMP_PATH = 'zest-temp'
 
+    # ---
+    # Config
+    # ---
+    _CACHE_KEYCHAIN = ['repository', 'cache']
+    _JOURNAL_KEYCHAIN = ['repository', 'journal']
+
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
 
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        super()._define_vars()
+
+        self._index: DirectoryIndex = DirectoryIndex()
+        '''
+        Directory listings, so loads don't have to glob the disk each time.
+        '''
+
+        self._cache: DocumentCache = DocumentCache()
+        '''
+        Loaded files' deserialized documents, so loading the same file again
+        (e.g. the same monster for each spawned entity) doesn't have to read
+        or deserialize it again. See `load_deserialized()`.
+
+        Set via config: 'data.repository.cache.entries' (max number of files;
+        0 disables) and 'data.repository.cache.bytes' (max total size).
+        '''
+
+        self._journaled: bool = False
+        '''
+        If True, saves are appended to a write-behind SaveJournal and written
+        to their files later by `flush()`.
+
+        Set via config: 'data.repository.journal.enabled'.
+        '''
+
+        self._journal_seconds: float = JOURNAL_SECONDS_DEFAULT
+        '''
+        Seconds to let saves sit in the journal before `flush()` writes them
+        to their files.
+
+        Set via config: 'data.repository.journal.seconds'.
+        '''
+
+        self._journal_sync: bool = False
+        '''
+        If True, fsync the journal after each save.
+
+        Set via config: 'data.repository.journal.sync'.
+        '''
+
+        self._journals: Dict[paths.Path, SaveJournal] = {}
+        '''Root directory (root or temp root) -> its SaveJournal.'''
+
+        self._journals_lock: threading.Lock = threading.Lock()
+        '''
+        Guards `_journals` - loads can come from DataWorkers threads while the
+        game thread opens journals.
+        '''
+
     def __init__(self,
                  config_context: Optional[ConfigContext] = None) -> None:
         super().__init__(config_context)
@@ -82,11 +151,34 @@ class FileTreeRepository(FileRepository,
 
         super()._configure(context, require_config=True)
 
-        # No FileTreeRepository config to do at present.
-
-        # config = background.config.config(self.klass,
-        #                                   self.dotted,
-        #                                   context)
+        config = background.config.config(self.klass,
+                                          self.dotted,
+                                          context)
+        entries = config.get_data(*self._CACHE_KEYCHAIN, 'entries')
+        size = config.get_data(*self._CACHE_KEYCHAIN, 'bytes')
+        self._cache = DocumentCache(
+            max_entries=(CACHE_ENTRIES_DEFAULT
+                         if null_or_none(entries) else
+                         int(entries)),
+            max_bytes=(CACHE_BYTES_DEFAULT
+                       if null_or_none(size) else
+                       int(size)))
+        self._log_group_multi(self._LOG_INIT,
+                              self.dotted,
+                              "Load cache: {}",
+                              self._cache,
+                              log_minimum=log.Level.DEBUG)
+
+        self._journaled = bool(
+            config.get_data(*self._JOURNAL_KEYCHAIN, 'enabled'))
+        seconds = config.get_data(*self._JOURNAL_KEYCHAIN, 'seconds')
+        if not null_or_none(seconds):
+            self._journal_seconds = float(seconds)
+        self._journal_sync = bool(
+            config.get_data(*self._JOURNAL_KEYCHAIN, 'sync'))
+        if self._journaled:
+            # Replay anything left over from a crash before loading anything.
+            self._journal(self.root())
 
         self._log_start_up(self.dotted,
                            "Done with configuration.")
@@ -192,6 +284,46 @@ class FileTreeRepository(FileRepository,
         Looks for a match to `load_path` by splitting into parent dir and
         glob/file name. If only one match, loads that file.
         '''
+        return self._read(self._find(load_path, context), context)
+
+    def load_deserialized(self,
+                          context:     DataLoadContext,
+                          deserialize: Callable[[TextIOBase], Any]) -> Any:
+        '''
+        Loads the file for `context` and returns `deserialize(loaded_stream)`.
+
+        The result is cached, so loading the same file again (e.g. the same
+        monster for each spawned entity) doesn't read or deserialize it again
+        until it changes on disk. Returns a copy of the cached result.
+        '''
+        self._log_data_processing(self.dotted,
+                                  "Load...",
+                                  context=context)
+        load_path = self._find(self._key(context), context)
+
+        # Stat before reading - if it changes mid-read, next load re-reads.
+        stat = os.stat(load_path)
+        deserialized = self._cache.get(load_path, stat)
+        if deserialized is not None:
+            self._log_data_processing(self.dotted,
+                                      "Loaded file '{}' from cache!",
+                                      paths.to_str(load_path),
+                                      context=context,
+                                      success=True)
+            return deserialized
+
+        deserialized = deserialize(self._read(load_path, context))
+        self._cache.put(load_path, stat, deserialized)
+        return deserialized
+
+    def _find(self,
+              load_path: paths.PathType,
+              context:   DataLoadContext) -> paths.Path:
+        '''
+        Looks for a match to `load_path` by splitting into parent dir and
+        glob/file name. Returns the match if there is only one; raises an
+        error otherwise.
+        '''
         self._log_data_processing(self.dotted,
                                   "Loading requested path '{}'...",
                                   paths.to_str(load_path),
@@ -203,14 +335,18 @@ class FileTreeRepository(FileRepository,
         # Use load_path to find all file matchs...
         directory = load_path.parent
         glob = load_path.name
-        matches = []
-        for match in directory.glob(glob):
-            matches.append(match)
+        # Saves still in a journal? Write them out first so we find them.
+        for journal in self._journals_list():
+            if journal.pending_in(directory):
+                self._compact(journal)
+        matches = self._index.glob(directory, glob)
 
         match_word = "match" if len(matches) == 1 else "matches"
         self._log_data_processing(self.dotted,
-                                  f"Found {len(matches)} {match_word} files for "
-                                  f"loading '{load_path.name}': {matches}",
+                                  "Found {} {} files for "
+                                  "loading '{}': {}",
+                                  len(matches), match_word,
+                                  load_path.name, matches,
                                   context=context)
 
         # ------------------------------
@@ -250,15 +386,20 @@ class FileTreeRepository(FileRepository,
         # Set-Up...
         # ------------------------------
         self._log_data_processing(self.dotted,
-                                  f"Loading '{matches[0]}' file for "
-                                  f"load path '{load_path}'...",
+                                  "Loading '{}' file for "
+                                  "load path '{}'...",
+                                  matches[0], load_path,
                                   context=context)
         load_path = matches[0]
         super()._load(load_path, context)
+        return load_path
 
-        # ------------------------------
-        # Load!
-        # ------------------------------
+    def _read(self,
+              load_path: paths.Path,
+              context:   DataLoadContext) -> TextIOBase:
+        '''
+        Reads the file at `load_path`.
+        '''
         data_stream = None
         with load_path.open('r') as file_stream:
             self._log_data_processing(self.dotted,
@@ -333,6 +474,13 @@ class FileTreeRepository(FileRepository,
 
         super()._save(save_path, data, context)
 
+        # File is about to change; don't trust anything we know about it.
+        self._cache.forget(save_path)
+        self._index.forget(save_path.parent)
+
+        if self._journaled:
+            return self._save_journal(save_path, data, context)
+
         success = False
         with save_path.open('w') as file_stream:
             self._log_data_processing(self.dotted,
@@ -381,3 +529,114 @@ class FileTreeRepository(FileRepository,
                                   context=context,
                                   success=True)
         return success
+
+    def _save_journal(self,
+                      save_path: paths.PathType,
+                      data:      TextIOBase,
+                      context:   DataSaveContext) -> bool:
+        '''
+        Append `data` to the save journal for `save_path`. It gets written to
+        `save_path` on a later `flush()`.
+        '''
+        root = self.root(True)
+        if root not in save_path.parents:
+            root = self.root()
+        journal = self._journal(root)
+
+        try:
+            data.seek(0)
+            journal.append(save_path, data.read())
+
+        except Exception as error:
+            self._log_data_processing(self.dotted,
+                                      "Got an exception trying to "
+                                      "journal file: {}",
+                                      paths.to_str(save_path),
+                                      context=context,
+                                      success=False)
+            raise self._log_exception(
+                self._error_type(context),
+                "Error saving data to journal. context: {}",
+                context=context) from error
+
+        self._log_data_processing(self.dotted,
+                                  "Journaled file '{}'!",
+                                  paths.to_str(save_path),
+                                  context=context,
+                                  success=True)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Save Journal
+    # -------------------------------------------------------------------------
+
+    def _journal(self, root: paths.Path) -> SaveJournal:
+        '''
+        Get (or open, and recover if needed) the save journal for `root`.
+        '''
+        with self._journals_lock:
+            journal = self._journals.get(root, None)
+            if journal is not None:
+                return journal
+
+            journal = SaveJournal(root / JOURNAL_NAME,
+                                  sync=self._journal_sync)
+            replayed = journal.recover()
+            self._journals[root] = journal
+
+        if replayed:
+            self._index.forget()
+            self._log_warning("Replayed {} saves from left-over "
+                              "journal: {}",
+                              replayed, journal)
+        return journal
+
+    def _journals_list(self) -> List[SaveJournal]:
+        '''
+        Snapshot of our open save journals, safe to loop over while other
+        threads open more.
+        '''
+        with self._journals_lock:
+            return list(self._journals.values())
+
+    def _compact(self, journal: SaveJournal) -> int:
+        '''
+        Write `journal`'s saves to their files.
+
+        Returns number of files written.
+        '''
+        written = journal.compact()
+        if written:
+            # Listings may have changed faster than directory mtimes show.
+            self._index.forget()
+            self._log_data_processing(self.dotted,
+                                      "Compacted {} saves from journal: {}",
+                                      written, journal)
+        return written
+
+    def flush(self, force: bool = False) -> int:
+        '''
+        Write journaled saves to their files if they've waited long enough
+        (config 'data.repository.journal.seconds'), or if `force`.
+
+        Returns number of files written.
+        '''
+        written = 0
+        for journal in self._journals_list():
+            if force or journal.due(self._journal_seconds):
+                written += self._compact(journal)
+        return written
+
+    # -------------------------------------------------------------------------
+    # Unit Testing Helpers
+    # -------------------------------------------------------------------------
+
+    def _ut_tear_down(self, note: str = None) -> None:
+        '''
+        Drop the temp dir's journal (unwritten), then delete the temp dir.
+        '''
+        with self._journals_lock:
+            journal = self._journals.pop(self.root(True), None)
+        if journal is not None:
+            journal.close()
+        super()._ut_tear_down(note=note)
@@ -35,6 +35,8 @@ from veredi.data.context          import (DataAction,
                                           DataSaveContext)
 
 from .tree                        import FileTreeRepository
+from .index                       import DirectoryIndex, DocumentCache
+from .journal                     import SaveJournal
 from ..taxon                      import Taxon, SavedTaxon
 from veredi.rules.d20.pf2.game    import PF2Rank, PF2SavedTaxon
 
@@ -871,6 +873,146 @@ class Test_FileTreeRepo(ZestBase):
         # we loaded.
         self._helper_file_contents(path, min_len, loaded_data)
 
+    def test_load_cached(self) -> None:
+        deserialized = []
+
+        def deserialize(stream):
+            deserialized.append(stream)
+            return [{'text': stream.read(None)}]
+
+        context = self.context_load(self.TaxonCtx.MONSTER)
+        first = self.repo.load_deserialized(context, deserialize)
+        path = paths.cast(context.repo_data['paths'][0])
+        self.assertIn(path, self.repo._cache)
+        self.assertEqual(self.repo._cache.misses, 1)
+        self.assertGreater(len(first[0]['text']), 1024)
+
+        # Same monster again: no listing the directory, reading the file, or
+        # deserializing it.
+        index_misses = self.repo._index.misses
+        for _ in range(5):
+            context = self.context_load(self.TaxonCtx.MONSTER)
+            loaded = self.repo.load_deserialized(context, deserialize)
+            self.assertEqual(loaded, first)
+            # Everyone gets their own copy.
+            self.assertIsNot(loaded[0], first[0])
+            loaded[0]['text'] = 'changed'
+        self.assertEqual(len(deserialized), 1)
+        self.assertEqual(self.repo._cache.hits, 5)
+        self.assertEqual(self.repo._index.misses, index_misses)
+
+        # Regular loads still read the file.
+        context = self.context_load(self.TaxonCtx.MONSTER)
+        self.assertEqual(
+            self._helper_data_stream(self.repo.load(context), 1024),
+            first[0]['text'])
+
+    def test_content_cache(self) -> None:
+        self._set_up_repo()
+        cache = DocumentCache(max_entries=2, max_bytes=10)
+        files = []
+        for name, text in (('a', '1234'), ('b', '5678'), ('c', '90')):
+            path = self.root_temp / name
+            path.write_text(text)
+            files.append((path, path.stat(), text))
+
+        # LRU eviction by byte limit...
+        for path, stat, text in files:
+            self.assertTrue(cache.put(path, stat, text))
+        self.assertNotIn(files[0][0], cache)
+        self.assertEqual(cache.size, 6)
+        self.assertEqual(cache.get(files[1][0], files[1][1]), '5678')
+
+        # ...and by entry limit.
+        path = self.root_temp / 'd'
+        path.write_text('!')
+        cache.put(path, path.stat(), '!')
+        self.assertEqual(len(cache), 2)
+        self.assertIn(files[1][0], cache)
+        self.assertNotIn(files[2][0], cache)
+
+        # Too big to cache.
+        path = self.root_temp / 'big'
+        path.write_text('x' * 11)
+        self.assertFalse(cache.put(path, path.stat(), 'x' * 11))
+
+        # Changed on disk: miss.
+        path, stat, _ = files[1]
+        path.write_text('567890')
+        self.assertIsNone(cache.get(path, path.stat()))
+
+        # Index notices new files.
+        index = DirectoryIndex()
+        self.assertEqual(len(index.glob(self.root_temp, 'e.*')), 0)
+        (self.root_temp / 'e.yaml').write_text('e')
+        index.forget(self.root_temp)
+        self.assertEqual(index.glob(self.root_temp, 'e.*'),
+                         [self.root_temp / 'e.yaml'])
+
+        self._tear_down_repo()
+
+    def test_save_journal(self) -> None:
+        self._set_up_repo()
+        self.repo._journaled = True
+        self.repo._journal_seconds = 60
+
+        loaded = self.repo.load(self.context_load(self.TaxonCtx.MONSTER))
+        loaded_data = self._helper_data_stream(loaded, 1024)
+
+        context = self.context_save(self.TaxonCtx.MONSTER, True)
+        self.assertTrue(self.repo.save(loaded, context))
+        path = paths.cast(context.repo_data['paths'][0])
+
+        # Journaled, not written yet.
+        journal = self.repo._journals[self.root_temp]
+        self.assertIn(path, journal)
+        self.assertTrue(journal.path.exists())
+        self.assertFalse(path.exists())
+        self.assertEqual(self.repo.flush(), 0)
+
+        # Forced (e.g. shutting down): written.
+        self.assertEqual(self.repo.flush(force=True), 1)
+        self.assertFalse(journal)
+        self.assertFalse(journal.path.exists())
+        self._helper_file_contents(path, 1024, loaded_data)
+
+        # Crash before compacting: replayed next time, minus the torn write.
+        crashed = SaveJournal(self.root_temp / 'crash.journal')
+        crashed.append(path, 'first')
+        crashed.append(path, 'second')
+        crashed.close()
+        with crashed.path.open('ab') as stream:
+            stream.write(b'{"path": "torn", "size": 100}\nnot 100 bytes')
+
+        recovered = SaveJournal(crashed.path)
+        self.assertEqual(recovered.recover(), 2)
+        self.assertEqual(path.read_text(), 'second')
+        self.assertFalse(recovered.path.exists())
+        self.assertFalse((self.root_temp / 'torn').exists())
+
+        # Compacting syncs the directories it wrote into (and made) before
+        # dropping the journal.
+        synced = []
+        journal = SaveJournal(self.root_temp / 'sync.journal')
+        sync_dir = journal._sync_dir
+
+        def record_sync(directory):
+            synced.append((directory, journal.path.exists()))
+            sync_dir(directory)
+
+        journal._sync_dir = record_sync
+        journal.append(path, 'third')
+        journal.append(self.root_temp / 'new' / 'dir' / 'file', 'fourth')
+        self.assertEqual(journal.compact(), 2)
+        self.assertEqual(sorted(synced),
+                         sorted([(path.parent, True),
+                                 (self.root_temp, True),
+                                 (self.root_temp / 'new', True),
+                                 (self.root_temp / 'new' / 'dir', True)]))
+        self.assertFalse(journal.path.exists())
+
+        self._tear_down_repo()
+
     def test_save_player(self) -> None:
         self.do_save_test(self.TaxonCtx.PLAYER)
 
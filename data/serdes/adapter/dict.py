@@ -198,11 +198,12 @@ class DataDictIterator(abc.Iterable):
     def __init__(self, mapping, grouping):
         self._map_iter = iter(mapping)
         self._group_iter = None
-        self._group = grouping
+        # KeyGroups are in a set; need them indexable.
+        self._group = list(grouping)
         self._group_index = 0
-        self._group_len = len(grouping)
+        self._group_len = len(self._group)
         if self._group_len > 0:
-            self._group_iter = iter(grouping[0])
+            self._group_iter = iter(self._group[0])
 
     # ---
     # abc.Iterator
@@ -17,6 +17,7 @@ from veredi.zest.base.unit   import ZestBase
 from veredi.zest.zpath       import TestType
 
 from veredi.base             import paths
+from veredi.base             import yaml
 from veredi.base.context     import UnitTestContext
 from veredi.data             import background
 from veredi.data.codec       import Codec
@@ -131,6 +132,7 @@ class Test_YamlSerdes(ZestBase):
         self.path_comp = zpath.serdes() / 'only.component.yaml'
 
     def tear_down(self):
+        yaml.use_libyaml(yaml.LIBYAML)
         self.serdes = None
         self.codec = None
         self.path_all = None
@@ -468,6 +470,25 @@ class Test_YamlSerdes(ZestBase):
                               dict,
                               self.path_all)
 
+    def test_deserialize_libyaml(self):
+        # Custom tags et al should load the same with or without libyaml.
+        with log.LoggingManager.on_or_off(self.debugging):
+            loaded = []
+            for enabled in (False, True):
+                yaml.use_libyaml(enabled)
+                with self.path_all.open('r') as file_stream:
+                    loaded.append(self.serdes.deserialize_all(
+                        file_stream,
+                        self.codec,
+                        self.make_context('test_deserialize_libyaml',
+                                          self.path_all)))
+
+        self.assertEqual(loaded[0], loaded[1])
+        self._component_check('test_deserialize_libyaml',
+                              loaded[1][1],
+                              dict,
+                              self.path_all)
+
     # ------------------------------
     # Write Tests
     # ------------------------------
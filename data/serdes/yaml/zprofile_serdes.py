@@ -0,0 +1,236 @@
+# coding: utf-8
+
+'''
+Profile/benchmark YamlSerdes deserializing & serializing: libyaml's C
+loader/dumper vs PyYAML's pure Python ones, on our file-tree repositories'
+campaign data.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Any, Callable, Tuple, List, Literal
+
+import time
+from io import StringIO
+
+from veredi.zest.base.unit  import ZestBase
+from veredi.zest.zpath      import TestType
+from veredi.zest            import zpath
+
+from veredi.logs            import log
+from veredi.base            import paths
+from veredi.base.context    import UnitTestContext
+from veredi.data.codec      import Codec
+from veredi.data.exceptions import WriteError
+
+
+# ------------------------------
+# What we're testing:
+# ------------------------------
+from veredi.base import yaml
+from .serdes     import YamlSerdes
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+ROUNDS = 20
+'''How many times to load/dump all the files per timing.'''
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class ZestYamlSpeed(ZestBase):
+    '''
+    Time loading and dumping all of the test file-tree repositories' YAML, with
+    and without libyaml.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Set-Up
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Defines any instance variables with type hinting, docstrs.
+        Happens ASAP during unittest.setUp().
+        '''
+        # ------------------------------
+        # Parent!
+        # ------------------------------
+        super()._define_vars()
+
+        self.texts: List[Tuple[paths.Path, str]] = []
+        '''(path, contents) of all the YAML files we're timing.'''
+
+        self.serdes: YamlSerdes = None
+        '''The serdes we're timing.'''
+
+        self.codec: Codec = None
+        '''Codec for the serdes to decode/encode with.'''
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self) -> None:
+        '''
+        Read in all the files up front so we're only timing YAML.
+        '''
+        self.serdes = YamlSerdes()
+        self.codec = Codec()
+        for test_type in (TestType.UNIT,
+                          TestType.INTEGRATION,
+                          TestType.FUNCTIONAL):
+            root = zpath.repository_file_tree(test_type)
+            if not root or not root.exists():
+                continue
+            for path in sorted(root.rglob('*.yaml')):
+                self.texts.append((path, path.read_text()))
+
+    # -------------------------------------------------------------------------
+    # Tear-Down
+    # -------------------------------------------------------------------------
+
+    def tear_down(self) -> None:
+        '''
+        Do any of our own clean-up.
+        '''
+        yaml.use_libyaml(yaml.LIBYAML)
+        self.texts = []
+        self.serdes = None
+        self.codec = None
+
+    # -------------------------------------------------------------------------
+    # Test Helpers
+    # -------------------------------------------------------------------------
+
+    def make_context(self, path: paths.Path) -> UnitTestContext:
+        '''
+        Make a context for (de)serializing `path`.
+        '''
+        return UnitTestContext(self,
+                               'zprofile_serdes',
+                               data={
+                                   'file': path,
+                               })
+
+    def load(self) -> List[List[Any]]:
+        '''
+        Deserialize all documents of all files.
+        '''
+        return [self.serdes.deserialize_all(StringIO(text),
+                                            self.codec,
+                                            self.make_context(path))
+                for path, text in self.texts]
+
+    def dumpable(self) -> List[Tuple[paths.Path, List[Any]]]:
+        '''
+        Deserialize all files, and return (path, documents) for the ones that
+        can be serialized back out.
+        '''
+        files = []
+        with log.LoggingManager.on_or_off(self.debugging):
+            for (path, _), docs in zip(self.texts, self.load()):
+                try:
+                    self.serdes.serialize_all(docs,
+                                              self.codec,
+                                              self.make_context(path))
+                except WriteError:
+                    continue
+                files.append((path, docs))
+        return files
+
+    def dump(self, files: List[Tuple[paths.Path, List[Any]]]) -> List[str]:
+        '''
+        Serialize all files' documents.
+        '''
+        return [self.serdes.serialize_all(docs,
+                                          self.codec,
+                                          self.make_context(path)).getvalue()
+                for path, docs in files]
+
+    def timed(self,
+              libyaml: bool,
+              func:    Callable,
+              *args:   Any) -> Tuple[float, Any]:
+        '''
+        Run `func(*args)` ROUNDS times with or without libyaml.
+
+        Returns (seconds per round, last result).
+        '''
+        yaml.use_libyaml(libyaml)
+        result = None
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            result = func(*args)
+        return ((time.perf_counter() - start) / ROUNDS, result)
+
+    def report(self,
+               what:   str,
+               files:  int,
+               python: float,
+               c:      Optional[float]) -> None:
+        '''
+        Log (and print, if debugging) the timings.
+        '''
+        if c is None:
+            msg = (f"{what}: {files} files: "
+                   f"python: {python * 1000:.2f} ms, libyaml: n/a")
+        else:
+            msg = (f"{what}: {files} files: "
+                   f"python: {python * 1000:.2f} ms, "
+                   f"libyaml: {c * 1000:.2f} ms "
+                   f"({python / c:.1f}x)")
+        log.debug(msg)
+        if self.debugging:
+            print(msg)
+
+    # -------------------------------------------------------------------------
+    # Tests
+    # -------------------------------------------------------------------------
+
+    def test_load(self) -> None:
+        self.assertTrue(self.texts)
+        python, python_docs = self.timed(False, self.load)
+        c = None
+        if yaml.LIBYAML:
+            c, c_docs = self.timed(True, self.load)
+            self.assertEqual(python_docs, c_docs)
+        self.report('load', len(self.texts), python, c)
+
+    def test_dump(self) -> None:
+        yaml.use_libyaml(False)
+        files = self.dumpable()
+        self.assertTrue(files)
+
+        python, python_dumped = self.timed(False, self.dump, files)
+        c = None
+        if yaml.LIBYAML:
+            c, c_dumped = self.timed(True, self.dump, files)
+            self.assertEqual(python_dumped, c_dumped)
+        self.report('dump', len(files), python, c)
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi run data/serdes/yaml/zprofile_serdes.py
+
+if __name__ == '__main__':
+    import unittest
+    import cProfile
+    cProfile.run('unittest.main()',
+                 # filename='whatever'
+                 sort='time')
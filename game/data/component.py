@@ -10,7 +10,8 @@ Data component - a component that has persistent data on it.
 
 from typing import (TYPE_CHECKING,
                     Optional, Union, Any,
-                    Collection, Container, MutableMapping)
+                    Collection, Container, Mapping, MutableMapping,
+                    Set, Tuple, Dict)
 from veredi.base.null import Null, Nullable
 if TYPE_CHECKING:
     from veredi.base.context         import VerediContext
@@ -31,6 +32,9 @@ from veredi.base.strings             import label
 # Constants
 # -----------------------------------------------------------------------------
 
+_NOT_FLAT = object()
+'''Miss marker for the flattened query index; values can be None.'''
+
 
 # -----------------------------------------------------------------------------
 # Code
@@ -43,6 +47,14 @@ class DataComponent(Component,
     Component with persistent data.
     '''
 
+    QUERY_FLAT: bool = True
+    '''
+    If True, `query()` uses a flattened index of our persistent data: path
+    tuple -> value, built at load and kept up to date by `set()` and
+    `changed()`. Sub-classes can turn it off if they change their data some
+    other way.
+    '''
+
     def _define_vars(self) -> None:
         '''
         Set up our vars with type hinting, docstrs.
@@ -61,6 +73,33 @@ class DataComponent(Component,
         persistent data saved.
         '''
 
+        self._revision: int = 0
+        '''
+        Bumped every time our persistent data changes. Lets others (e.g.
+        MathSystem's resolution cache) cheaply check if anything changed.
+        '''
+
+        self._revision_reset: int = 0
+        '''
+        Revision when our persistent data was last replaced wholesale
+        (e.g. loaded).
+        '''
+
+        self._changes: Dict[str, int] = {}
+        '''
+        Dotted path -> revision when that path was last changed.
+        '''
+
+        self._flat: Optional[Dict[Tuple[str, ...], Any]] = None
+        '''
+        Flattened index of our persistent data, if `QUERY_FLAT`. Each node in
+        the data is under both the tuple of its keys and a 1-tuple of its
+        dotted path, so either form of `query()` args is one lookup:
+          ('strength', 'score') -> 10
+          ('strength.score', )  -> 10
+          ('strength', )        -> {'score': 10, ...}
+        '''
+
     def __init__(self,
                  context: Optional['VerediContext'],
                  cid: ComponentId,
@@ -155,12 +194,104 @@ class DataComponent(Component,
     def persistent(self):
         return self._persistent
 
+    @property
+    def revision(self) -> int:
+        '''
+        Revision of our persistent data. Changes whenever the data does.
+        '''
+        return self._revision
+
+    def changes_since(self, revision: int) -> Optional[Set[str]]:
+        '''
+        Returns the set of dotted paths changed after `revision`.
+
+        Returns None if all the data was replaced after `revision` - that is,
+        assume everything changed.
+        '''
+        if self._revision_reset > revision:
+            return None
+        return {path
+                for path, changed in self._changes.items()
+                if changed > revision}
+
+    def changed(self, *dot_path: label.LabelInput) -> None:
+        '''
+        Mark `dot_path` (same input as `query()`) as changed. Call after
+        modifying `persistent` data directly.
+
+        Also flags us as dirty (wanting a save).
+        '''
+        self._revision += 1
+        self._dirty = True
+        self._changes[label.normalize(*dot_path)] = self._revision
+        self._flatten()
+
+    def set(self, value: Any, *dot_path: label.LabelInput) -> None:
+        '''
+        Set `dot_path` (same input as `query()`) in our persistent data to
+        `value`, and mark it as changed.
+
+        E.g. for an ability component:
+          set(12, 'strength.score')
+          set(12, 'strength', 'score')
+        '''
+        path = label.regularize(*dot_path)
+        data = self.persistent
+        for each in path[:-1]:
+            data = data[each]
+        existing = data.get(path[-1], None)
+        data[path[-1]] = value
+
+        # Only need to re-flatten if it's not a simple update of an existing
+        # leaf.
+        path = tuple(path)
+        if (self._flat is None
+                or path not in self._flat
+                or isinstance(value, Mapping)
+                or isinstance(existing, Mapping)):
+            self.changed(*path)
+            return
+
+        self._revision += 1
+        self._dirty = True
+        self._changes[label.normalize(*path)] = self._revision
+        self._flat[path] = value
+        self._flat[(label.normalize(*path), )] = value
+
     def _from_data(self, data: MutableMapping[str, Any]):
         '''
         Do any data processing needed for readying this component for use based
         on new data.
         '''
         self._persistent = DataDict(data)
+        self._revision += 1
+        self._revision_reset = self._revision
+        self._changes.clear()
+        self._flatten()
+
+    def _flatten(self) -> None:
+        '''
+        (Re)build our flattened query index, if we use one.
+        '''
+        if not self.QUERY_FLAT or self._persistent is None:
+            self._flat = None
+            return
+
+        flat = {}
+
+        def flatten(data: Mapping[Any, Any], path: Tuple[str, ...]) -> None:
+            for key, value in data.items():
+                # Leave KeyGroups and such to the full query.
+                if not isinstance(key, str):
+                    continue
+                key_path = path + (key, )
+                flat[key_path] = value
+                flat[(label.normalize(*key_path), )] = value
+                if isinstance(value, Mapping):
+                    flatten(value, key_path)
+
+        flatten(self._persistent, ())
+        self._flat = flat
 
     def _to_data(self):
         '''
@@ -203,6 +334,16 @@ class DataComponent(Component,
         | 'strength', 'score'    |                 10 |
         |------------------------+--------------------|
         '''
+        # Indexed?
+        if self._flat is not None:
+            try:
+                data = self._flat.get(dot_path, _NOT_FLAT)
+            except TypeError:
+                # Unhashable (e.g. list) input; do it the long way.
+                data = _NOT_FLAT
+            if data is not _NOT_FLAT:
+                return data
+
         # Get our input sorted out.
         dot_path = label.regularize(*dot_path)
 
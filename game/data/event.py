@@ -17,7 +17,7 @@ from veredi.data.context import (DataLoadContext,
                                  DataSaveContext)
 from ..ecs.base.identity import (MonotonicId,
                                  ComponentId)
-from ..ecs.event import Event
+from ..ecs.event import Event, EventPriority
 
 
 # -----------------------------------------------------------------------------
@@ -72,7 +72,7 @@ from ..ecs.event import Event
 
 
 class DataEvent(Event):
-    ...
+    PRIORITY = EventPriority.DATA
 
     # def create_args(self) -> Iterable:
     #     return ()
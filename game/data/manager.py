@@ -19,8 +19,13 @@ to go for accessing Game Config/Save (as opposed to Entity/Component) data.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional, Any, Set, Type, Mapping, Dict, List
-from veredi.base.null import Nullable, NullNoneOr
+from typing import (Optional, Any, Hashable,
+                    Set, Type, Mapping, Dict, List)
+from veredi.base.null import Nullable, NullNoneOr, null_or_none
+
+
+import copy
+from io import TextIOBase
 
 
 # ---
@@ -99,6 +104,7 @@ from .event import (
 )
 
 from .component import DataComponent
+from .workers   import DataWorkers, WORKERS_DEFAULT
 
 
 # -----------------------------------------------------------------------------
@@ -159,6 +165,15 @@ class DataManager(EcsManagerWithEvents,
         Our Codec for encoding/decoding data.
         '''
 
+        self._workers: DataWorkers = DataWorkers()
+        '''
+        Worker threads for loading data off of the game thread. Loads are
+        done inline if it has no workers.
+
+        Set via config: 'data.workers' (max loads running at once; 0 to load
+        inline).
+        '''
+
         # ------------------------------
         # Special Data
         # ------------------------------
@@ -318,6 +333,16 @@ class DataManager(EcsManagerWithEvents,
             context = config.make_config_context()
             raise background.config.exception(context, msg)
 
+        workers = config.get('data', 'workers')
+        self._workers = DataWorkers(WORKERS_DEFAULT
+                                    if null_or_none(workers) else
+                                    int(workers))
+        self._log_group_multi(self._LOG_INIT,
+                              self.dotted,
+                              "DataManager load workers: {}",
+                              self._workers,
+                              log_minimum=log.Level.DEBUG)
+
         # ---
         # Load Data
         # ---
@@ -540,13 +565,25 @@ class DataManager(EcsManagerWithEvents,
     def _load(self, context: DataLoadContext) -> Nullable[DeserializeTypes]:
         '''
         Use the context to load something from the repo and deserialize it via
-        the serdes.
+        the serdes. The repository can cache the deserialized result, so
+        loading the same thing again needn't be deserialized again.
 
         Returns the deserialized result or Null.
         '''
-        loaded = self._repository.load(context)
-        decoded = self._serdes.deserialize_all(loaded, self._codec, context)
-        return decoded
+        def deserialize(loaded: TextIOBase) -> DeserializeTypes:
+            return self._serdes.deserialize_all(loaded, self._codec, context)
+
+        return self._repository.load_deserialized(context, deserialize)
+
+    def _load_key(self, context: DataLoadContext) -> Optional[Hashable]:
+        '''
+        Returns a key for coalescing identical loads (same taxon), or None if
+        the load shouldn't be coalesced with anything.
+        '''
+        taxon = context.taxon
+        if taxon is None:
+            return None
+        return repr(taxon)
 
     def _init_load(self) -> None:
         '''
@@ -937,37 +974,51 @@ class DataManager(EcsManagerWithEvents,
 
         context = event.context
 
-        self._log_data_processing(self.dotted,
-                                  "DataManager[DataLoadRequest] loading...")
-
-        # Ask my repository for this data.
-        # Load data info is in the request context.
-        loaded = self._repository.load(context)
-        # Get back loaded data stream.
+        # Have workers? Load off-thread; result is delivered in a later tick.
+        if self._workers.enabled:
+            coalesced = self._workers.submit(self._load_key(context),
+                                             event,
+                                             self._load,
+                                             context)
+            self._log_data_processing(
+                self.dotted,
+                "DataManager[DataLoadRequest] {} load for worker "
+                "threads: {}",
+                "coalesced" if coalesced else "queued",
+                self._workers,
+                context=context)
+            return
 
         self._log_data_processing(self.dotted,
-                                  "DataManager[DataLoadRequest] creating "
-                                  "result _LoadedEvent...")
-
-        # Take our repository load result and set into _LoadedEvent. Then
-        # have EventManager fire off event for whoever wants the next step.
-        event = _LoadedEvent(event.id, event.type, context,
-                             data=loaded)
+                                  "DataManager[DataLoadRequest] loading...")
 
-        # Special Shenanigans: Publish this event, wait for it to come back.
+        # Special Shenanigans: Publish the loaded data stream as a
+        # _LoadedEvent, wait for it to come back.
         if self._ut_all_events_external:
+            # Ask my repository for this data.
+            # Load data info is in the request context.
+            loaded = self._repository.load(context)
+
             self._log_data_processing(
                 self.dotted,
                 "DataManager[DataLoadRequest] publishing "
                 "result _LoadedEvent...")
+            event = _LoadedEvent(event.id, event.type, context,
+                                 data=loaded)
             self._event_notify(event, False)
+            return
 
-        # Normal Case: Pass on to process loaded data
-        else:
-            self._log_data_processing(self.dotted,
-                                      "DataManager[DataLoadRequest] handling "
-                                      "result _LoadedEvent internally...")
-            self._event_loaded(event)
+        # Normal Case: Load and deserialize (possibly from the repository's
+        # cache), then pass on to process deserialized data.
+        deserialized = self._load(context)
+        self._log_data_processing(self.dotted,
+                                  "DataManager[DataLoadRequest] handling "
+                                  "result _DeserializedEvent internally...")
+        event = _DeserializedEvent(event.id,
+                                   event.type,
+                                   context,
+                                   data=deserialized)
+        self._event_deserialized(event)
 
         self._log_data_processing(self.dotted,
                                   "DataManager[DataLoadRequest] done.",
@@ -1220,6 +1271,63 @@ class DataManager(EcsManagerWithEvents,
         else:
             self._event_deserialized(event)
 
+    # -------------------------------------------------------------------------
+    # Worker Threads
+    # -------------------------------------------------------------------------
+
+    def _update_workers(self) -> int:
+        '''
+        Deliver any finished worker thread loads as _DeserializedEvents.
+
+        Returns number of load requests delivered.
+        '''
+        delivered = 0
+        for job, requests in self._workers.done():
+            for index, request in enumerate(requests):
+                context = request.context
+                try:
+                    deserialized = job.result()
+                except Exception as error:
+                    self._log_exception(
+                        error,
+                        "DataManager worker thread failed to load data "
+                        "for request: {}",
+                        request,
+                        context=context)
+                    continue
+
+                # Coalesced requests each get their own copy; they'll each be
+                # made into their own component.
+                if index > 0:
+                    deserialized = copy.deepcopy(deserialized)
+
+                event = _DeserializedEvent(request.id,
+                                           request.type,
+                                           context,
+                                           data=deserialized)
+
+                # Special Shenanigans: Publish this event.
+                if self._ut_all_events_external:
+                    self._event_notify(event, False)
+                    delivered += 1
+                    continue
+
+                # Normal Case: Pass on to process deserialized data.
+                try:
+                    self._event_deserialized(event)
+                except VerediError as error:
+                    # Don't let one bad load stop the tick or the others.
+                    self._log_exception(
+                        error,
+                        "DataManager failed to create loaded data for "
+                        "request: {}",
+                        request,
+                        context=context)
+                    continue
+                delivered += 1
+
+        return delivered
+
     # -------------------------------------------------------------------------
     # Game Update Loop/Tick Functions
     # -------------------------------------------------------------------------
@@ -1243,6 +1351,10 @@ class DataManager(EcsManagerWithEvents,
         if not self._health_ok_tick(tick):
             return self.health
 
+        # Finished loads from worker threads?
+        if self._workers:
+            self._update_workers()
+
         # ------------------------------
         # Tick Types
         # ------------------------------
@@ -1308,15 +1420,15 @@ class DataManager(EcsManagerWithEvents,
         # Full Tick Rate: Start
         # ------------------------------
 
-        # TODO [2020-12-01]: Make a 'max requests per tick'. Use as the max for
-        # both this and events combined?
-        #  - But needs to be ignored during start-up/shut-down ticks, probably.
-        #  - And we need to not starve out update stuff because there were too
-        #    many events or vice versa...
+        # 'Max requests per tick': Requests come in as DataEvents, so they are
+        # limited by EventManager's per-tick budget ('engine.events.budget').
+        # Only applies during TICKS_LIFE, and anything over budget is carried
+        # over in EventManager's queue to the next tick.
+        #
+        # Loads done by worker threads are delivered each tick in `update()`.
 
-        # TODO [2020-05-26]: Check for queued up stuff due to delays due to
-        # large influx of requests.
-        #   - Process some if present.
+        # Write out any put-off (journaled) saves that are due.
+        self._repository.flush()
 
         # Do DataLoadRequest / DataSaveRequest?
         # Or is DataLoadRequest an event we should subscribe to?
@@ -1351,13 +1463,19 @@ class DataManager(EcsManagerWithEvents,
             return health
 
         elif tick is SystemTick.APOPTOSIS:
+            # Write out all put-off (journaled) saves.
+            self._repository.flush(force=True)
+
             # If apoptosis is still in progress, return
             # VerediHealth.APOPTOSIS.
-            health = VerediHealth.APOPTOSIS_DONE
+            health = (VerediHealth.APOPTOSIS
+                      if self._workers else
+                      VerediHealth.APOPTOSIS_DONE)
             self.health = health
             return health
 
         elif tick is SystemTick.NECROSIS:
+            self._workers.shutdown(wait=False)
             health = VerediHealth.NECROSIS
             self.health = health
             return health
@@ -1387,4 +1505,5 @@ class DataManager(EcsManagerWithEvents,
         Any unit-testing tear-down for DataManager or its members to do (e.g.
         repository)?
         '''
+        self._workers.shutdown(wait=True)
         self._repository._ut_tear_down()
@@ -0,0 +1,172 @@
+# coding: utf-8
+
+'''
+Worker thread pool for DataManager: runs loads (repository read, deserialize,
+decode) off of the game thread, so a slow disk or big file doesn't stall the
+tick. Results are collected back on the game thread with `done()`.
+
+Identical loads requested while one is already in flight are coalesced: they
+wait on the same job instead of reading and parsing the same file again.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import (Optional, Any, Callable, Hashable,
+                    Iterator, Tuple, List, Dict)
+
+
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor, Future
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+WORKERS_DEFAULT = 0
+'''
+Default number of worker threads. Zero means no pool: loads happen inline,
+during the load request's event.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Code
+# -----------------------------------------------------------------------------
+
+class DataWorkers:
+    '''
+    Thread pool for data jobs, with coalescing of identical in-flight jobs.
+
+    `submit()` and `done()` are for the game thread only; the jobs themselves
+    run on the pool's threads.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._workers: int = WORKERS_DEFAULT
+        '''Max number of jobs running at once.'''
+
+        self._name: str = None
+        '''Prefix for our threads' names.'''
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        '''Our thread pool. Created on first `submit()`.'''
+
+        self._pending: Dict[Hashable, Tuple[Future, List[Any]]] = {}
+        '''
+        Job's key -> (job's future, everyone waiting for it), in order
+        submitted.
+        '''
+
+        self.coalesced: int = 0
+        '''Number of submits that joined an already pending job.'''
+
+    def __init__(self,
+                 workers: int = WORKERS_DEFAULT,
+                 name:    str = 'veredi-data') -> None:
+        self._define_vars()
+        self._workers = max(0, workers)
+        self._name = name
+
+    @property
+    def enabled(self) -> bool:
+        '''True if jobs should be submitted to us instead of run inline.'''
+        return self._workers > 0
+
+    @property
+    def workers(self) -> int:
+        '''Max number of jobs running at once.'''
+        return self._workers
+
+    # -------------------------------------------------------------------------
+    # Jobs
+    # -------------------------------------------------------------------------
+
+    def submit(self,
+               key:    Optional[Hashable],
+               waiter: Any,
+               job:    Callable[..., Any],
+               *args:  Any) -> bool:
+        '''
+        Run `job(*args)` on the pool, unless a job with the same `key` is
+        already pending - then `waiter` just waits on that one. A `key` of
+        None is never coalesced.
+
+        Returns True if coalesced into a pending job.
+        '''
+        if key is not None:
+            pending = self._pending.get(key, None)
+            if pending is not None:
+                pending[1].append(waiter)
+                self.coalesced += 1
+                return True
+        else:
+            key = object()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers,
+                thread_name_prefix=self._name)
+
+        self._pending[key] = (self._executor.submit(job, *args), [waiter])
+        return False
+
+    def done(self) -> Iterator[Tuple[Future, List[Any]]]:
+        '''
+        Pop and yield (future, waiters) for each finished job, in order
+        submitted.
+        '''
+        finished = [key
+                    for key, (future, _) in self._pending.items()
+                    if future.done()]
+        for key in finished:
+            yield self._pending.pop(key)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        '''
+        Block until all pending jobs are finished, or `timeout` seconds.
+
+        Returns True if all are finished.
+        '''
+        if not self._pending:
+            return True
+        jobs = [future for future, _ in self._pending.values()]
+        _, not_done = futures.wait(jobs, timeout=timeout)
+        return not not_done
+
+    def shutdown(self, wait: bool = True) -> None:
+        '''
+        Shut down the pool. Pending jobs are dropped if `wait` is False.
+
+        A later `submit()` starts a new pool.
+        '''
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if not wait:
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        '''Number of pending jobs.'''
+        return len(self._pending)
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"workers: {self._workers}, pending: {len(self._pending)}, "
+                f"coalesced: {self.coalesced})")
+
+    def __repr__(self) -> str:
+        return '<v.data.workers:' + str(self) + '>'
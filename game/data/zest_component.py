@@ -0,0 +1,125 @@
+# coding: utf-8
+
+'''
+Tests for component.py (DataComponent class).
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, Literal
+
+
+from veredi.zest.base.unit   import ZestBase
+
+from ..ecs.base.identity     import ComponentId
+from .component              import DataComponent
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# Mockups
+# -----------------------------------------------------------------------------
+
+class StatComponent(DataComponent,
+                    name_dotted='veredi.game.data.zest_component.stat',
+                    name_string='zest.component.stat'):
+    _REQ_KEYS = {
+        'strength': ['score', 'modifier'],
+    }
+
+
+class StatSlowComponent(StatComponent,
+                        name_dotted='veredi.game.data.zest_component.slow',
+                        name_string='zest.component.slow'):
+    QUERY_FLAT = False
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_DataComponent(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.ids = ComponentId.generator()
+
+    def tear_down(self):
+        self.ids = None
+
+    def create(self, klass):
+        return klass(None, self.ids.next(), {
+            'strength': {
+                'score': 10,
+                'modifier': '(${this.score} - 10) // 2',
+                'notes': None,
+            },
+        })
+
+    def test_query(self):
+        fast = self.create(StatComponent)
+        slow = self.create(StatSlowComponent)
+        self.assertIsNotNone(fast._flat)
+        self.assertIsNone(slow._flat)
+
+        # Same answers either way.
+        for query in (('strength.score', ),
+                      ('strength', 'score'),
+                      ('strength', 'modifier'),
+                      ('strength', ),
+                      ('Strength', 'score'),
+                      (['strength', 'score'], ),
+                      ('strength', 'notes')):
+            self.assertEqual(fast.query(*query), slow.query(*query), query)
+
+        self.assertEqual(fast.query('strength', 'score'), 10)
+        self.assertIsNone(fast.query('strength.notes'))
+        self.assertFalse(fast.query('strength.jeff'))
+        self.assertFalse(fast.query('dexterity', 'score'))
+
+    def test_set(self):
+        component = self.create(StatComponent)
+        revision = component.revision
+
+        component.set(12, 'strength', 'score')
+        self.assertEqual(component.query('strength.score'), 12)
+        self.assertEqual(component.query('strength', 'score'), 12)
+        self.assertEqual(component.query('strength')['score'], 12)
+        self.assertEqual(component.changes_since(revision),
+                         {'strength.score'})
+
+        # New sub-tree.
+        component.set({'score': 14, 'modifier': 2}, 'dexterity')
+        self.assertEqual(component.query('dexterity', 'score'), 14)
+        self.assertEqual(component.query('dexterity.modifier'), 2)
+
+        # Direct change + `changed()`.
+        component.persistent['strength']['score'] = 8
+        component.changed('strength.score')
+        self.assertEqual(component.query('strength', 'score'), 8)
+        self.assertEqual(component.changes_since(revision),
+                         {'strength.score', 'dexterity'})
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.game.data.zest_component
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -34,7 +34,9 @@ from veredi.data.records                   import (DataType,
                                                    Saved)
 
 from ..ecs.base.identity                   import ComponentId
+from ..ecs.const                           import SystemTick
 from .component                            import DataComponent
+from .workers                              import DataWorkers
 from veredi.rules.d20.pf2.game             import PF2Rank
 from veredi.rules.d20.pf2.health.component import HealthComponent
 
@@ -633,6 +635,45 @@ class Test_DataManager_Actual(BaseTest_DataManager):
         self.assertEqual(health_expected['current']['permanent'],
                          health_actual['current']['permanent'])
 
+    def test_load_workers(self):
+        self.set_up_events(clear_self=True, clear_manager=True)
+        data = self.manager.data
+        data._workers = DataWorkers(2)
+
+        # Same thing twice, and something else.
+        for load in (self.TestLoad.PLAYER,
+                     self.TestLoad.PLAYER,
+                     self.TestLoad.MONSTER):
+            self.trigger_events(DataLoadRequest(42, 43,
+                                                self.context_load(load)),
+                                expected_events=0)
+
+        # Loaded off-thread, so nothing yet...
+        self.assertFalse(self.events)
+        self.assertEqual(len(data._workers), 2)
+        self.assertEqual(data._workers.coalesced, 1)
+
+        # ...until a tick after they're done.
+        self.assertTrue(data._workers.wait(timeout=10))
+        data.update(SystemTick.PRE)
+        self.manager.event.publish()
+        self.assertFalse(data._workers)
+        self.assertEqual(len(self.events), 3)
+
+        components = [self.manager.component.get(event.component_id)
+                      for event in self.events]
+        for component in components:
+            self.assertIsInstance(component, DataComponent)
+        self.assertEqual(len({component.id for component in components}), 3)
+
+        # Coalesced loads get their own data.
+        self.assertIsNot(components[0].persistent['health'],
+                         components[1].persistent['health'])
+        self.assertEqual(components[0].persistent['health'],
+                         components[1].persistent['health'])
+
+        data._workers.shutdown()
+
 
 # --------------------------------Unit Testing---------------------------------
 # --                      Main Command Line Entry Point                      --
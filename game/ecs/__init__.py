@@ -20,7 +20,8 @@ from . import base
 # ------------------------------
 from .component          import ComponentManager
 from .entity             import EntityManager
-from .event              import EventManager, Event
+from .query              import EntityQuery
+from .event              import EventManager, Event, EventPriority
 from .system             import SystemManager
 from .time               import TimeManager
 
@@ -76,8 +77,10 @@ __all__ = [
     # ------------------------------
     'ComponentManager',
     'EntityManager',
+    'EntityQuery',
     'EventManager',
     'Event',
+    'EventPriority',
     'SystemManager',
     'TimeManager',
 
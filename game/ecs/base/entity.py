@@ -158,6 +158,13 @@ class Entity(NamesMixin,
     def life_cycle(self) -> EntityLifeCycle:
         return self._life_cycle
 
+    @property
+    def components(self) -> Iterable[Component]:
+        '''
+        All of our components, enabled or not.
+        '''
+        return self._components.values()
+
     def _life_cycled(self, new_state: EntityLifeCycle) -> None:
         '''
         EntityManager calls this to update life cycle. Will be called on:
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
 
     from .component                 import Component
     from .entity                    import Entity
+    from ..query                    import EntityQuery
 
 
 import enum
@@ -192,6 +193,13 @@ class System(LogMixin, NamesMixin):
         us to do something with the entity for our tick.
         '''
 
+        self._entity_query: Optional['EntityQuery'] = None
+        '''
+        Our live view of the entities that have our `required()` components.
+        Registered with the EntityManager the first time `_wanted_entities()`
+        is called.
+        '''
+
         self._ticks: Optional[SystemTick] = None
         '''
         The ticks we desire to run in.
@@ -449,6 +457,11 @@ class System(LogMixin, NamesMixin):
         if self._health != VerediHealth.NECROSIS:
             self._health = self._health.update(VerediHealth.FATAL)
 
+        # No one needs our entities anymore.
+        if self._entity_query is not None:
+            self._manager.entity.query_release(self._entity_query)
+            self._entity_query = None
+
         return self.health
 
     # -------------------------------------------------------------------------
@@ -800,14 +813,24 @@ class System(LogMixin, NamesMixin):
         '''
         return self._components_req_all
 
-    def _wanted_entities(self, tick: SystemTick) -> VerediHealth:
+    def _wanted_query(self) -> 'EntityQuery':
+        '''
+        Returns our EntityQuery for entities that have self.required(),
+        registering it with the EntityManager if this is the first call.
+
+        Use its `added` and `removed` to only process changes since last tick.
+        '''
+        if self._entity_query is None:
+            self._entity_query = self._manager.entity.query(
+                self.required(),
+                self.require_all())
+        return self._entity_query
+
+    def _wanted_entities(self, tick: SystemTick) -> Iterable['Entity']:
         '''
         Loop over entities that have self.required().
         '''
-        req_fn = (self._manager.entity.each_with_all
-                  if self.require_all() else
-                  self._manager.entity.each_with_any)
-        for entity in req_fn(self.required()):
+        for entity in self._wanted_query():
             yield entity
 
     def update_tick(self,
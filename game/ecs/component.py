@@ -45,7 +45,8 @@ from .base.component           import (Component,
                                        ComponentLifeCycle)
 from .event                    import (EcsManagerWithEvents,
                                        EventManager,
-                                       Event)
+                                       Event,
+                                       EventPriority)
 
 
 # -----------------------------------------------------------------------------
@@ -62,7 +63,7 @@ CompOrNull = NewType('CompOrNull', Union[Component, Null])
 class ComponentEvent(Event,
                      name_dotted='veredi.game.ecs.component.event',
                      name_string='component'):
-    ...
+    PRIORITY = EventPriority.ENGINE
 
 
 class ComponentLifeEvent(ComponentEvent,
@@ -124,12 +125,37 @@ class ComponentManager(EcsManagerWithEvents,
         self._component_destroy: Set[ComponentId]     = set()
         '''Set of components to be destroyed.'''
 
+        self._component_cycled:  Set[ComponentId]     = set()
+        '''
+        Set of components whose `enabled` has changed since the last
+        `drain_cycled()` call. EntityManager uses this to keep its queries
+        current.
+        '''
+
         # TODO: Pools instead of allowing stuff to be allocated/deallocated?
         self._component_by_id:   Dict[ComponentId, Component]           = {}
         '''Existing Components indexed by ID.'''
 
         self._component_by_type: Dict[Type[Component], List[Component]] = {}
-        '''Existing Components indexed by Type (a list for each type).'''
+        '''
+        Existing Components indexed by Type (a dense list for each exact type).
+        Removal swaps the last component into the removed one's slot, so list
+        order is not creation order.
+        '''
+
+        self._component_slot:    Dict[ComponentId, int]                 = {}
+        '''
+        Index of each existing component in its `_component_by_type` list, so
+        removal by ComponentId is O(1).
+        '''
+
+        self._component_subtypes: Dict[Type[Component],
+                                       List[Type[Component]]]           = {}
+        '''
+        For each Component class: all the (concrete, existing) types in
+        `_component_by_type` that are it or its subclasses. Updated whenever a
+        type is first seen.
+        '''
 
         # TODO [2020-10-02]: Remove this or no?
         self._config:            Configuration        = None
@@ -180,8 +206,27 @@ class ComponentManager(EcsManagerWithEvents,
         Insert this component into our pools.
         '''
         self._component_by_id[id] = component
-        type_dict = self._component_by_type.setdefault(type(component), [])
-        type_dict.append(component)
+
+        comp_type = type(component)
+        type_list = self._component_by_type.get(comp_type, None)
+        if type_list is None:
+            type_list = self._add_type(comp_type)
+        self._component_slot[id] = len(type_list)
+        type_list.append(component)
+
+    def _add_type(self, comp_type: Type[Component]) -> List[Component]:
+        '''
+        First component of `comp_type` - add the type to our pools and to the
+        subtype lists of it and all its parent Component classes.
+
+        Returns the new (empty) type list.
+        '''
+        type_list = self._component_by_type.setdefault(comp_type, [])
+        for parent in comp_type.__mro__:
+            if not issubclass(parent, Component):
+                continue
+            self._component_subtypes.setdefault(parent, []).append(comp_type)
+        return type_list
 
     def _remove(self, id: ComponentId) -> None:
         '''
@@ -191,12 +236,26 @@ class ComponentManager(EcsManagerWithEvents,
         if not component:
             return
 
-        type_list = self._component_by_type.setdefault(type(component), [])
-        try:
-            type_list.remove(component)
-        except ValueError:
+        slot = self._component_slot.pop(id, None)
+        type_list = self._component_by_type.get(type(component), None)
+        if slot is None or not type_list:
             # Don't care if it's already not there.
-            pass
+            return
+
+        # Swap-remove: move the last component into the removed one's slot.
+        last = type_list.pop()
+        if slot < len(type_list):
+            type_list[slot] = last
+            self._component_slot[last.id] = slot
+
+    def drain_cycled(self) -> Set[ComponentId]:
+        '''
+        Returns the set of ComponentIds that have been enabled/disabled (via
+        life-cycle changes) since the last call, and starts a new set.
+        '''
+        cycled = self._component_cycled
+        self._component_cycled = set()
+        return cycled
 
     # -------------------------------------------------------------------------
     # API: Component Collection Iteration
@@ -205,13 +264,13 @@ class ComponentManager(EcsManagerWithEvents,
     def each_of_type(self, comp_type: Type[Component]) -> Iterable[Component]:
         '''
         Returns a generator that will return each component of the
-        required type.
+        required type, or of any of its subclasses.
         '''
-        # Look for the specific type, and all parent types.
-        for type in comp_type.__class__.__mro__:
-            # Walk over all components in that type list...
-            for component in self._component_by_type[type]:
-                yield component
+        # Look for the specific type, and all its subtypes.
+        for sub_type in self._component_subtypes.get(comp_type, ()):
+            # Walk over all components in that type list. Copy so components
+            # can be created/removed while we iterate.
+            yield from tuple(self._component_by_type[sub_type])
 
     # -------------------------------------------------------------------------
     # API: Component/Component Management
@@ -406,6 +465,7 @@ class ComponentManager(EcsManagerWithEvents,
 
         component._life_cycle = ComponentLifeCycle.DESTROYING
         self._component_destroy.add(component.id)
+        self._component_cycled.add(component.id)
 
         # And fire off an event for DESTROYING.
         self._event_create(ComponentLifeEvent,
@@ -436,6 +496,7 @@ class ComponentManager(EcsManagerWithEvents,
             try:
                 # Bump it to alive now.
                 component._life_cycled(ComponentLifeCycle.ALIVE)
+                self._component_cycled.add(component_id)
 
             except EcsComponentError as error:
                 self._log_exception(
@@ -24,7 +24,8 @@ Inspired by:
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Union, Type, NewType, Iterable, Set, Dict)
+                    Optional, Union, Type, NewType, Iterable,
+                    Set, List, Dict)
 from veredi.base.null import NullNoneOr, Nullable, Null
 if TYPE_CHECKING:
     from .time import TimeManager
@@ -46,8 +47,12 @@ from .base.component           import (Component,
 from .base.entity              import (EntityTypeId,
                                        Entity,
                                        EntityLifeCycle)
-from .event                    import EcsManagerWithEvents, EventManager, Event
+from .event                    import (EcsManagerWithEvents,
+                                       EventManager,
+                                       Event,
+                                       EventPriority)
 from .component                import ComponentManager
+from .query                    import EntityQuery
 
 
 # -----------------------------------------------------------------------------
@@ -70,7 +75,7 @@ EntityOrNull = NewType('EntityOrNull', Union[Entity, Null])
 class EntityEvent(Event,
                   name_dotted='veredi.game.ecs.entity.event',
                   name_string='entity'):
-    ...
+    PRIORITY = EventPriority.ENGINE
 
 
 class EntityLifeEvent(EntityEvent,
@@ -147,6 +152,35 @@ class EntityManager(EcsManagerWithEvents,
         self._entity:            Dict[EntityId, Entity] = {}
         '''Collection of all Entities. Indexed by ID.'''
 
+        self._entity_by_type:    Dict[Type[Component],
+                                      Dict[EntityId, Entity]] = {}
+        '''
+        Index of Entities by the Component types attached to them. Kept
+        current by create(), attach(), detach(), and destruction() so that
+        `each_with*()` only has to look at entities that could match instead
+        of all of `self._entity`.
+
+        Inner dicts are used as insertion-ordered sets.
+        '''
+
+        self._entity_by_cid:     Dict[ComponentId, Set[EntityId]] = {}
+        '''
+        Index of Entities by the ComponentIds attached to them. Used to find
+        which entities need their queries updated when components are
+        enabled/disabled by the ComponentManager.
+        '''
+
+        self._queries:           List[EntityQuery]      = []
+        '''
+        Live EntityQuery objects that we must keep current.
+        '''
+
+        self._queries_dirty:     Set[EntityId]          = set()
+        '''
+        Entities that need to be re-checked against all queries during our
+        next creation()/destruction().
+        '''
+
     def __init__(self,
                  config:            Optional[Configuration],
                  event_manager:     Optional[EventManager],
@@ -188,6 +222,74 @@ class EntityManager(EcsManagerWithEvents,
         self.health = health
         return health
 
+    # -------------------------------------------------------------------------
+    # Component Type Index
+    # -------------------------------------------------------------------------
+
+    def _index_add(self, entity: Entity) -> None:
+        '''
+        Adds `entity` to the component type index for all of its current
+        components' types. Safe to call again for an already-indexed entity.
+        '''
+        for comp_type, component in entity._components.items():
+            bucket = self._entity_by_type.setdefault(comp_type, {})
+            bucket[entity.id] = entity
+            self._entity_by_cid.setdefault(component.id,
+                                           set()).add(entity.id)
+
+    def _index_remove(self,
+                      entity:     Entity,
+                      components: Dict[Type[Component], Component]) -> None:
+        '''
+        Removes `entity` from the component type index for each of
+        `components` (a component type to component dictionary).
+        '''
+        for comp_type, component in components.items():
+            bucket = self._entity_by_type.get(comp_type, None)
+            if bucket is not None:
+                bucket.pop(entity.id, None)
+                # Don't keep empty buckets around for types no one has
+                # anymore.
+                if not bucket:
+                    self._entity_by_type.pop(comp_type, None)
+
+            owners = self._entity_by_cid.get(component.id, None)
+            if owners is not None:
+                owners.discard(entity.id)
+                if not owners:
+                    self._entity_by_cid.pop(component.id, None)
+
+    def _candidates(self,
+                    required_components: Iterable[CompIdOrType]
+                    ) -> Optional[Iterable[Entity]]:
+        '''
+        Returns the smallest indexed bucket of entities for the component
+        types in `required_components`, or an empty tuple if some required
+        type isn't on any entity.
+
+        Returns None if the index can't help (no component types in
+        `required_components` - e.g. only ComponentIds), in which case the
+        caller should fall back to all entities.
+        '''
+        smallest = None
+        for required in required_components:
+            # Only types are indexed; ComponentIds will be checked by
+            # Entity.contains() for each candidate.
+            if isinstance(required, ComponentId):
+                continue
+
+            bucket = self._entity_by_type.get(required, None)
+            if not bucket:
+                # No entity has this, so no entity has /all/ of them.
+                return ()
+            if smallest is None or len(bucket) < len(smallest):
+                smallest = bucket
+
+        if smallest is None:
+            return None
+        # Copy so callers can attach/detach while iterating.
+        return tuple(smallest.values())
+
     # -------------------------------------------------------------------------
     # API: Entity Collection Iteration
     # -------------------------------------------------------------------------
@@ -199,10 +301,13 @@ class EntityManager(EcsManagerWithEvents,
         Returns a generator that will return each entity that contains the
         the required component.
         '''
-        # Walk over all entities...
-        for id in self._entity:
-            entity = self._entity[id]
-            # ...and if this entity has the required component,
+        bucket = self._entity_by_type.get(required_component, None)
+        if not bucket:
+            return
+
+        # Walk over all entities with that component type attached...
+        for entity in tuple(bucket.values()):
+            # ...and if this entity has the (enabled) required component,
             # yield it as a value.
             if (entity
                     and entity.enabled
@@ -216,9 +321,12 @@ class EntityManager(EcsManagerWithEvents,
         Returns a generator that will return each entity that contains all of
         the components required.
         '''
-        # Walk over all entities...
-        for id in self._entity:
-            entity = self._entity[id]
+        # Walk over the fewest entities that could possibly match...
+        candidates = self._candidates(required_components)
+        if candidates is None:
+            candidates = tuple(self._entity.values())
+
+        for entity in candidates:
             # ...and if this entity has all of the required components,
             # yield it as a value.
             if (entity
@@ -232,16 +340,104 @@ class EntityManager(EcsManagerWithEvents,
         '''
         Returns a generator that will return each entity that contains any of
         the components required.
+
+        Each entity is returned only once, even if it has more than one of the
+        required components.
         '''
-        # Walk over all entities...
-        for id in self._entity:
-            entity = self._entity[id]
+        # Collect the union of the entities with any of the required types.
+        candidates = {}
+        for required in required_components:
+            if isinstance(required, ComponentId):
+                # Can't index by id - have to check everyone for this one.
+                candidates = self._entity
+                break
+            candidates.update(self._entity_by_type.get(required, {}))
+
+        for entity in tuple(candidates.values()):
             # ...and if this entity has any one of the required components,
             # yield it as a value.
             if (entity and entity.enabled):
                 for component in required_components:
                     if component in entity:
                         yield entity
+                        break
+
+    # -------------------------------------------------------------------------
+    # API: Entity Queries
+    # -------------------------------------------------------------------------
+
+    def query(self,
+              required_components: Iterable[CompIdOrType],
+              require_all:         bool = True) -> EntityQuery:
+        '''
+        Creates and registers an EntityQuery for entities with all (or any, if
+        `require_all` is False) of the `required_components`.
+
+        The query is kept current until `query_release()` is called for it, so
+        call this once (e.g. first time a System needs it), not every tick.
+        '''
+        query = EntityQuery(required_components, require_all)
+
+        # Fill it with whoever matches now.
+        candidates = None
+        if require_all:
+            candidates = self._candidates(query.required)
+        if candidates is None:
+            candidates = tuple(self._entity.values())
+        for entity in candidates:
+            # Existing matches aren't 'changes' from the query's point of
+            # view, so skip the deltas.
+            if query._matches(entity):
+                query._entities[entity.id] = entity
+
+        self._queries.append(query)
+        return query
+
+    def query_release(self, query: EntityQuery) -> None:
+        '''
+        Stop keeping `query` current and forget about it.
+        '''
+        try:
+            self._queries.remove(query)
+        except ValueError:
+            # Don't care if it's already not there.
+            pass
+        query._clear()
+
+    def _query_dirty(self, entity: Entity) -> None:
+        '''
+        Update all queries for `entity` now, and remember to check it again at
+        our next creation()/destruction().
+        '''
+        if not self._queries:
+            return
+
+        for query in self._queries:
+            query._update(entity)
+        self._queries_dirty.add(entity.id)
+
+    def _query_refresh(self) -> None:
+        '''
+        Re-check all dirty entities (and entities whose components were
+        enabled/disabled by ComponentManager) against all queries.
+        '''
+        cycled = self._component_manager.drain_cycled()
+        if not self._queries:
+            self._queries_dirty.clear()
+            return
+
+        for cid in cycled:
+            self._queries_dirty.update(self._entity_by_cid.get(cid, ()))
+
+        for entity_id in self._queries_dirty:
+            entity = self._entity.get(entity_id, None)
+            for query in self._queries:
+                if entity:
+                    query._update(entity)
+                else:
+                    query._remove(entity_id)
+
+        self._queries_dirty.clear()
 
     # -------------------------------------------------------------------------
     # API: Component/Entity Management
@@ -321,8 +517,11 @@ class EntityManager(EcsManagerWithEvents,
             )
 
         self._entity[eid] = entity
+        # Entity can come with components from the context.
+        self._index_add(entity)
         self._entity_create.add(eid)
         entity._life_cycled(EntityLifeCycle.CREATING)
+        self._query_dirty(entity)
 
         self._event_create(EntityLifeEvent,
                            eid,
@@ -344,6 +543,7 @@ class EntityManager(EcsManagerWithEvents,
 
         entity._life_cycle = EntityLifeCycle.DESTROYING
         self._entity_destroy.add(entity.id)
+        self._query_dirty(entity)
 
         self._event_create(EntityLifeEvent,
                            entity_id,
@@ -364,6 +564,8 @@ class EntityManager(EcsManagerWithEvents,
         if not entity:
             return
         entity._attach_all(id_or_comp)
+        self._index_add(entity)
+        self._query_dirty(entity)
 
         self._event_create(EntityEvent,
                            entity_id,
@@ -383,7 +585,13 @@ class EntityManager(EcsManagerWithEvents,
         entity = self.get(entity_id)
         if not entity:
             return
+        attached = dict(entity._components)
         entity._detach_all(components)
+        self._index_remove(entity,
+                           {comp_type: component
+                            for comp_type, component in attached.items()
+                            if comp_type not in entity._components})
+        self._query_dirty(entity)
 
         self._event_create(EntityEvent,
                            entity_id,
@@ -427,8 +635,14 @@ class EntityManager(EcsManagerWithEvents,
                                None, False)
 
         # Done with iteration - clear the adds.
+        self._queries_dirty.update(self._entity_create)
         self._entity_create.clear()
 
+        # Bring queries up to date and start the new tick's deltas.
+        self._query_refresh()
+        for query in self._queries:
+            query._publish()
+
         return VerediHealth.HEALTHY
 
     def destruction(self,
@@ -455,6 +669,7 @@ class EntityManager(EcsManagerWithEvents,
                 entity._life_cycled(EntityLifeCycle.DEAD)
                 # ...and forget about it.
                 self._entity.pop(entity_id, None)
+                self._index_remove(entity, entity._components)
 
             except EcsEntityError as error:
                 self._log_exception(
@@ -469,6 +684,9 @@ class EntityManager(EcsManagerWithEvents,
                                None, False)
 
         # Done with iteration - clear the removes.
+        self._queries_dirty.update(self._entity_destroy)
         self._entity_destroy.clear()
 
+        self._query_refresh()
+
         return VerediHealth.HEALTHY
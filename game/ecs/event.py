@@ -9,7 +9,8 @@ Event Manager. Pub/Sub style. Subscribe to events by class type.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Union, Callable, Any, Type, NewType, Dict, List)
+                    Optional, Union, Callable, Any, Type, NewType,
+                    Dict, List, Tuple, Deque, Iterator)
 if TYPE_CHECKING:
     from .time import TimeManager
 
@@ -17,6 +18,8 @@ from veredi.base.null import Null, NullNoneOr
 
 
 import enum
+import time as py_time
+from collections import deque
 
 
 from veredi.logs               import log
@@ -51,6 +54,29 @@ Events accept these types as their IDs.
 '''
 
 
+@enum.unique
+class EventPriority(enum.IntEnum):
+    '''
+    Priority classes for queued events. Lower values are published first;
+    events of the same priority are published in FIFO order.
+    '''
+
+    ENGINE  = 0
+    '''
+    Engine/ECS life-cycle events (entity, component, system, engine). Never
+    held back by the per-tick budget.
+    '''
+
+    DATA    = 1
+    '''Data load/save/identity requests and results.'''
+
+    DEFAULT = 2
+    '''Everything that doesn't say otherwise.'''
+
+    INPUT   = 3
+    '''User input. Can arrive in bursts, so it goes last.'''
+
+
 # -----------------------------------------------------------------------------
 # Manager Interface Subclass
 # -----------------------------------------------------------------------------
@@ -141,6 +167,12 @@ class Event(NamesMixin):
     TYPE_NONE = 0
     '''A "Don't care" for the event.type field.'''
 
+    PRIORITY: EventPriority = EventPriority.DEFAULT
+    '''
+    Which of EventManager's queues this event class waits in. Sub-classes
+    override as needed.
+    '''
+
     def __init__(self,
                  id: EventIdInput,
                  type: EventTypeInput,
@@ -205,6 +237,189 @@ class Event(NamesMixin):
                 f"{repr(self._context)}>")
 
 
+# -----------------------------------------------------------------------------
+# Event Queue
+# -----------------------------------------------------------------------------
+
+class EventQueue:
+    '''
+    EventManager's queue of events waiting to be published: one FIFO queue per
+    EventPriority. Popping gets the oldest event of the highest priority.
+
+    Also keeps counters on queue depth and how long events have been waiting.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._queues: Tuple[Deque[Tuple[float, Any]], ...] = tuple(
+            deque() for _ in EventPriority)
+        '''
+        One FIFO queue per EventPriority, indexed by priority value. Entries are
+        (enqueue time, event) tuples.
+        '''
+
+        self._priorities: Dict[Type[Any], EventPriority] = {}
+        '''Cache of event class to its priority.'''
+
+        self._length: int = 0
+        '''Total number of events queued.'''
+
+        self._depth_max: int = 0
+        '''
+        Most events queued at once since creation or `reset_depth_max()`.
+        '''
+
+    def __init__(self) -> None:
+        self._define_vars()
+
+    # -------------------------------------------------------------------------
+    # Counters
+    # -------------------------------------------------------------------------
+
+    @property
+    def depth(self) -> int:
+        '''Number of events currently queued.'''
+        return self._length
+
+    @property
+    def depth_max(self) -> int:
+        '''
+        Most events queued at once since creation or `reset_depth_max()`.
+        '''
+        return self._depth_max
+
+    def reset_depth_max(self) -> None:
+        '''
+        Resets `depth_max` to the current depth.
+        '''
+        self._depth_max = self._length
+
+    def depth_by_priority(self) -> Dict[EventPriority, int]:
+        '''
+        Returns number of events currently queued for each priority.
+        '''
+        return {priority: len(self._queues[priority])
+                for priority in EventPriority}
+
+    @property
+    def age(self) -> float:
+        '''
+        Seconds the oldest queued event has been waiting. 0.0 if empty.
+        '''
+        oldest = None
+        for queue in self._queues:
+            if queue and (oldest is None or queue[0][0] < oldest):
+                oldest = queue[0][0]
+        if oldest is None:
+            return 0.0
+        return py_time.perf_counter() - oldest
+
+    # -------------------------------------------------------------------------
+    # Queue Interface
+    # -------------------------------------------------------------------------
+
+    def priority(self, event: Any) -> EventPriority:
+        '''
+        Returns `event`'s priority (`EventPriority.DEFAULT` if it doesn't say).
+        '''
+        klass = event.__class__
+        priority = self._priorities.get(klass, None)
+        if priority is None:
+            priority = EventPriority(getattr(klass,
+                                             'PRIORITY',
+                                             EventPriority.DEFAULT))
+            self._priorities[klass] = priority
+        return priority
+
+    @property
+    def head_priority(self) -> Optional[EventPriority]:
+        '''
+        Priority of the event that will be popped next, or None if empty.
+        '''
+        for priority, queue in zip(EventPriority, self._queues):
+            if queue:
+                return priority
+        return None
+
+    def append(self, event: Any) -> None:
+        '''
+        Queue `event` at the end of its priority's queue.
+        '''
+        self._queues[self.priority(event)].append((py_time.perf_counter(),
+                                                   event))
+        self._length += 1
+        if self._length > self._depth_max:
+            self._depth_max = self._length
+
+    def popleft(self) -> Any:
+        '''
+        Removes and returns the oldest event of the highest priority.
+
+        Raises IndexError if empty.
+        '''
+        for queue in self._queues:
+            if queue:
+                self._length -= 1
+                return queue.popleft()[1]
+        raise IndexError("popleft from an empty EventQueue")
+
+    def take(self, limit: Optional[int] = None) -> List[Any]:
+        '''
+        Removes and returns queued events in publish order: every
+        `EventPriority.ENGINE` event, then up to `limit` of the rest (all of
+        them if `limit` is None).
+        '''
+        events = []
+        for priority, queue in zip(EventPriority, self._queues):
+            if priority == EventPriority.ENGINE or limit is None:
+                count = len(queue)
+            else:
+                count = min(limit, len(queue))
+                limit -= count
+            for _ in range(count):
+                events.append(queue.popleft()[1])
+        self._length -= len(events)
+        return events
+
+    def clear(self) -> None:
+        '''
+        Drops all queued events.
+        '''
+        for queue in self._queues:
+            queue.clear()
+        self._length = 0
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        '''
+        Iterate over queued events in the order they would be published.
+        '''
+        for queue in self._queues:
+            for _, event in queue:
+                yield event
+
+    def __str__(self) -> str:
+        depths = ', '.join(f"{priority.name.lower()}: {len(queue)}"
+                           for priority, queue in zip(EventPriority,
+                                                      self._queues))
+        return f"{self.__class__.__name__}[{depths}]"
+
+    def __repr__(self) -> str:
+        return '<v.ev-queue:' + str(self) + '>'
+
+
 # ----------------------------"Party Coordinator"?-----------------------------
 # --                   "Event Manager" seems so formal...                    --
 # --------------------------------(oh well...)---------------------------------
@@ -223,14 +438,64 @@ class EventManager(EcsManager,
         self._subscriptions: Dict[Type[Event], EventNotifyFn] = {}
         '''Our subscribers. Event types to functions dictionary.'''
 
-        self._events:        List[Event]                      = []
-        '''FIFO queue of events that came in, if saving up.'''
+        self._dispatch: Dict[Type[Event], Tuple[EventNotifyFn, ...]] = {}
+        '''
+        Resolved dispatch cache. Concrete event class to all of the
+        subscribers for it and its parent classes (in MRO order).
+
+        Built as event classes are pushed; cleared when subscriptions change.
+        '''
+
+        self._events:        EventQueue                       = EventQueue()
+        '''
+        Prioritized FIFO queues of events that came in, if saving up.
+        '''
+
+        self._batched:       bool                             = False
+        '''
+        If True, `publish()` groups queued events by type and dispatches each
+        type's events together instead of strictly in FIFO order.
+
+        Set via config: 'engine.events.publish.batched'.
+        '''
+
+        self._budget_count:  int                              = 0
+        '''
+        Max number of events to publish per game tick (TICKS_LIFE only).
+        0 means no limit.
+
+        Set via config: 'engine.events.budget.count'.
+        '''
+
+        self._budget_seconds: float                           = 0.0
+        '''
+        Max seconds to spend publishing events per game tick (TICKS_LIFE
+        only). 0.0 means no limit.
+
+        Set via config: 'engine.events.budget.seconds'.
+        '''
+
+        self._budget_used:   int                              = 0
+        '''Events published so far this game tick.'''
+
+        self._budget_spent:  float                            = 0.0
+        '''Seconds spent publishing so far this game tick.'''
 
     def __init__(self,
                  config:      Optional[Configuration],
                  debug_flags: NullNoneOr[DebugFlag]) -> None:
         super().__init__(debug_flags)
 
+        if config:
+            self._batched = bool(config.get('engine', 'events',
+                                            'publish', 'batched'))
+            self._budget_count = int(config.get('engine', 'events',
+                                                'budget', 'count')
+                                     or 0)
+            self._budget_seconds = float(config.get('engine', 'events',
+                                                    'budget', 'seconds')
+                                         or 0.0)
+
         # Pool for event objects?
 
     # -------------------------------------------------------------------------
@@ -245,6 +510,14 @@ class EventManager(EcsManager,
             background.Name.DOTTED.key: self.dotted,
         }
 
+    @property
+    def queue(self) -> EventQueue:
+        '''
+        Our queue of events waiting to be published. For its depth/age
+        counters - use `notify()` and `publish()` to add/remove events.
+        '''
+        return self._events
+
     # -------------------------------------------------------------------------
     # Debug Stuff
     # -------------------------------------------------------------------------
@@ -322,6 +595,9 @@ class EventManager(EcsManager,
         subs = self._subscriptions.setdefault(target_class, set())
         subs.add(handler_fn)
 
+        # Any cached dispatch could be stale now.
+        self._dispatch.clear()
+
     def is_subscribed(self,
                       target_class: Type[Any],
                       handler_fn:   EventNotifyFn) -> None:
@@ -381,11 +657,12 @@ class EventManager(EcsManager,
         Note: you are turning over lifecycle management of the event to
         EventManager.
         '''
-        self._log_debug("Received {} for publishing {}.",
-                        event,
-                        ("IMMEDIATELY"
-                         if requires_immediate_publish else
-                         "later"))
+        if self._log_will_output(log.Level.DEBUG):
+            self._log_debug("Received {} for publishing {}.",
+                            event,
+                            ("IMMEDIATELY"
+                             if requires_immediate_publish else
+                             "later"))
         if requires_immediate_publish:
             self._push(event)
             return
@@ -464,40 +741,140 @@ class EventManager(EcsManager,
             # Always re-raise in catch-all.
             raise
 
+    def _resolve(self, event_class: Type[Any]) -> Tuple[EventNotifyFn, ...]:
+        '''
+        Resolves and caches all subscribers for `event_class`, its parent
+        classes, multiple inheritance stuff, etc.
+        '''
+        subs = []
+        for push_type in event_class.__mro__:
+            subs.extend(self._subscriptions.get(push_type, ()))
+
+        subs = tuple(subs)
+        self._dispatch[event_class] = subs
+        return subs
+
     def _push(self, event: Any) -> None:
         '''
         Pushes one event to all of its subscribers.
         '''
-        # Push for each class, parent classes, multiple inheritance stuff, etc.
-        has_subs = False
-        for push_type in event.__class__.__mro__:
-            subs = self._subscriptions.get(push_type, ())
+        subs = self._dispatch.get(event.__class__, None)
+        if subs is None:
+            subs = self._resolve(event.__class__)
+
+        # Don't build the log strings unless they'll be used.
+        if self._log_will_output(log.Level.DEBUG):
             if subs:
                 self._log_debug("Pushing {} to its {} subcribers: {}",
-                                event, push_type, subs)
-            for notice in subs:
-                has_subs = True
-                self._call_catch(notice, event)
+                                event, len(subs), subs)
+            else:
+                self._log_debug("Tried to push {}, but it has no "
+                                "subscribers.",
+                                event)
+
+        for notice in subs:
+            self._call_catch(notice, event)
+
+    def _push_batched(self, events: List[Any]) -> None:
+        '''
+        Pushes `events` grouped by event class: all events of the first class
+        seen, then all of the next class, etc. Order is preserved within each
+        class.
+        '''
+        by_class = {}
+        for event in events:
+            by_class.setdefault(event.__class__, []).append(event)
 
-        if not has_subs:
-            self._log_debug("Tried to push {}, but it has no subscribers.",
-                            event)
+        for event_class, batch in by_class.items():
+            subs = self._dispatch.get(event_class, None)
+            if subs is None:
+                subs = self._resolve(event_class)
+            for event in batch:
+                for notice in subs:
+                    self._call_catch(notice, event)
 
-    def publish(self) -> int:
+    def publish(self,
+                batched:  Optional[bool] = None,
+                budgeted: bool           = False) -> int:
         '''
-        Publishes all queued up events to any subscribers.
+        Publishes queued up events to any subscribers, in priority order.
+        Events queued up while publishing are published too.
+
+        If `batched` is None, uses the 'engine.events.publish.batched' config
+        setting. If `batched` is True, events are grouped by type before
+        dispatch.
+
+        If `budgeted` is True, stops once this game tick's budget (config
+        'engine.events.budget') is used up. Remaining events stay queued for
+        the next publish. `EventPriority.ENGINE` events are always published.
 
         Returns number published.
         '''
-        publishing = len(self._events)
-        self._log_debug("Publishing {} events...",
-                        publishing)
+        if batched is None:
+            batched = self._batched
+        budgeted = budgeted and bool(self._budget_count
+                                     or self._budget_seconds)
 
-        for each in self._events:
-            self._push(each)
-        self._events.clear()
+        if self._log_will_output(log.Level.DEBUG):
+            self._log_debug("Publishing {} events{}...",
+                            len(self._events),
+                            " (batched)" if batched else "")
 
-        return publishing
+        started = py_time.perf_counter() if budgeted else 0.0
+        published = 0
+        while self._events:
+            limit = None
+            if budgeted:
+                limit = self._budget_left(published, started)
+                if (limit == 0
+                        and self._events.head_priority != EventPriority.ENGINE):
+                    break
+
+            if batched:
+                # Events queued up while publishing get their own batch.
+                events = self._events.take(limit)
+                self._push_batched(events)
+                published += len(events)
+            else:
+                self._push(self._events.popleft())
+                published += 1
+
+        if budgeted:
+            self._budget_used += published
+            self._budget_spent += py_time.perf_counter() - started
+            if self._events and self._log_will_output(log.Level.DEBUG):
+                self._log_debug("Event budget used up. Carrying over {} "
+                                "events to next publish; oldest has waited "
+                                "{:.4f} sec. {}",
+                                len(self._events),
+                                self._events.age,
+                                self._events)
+
+        return published
+
+    def _budget_left(self, published: int, started: float) -> Optional[int]:
+        '''
+        Returns how many more events can be published this game tick: None
+        for no limit, 0 if out of budget (count or time).
+
+        `published` and `started` are the current publish()'s count and start
+        time.
+        '''
+        if (self._budget_seconds
+                and (self._budget_spent + py_time.perf_counter() - started
+                     >= self._budget_seconds)):
+            return 0
+
+        if not self._budget_count:
+            return None
+        return max(self._budget_count - self._budget_used - published, 0)
+
+    def _budget_reset(self) -> None:
+        '''
+        Start of a new game tick - reset the per-tick budget.
+        '''
+        self._budget_used = 0
+        self._budget_spent = 0.0
 
     # -------------------------------------------------------------------------
     # Engine Ticks
@@ -508,10 +885,16 @@ class EventManager(EcsManager,
         Engine calls us for each update tick, and we'll call all our
         game systems.
         '''
-        # For the starting and running ticks, just publish.
-        if SystemTick.TICKS_BIRTH.has(tick) or SystemTick.TICKS_LIFE.has(tick):
+        # For the starting ticks, just publish.
+        if SystemTick.TICKS_BIRTH.has(tick):
             return self.publish()
 
+        # For the running ticks, publish within this game tick's budget.
+        if SystemTick.TICKS_LIFE.has(tick):
+            if tick == SystemTick.TIME:
+                self._budget_reset()
+            return self.publish(budgeted=True)
+
         # For the ending ticks, bit more complicated -
         # call the function for them.
         if SystemTick.TICKS_DEATH.has(tick):
@@ -582,7 +965,7 @@ class EventManager(EcsManager,
     # Unit Test Functions
     # -------------------------------------------------------------------------
 
-    def _ut_clear_events(self) -> List[Event]:
+    def _ut_clear_events(self) -> EventQueue:
         '''
         Replace our event queue with a fresh queue (basically, clear out all
         our queued events).
@@ -590,7 +973,7 @@ class EventManager(EcsManager,
         Returns the old event queue with whatever was or wasn't in it.
         '''
         queued_events = self._events
-        self._events = []
+        self._events = EventQueue()
         return queued_events
 
     def _ut_clear_subs(self) -> Dict[Type[Event], EventNotifyFn]:
@@ -602,4 +985,5 @@ class EventManager(EcsManager,
         '''
         prev_subs = self._subscriptions
         self._subscriptions = {}
+        self._dispatch.clear()
         return prev_subs
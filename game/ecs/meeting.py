@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     from veredi.base.context   import VerediContext
     from .base.entity          import Entity
     from .base.component       import Component
+    from ..data.manager          import DataManager
+    from ..data.identity.manager import IdentityManager
 
 
 from veredi.base.const         import VerediHealth
@@ -31,8 +33,6 @@ from .event                    import EventManager, Event
 from .component                import ComponentManager
 from .entity                   import EntityManager
 from .system                   import SystemManager
-from ..data.manager            import DataManager
-from ..data.identity.manager   import IdentityManager
 
 from .const                    import SystemTick
 from .base.identity            import ComponentId, EntityId
@@ -100,14 +100,14 @@ class Meeting(NamesMixin,
           - `Null` indates it should but does not exist.
         '''
 
-        self._data_manager: NullFalseOr[DataManager] = Null()
+        self._data_manager: NullFalseOr['DataManager'] = Null()
         '''
         "Singleton" for DataManager.
           - `False` indicates it explicitly does not exist.
           - `Null` indates it should but does not exist.
         '''
 
-        self._identity_manager: NullFalseOr[IdentityManager] = Null()
+        self._identity_manager: NullFalseOr['IdentityManager'] = Null()
         '''
         "Singleton" for IdentityManager.
           - `False` indicates it explicitly does not exist.
@@ -120,8 +120,8 @@ class Meeting(NamesMixin,
                  component_manager: NullFalseOr[ComponentManager],
                  entity_manager:    NullFalseOr[EntityManager],
                  system_manager:    NullFalseOr[SystemManager],
-                 data_manager:      NullFalseOr[DataManager],
-                 identity_manager:  NullFalseOr[IdentityManager],
+                 data_manager:      NullFalseOr['DataManager'],
+                 identity_manager:  NullFalseOr['IdentityManager'],
                  debug_flags:       NullFalseOr[DebugFlag]) -> None:
         '''
         Set a manager to False if you know explicitly that it does not exist.
@@ -188,6 +188,11 @@ class Meeting(NamesMixin,
         if not required_set:
             return VerediHealth.HEALTHY
 
+        # Imported here, not at the top: game.data's modules import game.ecs,
+        # so importing them first would be circular.
+        from ..data.manager          import DataManager
+        from ..data.identity.manager import IdentityManager
+
         # Fail if any required are not present.
         if TimeManager in required_set and not self._time_manager:
             return (VerediHealth.UNHEALTHY
@@ -291,7 +296,7 @@ class Meeting(NamesMixin,
         return self._system_manager
 
     @property
-    def data(self) -> Union[DataManager, bool, Null]:
+    def data(self) -> Union['DataManager', bool, Null]:
         '''
         Returns DataManager. If this returns 'False' (as opposed to
         Null/Falsy), that is explicitly stating the explicit absense of an
@@ -304,7 +309,7 @@ class Meeting(NamesMixin,
         return self._data_manager
 
     @property
-    def identity(self) -> Union[IdentityManager, bool, Null]:
+    def identity(self) -> Union['IdentityManager', bool, Null]:
         '''
         Returns IdentityManager. If this returns 'False' (as opposed to
         Null/Falsy), that is explicitly stating the explicit absense of an
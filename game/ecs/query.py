@@ -0,0 +1,232 @@
+# coding: utf-8
+
+'''
+Persistent, live views of the entities that match a set of required
+components.
+
+Systems ask for the same `required()` components every tick. Instead of
+searching for them each tick, a system registers an EntityQuery with the
+EntityManager once, and the EntityManager keeps the query's entities current
+as components are attached/detached and entities/components change life
+cycles.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import (TYPE_CHECKING,
+                    Optional, Iterable, Iterator, List, Dict, FrozenSet)
+if TYPE_CHECKING:
+    from .base.component import CompIdOrType
+
+
+from .base.identity      import EntityId
+from .base.entity        import Entity
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# Code
+# -----------------------------------------------------------------------------
+
+class EntityQuery:
+    '''
+    A live, ordered collection of the (enabled) entities that have all of (or
+    any of) the required components.
+
+    Do not create these yourself - get them from `EntityManager.query()`.
+
+    Membership is kept current by the EntityManager. Iterating is just a walk
+    over the matching entities - no checking required.
+
+    Also tracks which entities were `added` to and `removed` from the query.
+    These deltas are 'since last tick': they are published at the end of
+    EntityManager's CREATION tick, and contain every change since the previous
+    CREATION tick. Changes made after that (during PRE, STANDARD, etc) will be
+    in the next tick's deltas.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._required: FrozenSet['CompIdOrType'] = frozenset()
+        '''The components an entity must have to be in this query.'''
+
+        self._require_all: bool = True
+        '''
+        True: Entities must have all of `self._required`.
+        False: Entities must have any of `self._required`.
+        '''
+
+        self._entities: Dict[EntityId, Entity] = {}
+        '''
+        Entities currently matching this query. Dict is used as an
+        insertion-ordered set.
+        '''
+
+        self._added: List[EntityId] = []
+        '''Entities that joined this query during the last tick.'''
+
+        self._removed: List[EntityId] = []
+        '''Entities that left this query during the last tick.'''
+
+        self._pending_added: Dict[EntityId, None] = {}
+        '''Entities that have joined since the deltas were last published.'''
+
+        self._pending_removed: Dict[EntityId, None] = {}
+        '''Entities that have left since the deltas were last published.'''
+
+    def __init__(self,
+                 required:    Iterable['CompIdOrType'],
+                 require_all: bool = True) -> None:
+        '''DO NOT CALL THIS UNLESS YOUR NAME IS EntityManager!'''
+        self._define_vars()
+
+        self._required = frozenset(required or ())
+        self._require_all = require_all
+
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def required(self) -> FrozenSet['CompIdOrType']:
+        '''The components required by this query.'''
+        return self._required
+
+    @property
+    def require_all(self) -> bool:
+        '''
+        True if entities need all of `required`; False if they need any one.
+        '''
+        return self._require_all
+
+    @property
+    def added(self) -> List[EntityId]:
+        '''
+        EntityIds of entities that joined this query since last tick.
+        '''
+        return self._added
+
+    @property
+    def removed(self) -> List[EntityId]:
+        '''
+        EntityIds of entities that left this query since last tick.
+        '''
+        return self._removed
+
+    # -------------------------------------------------------------------------
+    # EntityManager Interface
+    # -------------------------------------------------------------------------
+
+    def _matches(self, entity: Entity) -> bool:
+        '''
+        Returns true if `entity` belongs in this query.
+        '''
+        if not entity or not entity.enabled:
+            return False
+
+        if self._require_all:
+            return entity.contains(self._required)
+
+        for component in self._required:
+            if component in entity:
+                return True
+        return False
+
+    def _update(self, entity: Entity) -> None:
+        '''
+        Adds or removes `entity` based on whether it currently matches.
+        '''
+        if self._matches(entity):
+            self._add(entity)
+        else:
+            self._remove(entity.id)
+
+    def _add(self, entity: Entity) -> None:
+        '''
+        Adds `entity` to this query if it isn't already in it.
+        '''
+        if entity.id in self._entities:
+            return
+
+        self._entities[entity.id] = entity
+        # Joined and left in the same tick is no change at all.
+        if self._pending_removed.pop(entity.id, False) is not False:
+            return
+        self._pending_added[entity.id] = None
+
+    def _remove(self, entity_id: EntityId) -> None:
+        '''
+        Removes `entity_id` from this query if it is in it.
+        '''
+        if self._entities.pop(entity_id, None) is None:
+            return
+
+        # Joined and left in the same tick is no change at all.
+        if self._pending_added.pop(entity_id, False) is not False:
+            return
+        self._pending_removed[entity_id] = None
+
+    def _publish(self) -> None:
+        '''
+        Start of a new tick's deltas: changes pending since the last publish
+        become `added` and `removed`.
+        '''
+        self._added = list(self._pending_added)
+        self._removed = list(self._pending_removed)
+        self._pending_added.clear()
+        self._pending_removed.clear()
+
+    def _clear(self) -> None:
+        '''
+        Forget everything.
+        '''
+        self._entities.clear()
+        self._added = []
+        self._removed = []
+        self._pending_added.clear()
+        self._pending_removed.clear()
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[Entity]:
+        '''
+        Iterate over matching entities, in the order they joined the query.
+
+        Iterates over a copy, so entities/components can be changed while
+        iterating.
+        '''
+        return iter(tuple(self._entities.values()))
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity_id: Optional[EntityId]) -> bool:
+        return entity_id in self._entities
+
+    def __str__(self) -> str:
+        required = sorted(getattr(req, '__name__', str(req))
+                          for req in self._required)
+        return (
+            f"{self.__class__.__name__}"
+            f"[{'all' if self._require_all else 'any'}: "
+            f"{', '.join(required)}]"
+            f"({len(self._entities)})"
+        )
+
+    def __repr__(self) -> str:
+        return '<v.query:' + str(self) + '>'
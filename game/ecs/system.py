@@ -34,7 +34,10 @@ from .base.exceptions          import EcsSystemError
 
 from .const                    import SystemTick, tick_health_init
 from .time                     import TimeManager
-from .event                    import EcsManagerWithEvents, EventManager, Event
+from .event                    import (EcsManagerWithEvents,
+                                       EventManager,
+                                       Event,
+                                       EventPriority)
 from .component                import ComponentManager
 from .entity                   import EntityManager
 
@@ -51,13 +54,13 @@ from .entity                   import EntityManager
 class SystemEvent(Event,
                   name_dotted=('veredi.game.ecs.system.event'),
                   name_string='system'):
-    ...
+    PRIORITY = EventPriority.ENGINE
 
 
 class SystemLifeEvent(Event,
                       name_dotted=('veredi.game.ecs.system.event.life'),
                       name_string='system.life'):
-    pass
+    PRIORITY = EventPriority.ENGINE
 
 
 class SystemManager(EcsManagerWithEvents,
@@ -30,6 +30,7 @@ from .manager                  import EcsManager
 
 from veredi.time.machine       import MachineTime
 from veredi.time.timer         import MonotonicTimer
+from veredi.time.pacer         import TickPacer
 from veredi                    import time
 from ..time.clock              import Clock
 from ..time.tick.round         import TickBase
@@ -138,6 +139,13 @@ class TimeManager(EcsManager,
         Name of the default timer.
         '''
 
+        self.pacer: TickPacer = TickPacer()
+        '''
+        Real-time pacing for the engine's game loop. Disabled (engine runs
+        game loop ticks back-to-back) unless config has
+        'engine.time.pace.ticks-per-second'.
+        '''
+
     def __init__(self,
                  debug_flags: NullNoneOr[DebugFlag] = None) -> None:
         super().__init__(debug_flags)
@@ -185,7 +193,12 @@ class TimeManager(EcsManager,
         config = background.config.config(self.klass,
                                           self.dotted,
                                           None)
-        # No config stuff at the moment.
+        ticks_per_second = config.get('engine', 'time', 'pace',
+                                      'ticks-per-second')
+        max_behind = config.get('engine', 'time', 'pace', 'max-behind')
+        self.pacer = TickPacer(
+            ticks_per_second=float(ticks_per_second or 0),
+            max_behind=(int(max_behind) if max_behind else None))
 
         # ------------------------------
         # Grab Game Rules from DataManager.
@@ -302,6 +302,45 @@ class Test_ComponentManager(ZestBase):
             self.assertEqual(event.type, ComponentLifeCycle.DEAD)
             self.assertIsNone(event.context)
 
+    def test_each_of_type(self):
+        context = UnitTestContext(
+            self,
+            data={'unit-test-args': {'x': 1, 'y': 2}})
+
+        # Nothing of any type yet.
+        self.assertEqual(list(self.comp_mgr.each_of_type(CompOne)), [])
+
+        cid_one_0 = self.comp_mgr.create(CompOne, None)
+        cid_one_1 = self.comp_mgr.create(CompOne, None)
+        cid_two = self.comp_mgr.create(CompTwo, context)
+        cid_three = self.comp_mgr.create(CompThree, None)
+
+        def ids(components):
+            return [component.id for component in components]
+
+        # CompTwo is a CompOne subclass, so should be included.
+        self.assertCountEqual(ids(self.comp_mgr.each_of_type(CompOne)),
+                              [cid_one_0, cid_one_1, cid_two])
+        self.assertEqual(ids(self.comp_mgr.each_of_type(CompTwo)),
+                         [cid_two])
+        self.assertCountEqual(ids(self.comp_mgr.each_of_type(Component)),
+                              [cid_one_0, cid_one_1, cid_two, cid_three])
+
+        # Remove from the front; the swapped-in one should still be findable
+        # and removable.
+        self.comp_mgr.destroy(cid_one_0)
+        self.comp_mgr.destruction(None)
+        self.assertCountEqual(ids(self.comp_mgr.each_of_type(CompOne)),
+                              [cid_one_1, cid_two])
+        self.assertEqual(self.comp_mgr._component_slot[cid_one_1], 0)
+
+        self.comp_mgr.destroy(cid_one_1)
+        self.comp_mgr.destroy(cid_two)
+        self.comp_mgr.destruction(None)
+        self.assertEqual(ids(self.comp_mgr.each_of_type(CompOne)), [])
+        self.assertEqual(ids(self.comp_mgr.each_of_type(CompThree)),
+                         [cid_three])
+
 
 class Test_ComponentManager_Events(Test_ComponentManager):
     def pre_set_up(self,
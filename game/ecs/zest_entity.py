@@ -403,6 +403,103 @@ class Test_EntityManager(ZestBase):
             self.assertEqual(event.type, EntityLifeCycle.DEAD)
             self.assertIsNone(event.context)
 
+    def test_each_with(self):
+        eid_one = self.create_entity(CompOne)
+        eid_both = self.create_entity(CompOne, CompTwo)
+        eid_two = self.create_entity(CompTwo)
+        eid_none = self.create_entity()
+
+        # Not ALIVE yet, so nothing should be returned.
+        self.assertEqual(list(self.entity_mgr.each_with(CompOne)), [])
+
+        self.entity_mgr.creation(None)
+
+        def ids(entities):
+            return [entity.id for entity in entities]
+
+        self.assertEqual(ids(self.entity_mgr.each_with(CompOne)),
+                         [eid_one, eid_both])
+        self.assertEqual(ids(self.entity_mgr.each_with(CompThree)),
+                         [])
+        self.assertEqual(ids(self.entity_mgr.each_with_all({CompOne,
+                                                            CompTwo})),
+                         [eid_both])
+        self.assertEqual(ids(self.entity_mgr.each_with_all({CompOne,
+                                                            CompThree})),
+                         [])
+        # Any: each entity only once, even if it has more than one.
+        self.assertCountEqual(ids(self.entity_mgr.each_with_any({CompOne,
+                                                                 CompTwo})),
+                              [eid_one, eid_both, eid_two])
+        # Nothing required == everyone.
+        self.assertCountEqual(ids(self.entity_mgr.each_with_all(set())),
+                              [eid_one, eid_both, eid_two, eid_none])
+
+        # Index should follow attach/detach.
+        self.entity_mgr.attach(eid_none, *self.create_comps(CompThree))
+        self.entity_mgr.detach(eid_both, CompOne)
+        self.assertEqual(ids(self.entity_mgr.each_with(CompOne)),
+                         [eid_one])
+        self.assertEqual(ids(self.entity_mgr.each_with(CompThree)),
+                         [eid_none])
+        self.assertNotIn(eid_both, self.entity_mgr._entity_by_type[CompOne])
+
+        # ...and destruction.
+        self.entity_mgr.destroy(eid_one)
+        self.entity_mgr.destruction(None)
+        self.assertEqual(ids(self.entity_mgr.each_with(CompOne)), [])
+        self.assertNotIn(CompOne, self.entity_mgr._entity_by_type)
+
+    def test_query(self):
+        eid_one = self.create_entity(CompOne)
+        self.entity_mgr.creation(None)
+
+        # Already existing entities are in the query, but not in the deltas.
+        query = self.entity_mgr.query({CompOne, CompTwo}, require_all=False)
+        query_all = self.entity_mgr.query({CompOne, CompTwo})
+        self.assertEqual([entity.id for entity in query], [eid_one])
+        self.assertEqual(query.added, [])
+        self.assertEqual(len(query_all), 0)
+
+        # New entities show up once they're alive.
+        eid_both = self.create_entity(CompOne, CompTwo)
+        self.assertNotIn(eid_both, query)
+        self.entity_mgr.creation(None)
+        self.assertEqual([entity.id for entity in query],
+                         [eid_one, eid_both])
+        self.assertEqual(query.added, [eid_both])
+        self.assertEqual(query_all.added, [eid_both])
+        self.assertEqual(query.removed, [])
+
+        # Detach is immediate for membership; deltas wait for next tick.
+        self.entity_mgr.detach(eid_both, CompTwo)
+        self.assertIn(eid_both, query)
+        self.assertNotIn(eid_both, query_all)
+        self.assertEqual(query_all.removed, [])
+        self.entity_mgr.creation(None)
+        self.assertEqual(query.added, [])
+        self.assertEqual(query_all.removed, [eid_both])
+
+        # Disabled components drop entities out of queries.
+        component = self.entity_mgr.get(eid_one).get(CompOne)
+        self.comp_mgr.destroy(component.id)
+        self.comp_mgr.destruction(None)
+        self.entity_mgr.destruction(None)
+        self.assertEqual([entity.id for entity in query], [eid_both])
+
+        # Destroyed entities are removed.
+        self.entity_mgr.destroy(eid_both)
+        self.entity_mgr.destruction(None)
+        self.assertEqual(len(query), 0)
+        self.entity_mgr.creation(None)
+        self.assertCountEqual(query.removed, [eid_one, eid_both])
+
+        # Released queries aren't updated anymore.
+        self.entity_mgr.query_release(query)
+        self.create_entity(CompOne)
+        self.entity_mgr.creation(None)
+        self.assertEqual(len(query), 0)
+
 
 class Test_EntityManager_Events(Test_EntityManager):
 
@@ -17,7 +17,8 @@ from veredi.zest           import zmake
 from veredi.zest.zpath     import TestType
 
 
-from .event                import EventManager
+from .const                import SystemTick
+from .event                import EventManager, EventPriority
 
 
 # -----------------------------------------------------------------------------
@@ -41,6 +42,16 @@ class EventThree:
     id = 3
 
 
+class EventEngine:
+    id = 4
+    PRIORITY = EventPriority.ENGINE
+
+
+class EventInput:
+    id = 5
+    PRIORITY = EventPriority.INPUT
+
+
 # -----------------------------------------------------------------------------
 # Test Code
 # -----------------------------------------------------------------------------
@@ -160,6 +171,112 @@ class Test_Events(ZestBase):
         self.assertEqual(self.handlers_called[2], 1)
         self.assertEqual(self.handlers_called[3], 1)
 
+    def test_dispatch_cache(self):
+        self.events.subscribe(EventOne, self.event_handler_one)
+
+        event = EventTwo()
+        self.events.notify(event, True)
+        self.assertEqual(self.events._dispatch[EventTwo],
+                         (self.event_handler_one, ))
+        self.assertEqual(self.handlers_called, {1: 1})
+
+        # New subscription must invalidate the cached dispatch.
+        self.events.subscribe(EventTwo, self.event_handler_two)
+        self.assertNotIn(EventTwo, self.events._dispatch)
+        self.events.notify(event, True)
+        self.assertEqual(self.handlers_called, {1: 2, 2: 1})
+
+    def test_several_events_batched(self):
+        self.subscribe()
+
+        received = []
+
+        def in_order(event):
+            received.append(event)
+        self.events.subscribe(EventOne, in_order)
+        self.events.subscribe(EventThree, in_order)
+
+        event1a = EventOne()
+        event3 = EventThree()
+        event1b = EventOne()
+        self.events.notify(event1a)
+        self.events.notify(event3)
+        self.events.notify(event1b)
+        self.assertEqual(self.events.publish(batched=True), 3)
+
+        # Same events published, but grouped by type.
+        self.assertEqual(received, [event1a, event1b, event3])
+        self.assertEqual(self.handlers_called[1], 2)
+        self.assertEqual(self.handlers_called[3], 1)
+        self.assertFalse(self.events.has_queued)
+
+    def test_priority(self):
+        received = []
+        self.events.subscribe(EventOne, received.append)
+        self.events.subscribe(EventEngine, received.append)
+        self.events.subscribe(EventInput, received.append)
+
+        event_input = EventInput()
+        event_one = EventOne()
+        event_engine = EventEngine()
+        self.events.notify(event_input)
+        self.events.notify(event_one)
+        self.events.notify(event_engine)
+        self.assertEqual(self.events.queue.depth, 3)
+        self.assertEqual(self.events.queue.depth_by_priority(),
+                         {EventPriority.ENGINE:  1,
+                          EventPriority.DATA:    0,
+                          EventPriority.DEFAULT: 1,
+                          EventPriority.INPUT:   1})
+        self.assertGreaterEqual(self.events.queue.age, 0.0)
+
+        self.assertEqual(self.events.publish(), 3)
+        self.assertEqual(received, [event_engine, event_one, event_input])
+        self.assertEqual(self.events.queue.depth, 0)
+        self.assertEqual(self.events.queue.depth_max, 3)
+        self.assertEqual(self.events.queue.age, 0.0)
+
+    def test_budget(self):
+        received = []
+        self.events.subscribe(EventOne, received.append)
+        self.events.subscribe(EventEngine, received.append)
+        self.events._budget_count = 2
+
+        events = [EventOne() for _ in range(3)]
+        for event in events:
+            self.events.notify(event)
+
+        # Unbudgeted ticks publish everything.
+        self.assertEqual(self.events.update(SystemTick.SYNTHESIS, None), 3)
+        received.clear()
+
+        for event in events:
+            self.events.notify(event)
+        # Budget is for the whole game tick, not each phase of it.
+        self.assertEqual(self.events.update(SystemTick.TIME, None), 2)
+        self.assertEqual(received, events[:2])
+        self.assertEqual(self.events.update(SystemTick.CREATION, None), 0)
+        self.assertEqual(self.events.queue.depth, 1)
+
+        # Engine events are never held back.
+        engine = EventEngine()
+        self.events.notify(engine)
+        self.assertEqual(self.events.update(SystemTick.PRE, None), 1)
+        self.assertEqual(received, events[:2] + [engine])
+
+        # Next game tick gets the carried over event.
+        self.assertEqual(self.events.update(SystemTick.TIME, None), 1)
+        self.assertEqual(received, events[:2] + [engine, events[2]])
+        self.assertFalse(self.events.has_queued)
+
+        # Batched obeys the budget too.
+        for event in events:
+            self.events.notify(event)
+        self.events.notify(engine)
+        self.events._budget_reset()
+        self.assertEqual(self.events.publish(batched=True, budgeted=True), 3)
+        self.assertEqual(self.events.queue.depth, 1)
+
 
 # --------------------------------Unit Testing---------------------------------
 # --                      Main Command Line Entry Point                      --
@@ -12,6 +12,7 @@ from typing import Tuple, Literal
 
 
 from datetime import datetime, timezone
+import multiprocessing
 
 
 from veredi.logs           import log
@@ -22,6 +23,7 @@ from veredi.base.context   import UnitTestContext
 
 from veredi.base.strings   import label
 from veredi                import time
+from veredi.time.pacer     import TickPacer
 
 from .time                 import TimeManager
 from ..time.tick.round     import TickRounds
@@ -32,6 +34,61 @@ from ..time.tick.round     import TickRounds
 # -----------------------------------------------------------------------------
 
 
+# -----------------------------------------------------------------------------
+# Mockups
+# -----------------------------------------------------------------------------
+
+class FakeClockPacer(TickPacer):
+    '''
+    TickPacer with a fake monotonic clock so it can be tested without
+    sleeping.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.now = 100.0
+        self.slept = []
+        self.wakes = 0
+        '''Number of upcoming sleeps a waitable interrupts halfway through.'''
+
+    @property
+    def _current(self) -> float:
+        return self.now
+
+    def _sleep(self, seconds: float, waitables: dict) -> bool:
+        self.slept.append(seconds)
+        if self.wakes > 0 and waitables:
+            self.wakes -= 1
+            self.now += seconds / 2
+            return True
+        self.now += seconds
+        return False
+
+
+class FakeWaitable:
+    '''
+    Something for the pacer to wait on and service.
+    '''
+
+    def __init__(self, pacer: FakeClockPacer) -> None:
+        self.pacer = pacer
+        self.serviced = []
+        '''Fake clock time of each `service()` call.'''
+        self.buffered = 0
+        '''Number of `service()` calls to report more data ready for.'''
+        self.stuck = False
+        '''True if `service()` can't deal with its data (e.g. unhealthy).'''
+
+    def service(self) -> bool:
+        self.serviced.append(self.pacer.now)
+        if self.stuck:
+            return None
+        if self.buffered > 0:
+            self.buffered -= 1
+            return True
+        return False
+
+
 # -----------------------------------------------------------------------------
 # Test Code
 # -----------------------------------------------------------------------------
@@ -123,6 +180,141 @@ class Test_Time(ZestBase):
         self.assertEqual((now // self.round_amount) * self.round_amount,
                          self.time.tick.current_seconds)
 
+    def test_pacer(self):
+        # Not configured, so disabled.
+        self.assertFalse(self.time.pacer)
+        self.assertFalse(self.time.pacer.wait())
+
+        pacer = FakeClockPacer(ticks_per_second=10, max_behind=2)
+        self.assertTrue(pacer)
+        self.assertAlmostEqual(pacer.period, 0.1)
+
+        # Fast ticks: sleep off the rest of the period.
+        pacer.wait()
+        pacer.now += 0.03
+        pacer.wait()
+        self.assertEqual(len(pacer.slept), 2)
+        self.assertAlmostEqual(pacer.slept[0], 0.1)
+        self.assertAlmostEqual(pacer.slept[1], 0.07)
+
+        # Waitable woke us early: it gets serviced, then we sleep out the
+        # rest of the period. Schedule stays the same.
+        waitable = FakeWaitable(pacer)
+        pacer.add_waitable(waitable, waitable.service)
+        pacer.wakes = 1
+        self.assertTrue(pacer.wait())
+        self.assertEqual(pacer.woken, 1)
+        self.assertAlmostEqual(pacer.now, 100.3)
+        self.assertAlmostEqual(pacer.slept[-1], 0.05)
+        pacer.remove_waitable(waitable)
+        pacer.now += 0.05
+        pacer.wait()
+        self.assertAlmostEqual(pacer.slept[-1], 0.05)
+
+        # Slow tick: a bit behind, so catch up without sleeping.
+        slept = len(pacer.slept)
+        pacer.now += 0.25
+        pacer.wait()
+        self.assertAlmostEqual(pacer.drift, 0.15)
+        self.assertEqual(pacer.caught_up, 1)
+        pacer.wait()
+        self.assertEqual(len(pacer.slept), slept)
+
+        # Way behind: skip ticks and restart the schedule.
+        pacer.now += 1.0
+        pacer.wait()
+        self.assertGreater(pacer.skipped, 0)
+        pacer.wait()
+        self.assertAlmostEqual(pacer.slept[-1], 0.1)
+
+    def test_pacer_wakes(self):
+        pacer = FakeClockPacer(ticks_per_second=10)
+        waitable = FakeWaitable(pacer)
+        pacer.add_waitable(waitable, waitable.service)
+
+        # Start the schedule.
+        pacer.wait()
+        start_count = self.time.tick.count
+        start_now = pacer.now
+        serviced = len(waitable.serviced)
+
+        # Engine.run(): a game-loop tick, then wait. Lots of wake ups in one
+        # period still only get one tick/game-time step per period.
+        wakes = 5
+        periods = 3
+        for _ in range(periods):
+            self.time.delta()
+            pacer.wakes = wakes
+            self.assertTrue(pacer.wait())
+
+        self.assertEqual(self.time.tick.count, start_count + periods)
+        self.assertAlmostEqual(pacer.now, start_now + periods * pacer.period)
+        self.assertEqual(pacer.woken, wakes * periods)
+        # Serviced once before sleeping, then once per wake up.
+        self.assertEqual(len(waitable.serviced) - serviced,
+                         (wakes + 1) * periods)
+
+        # Data already buffered gets serviced without sleeping until it's
+        # all dealt with.
+        slept = len(pacer.slept)
+        serviced = len(waitable.serviced)
+        waitable.buffered = 3
+        self.assertFalse(pacer.wait())
+        self.assertEqual(len(waitable.serviced) - serviced, 4)
+        self.assertEqual(len(pacer.slept) - slept, 1)
+        self.assertAlmostEqual(pacer.now,
+                               start_now + (periods + 1) * pacer.period)
+
+    def test_pacer_unserviceable(self):
+        pacer = FakeClockPacer(ticks_per_second=10)
+        waitable = FakeWaitable(pacer)
+        pacer.add_waitable(waitable, waitable.service)
+        pacer.wait()
+
+        # Waitable that can't be serviced (e.g. unhealthy) would wake us up
+        # over and over; just sleep out the period instead.
+        waitable.stuck = True
+        pacer.wakes = 100
+        slept = len(pacer.slept)
+        serviced = len(waitable.serviced)
+        self.assertFalse(pacer.wait())
+        self.assertEqual(len(waitable.serviced) - serviced, 1)
+        self.assertEqual(len(pacer.slept) - slept, 1)
+        self.assertAlmostEqual(pacer.slept[-1], pacer.period)
+        self.assertEqual(pacer.woken, 0)
+
+        # Only dropped for that wait; back once it can be serviced.
+        waitable.stuck = False
+        pacer.wakes = 1
+        self.assertTrue(pacer.wait())
+        self.assertEqual(pacer.woken, 1)
+
+    def test_pacer_closed_pipe(self):
+        # Real pipe, closed on the other end: always readable, never drained.
+        rx, tx = multiprocessing.Pipe(duplex=False)
+        tx.close()
+        calls = []
+
+        def service():
+            calls.append(True)
+            try:
+                rx.recv()
+            except EOFError:
+                return None
+            return False
+
+        pacer = TickPacer(ticks_per_second=50)
+        pacer.add_waitable(rx, service)
+        try:
+            for _ in range(3):
+                self.assertFalse(pacer.wait())
+        finally:
+            rx.close()
+
+        # Once per wait - no spinning until the tick is due.
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(pacer.woken, 0)
+
 
 # --------------------------------Unit Testing---------------------------------
 # --                      Main Command Line Entry Point                      --
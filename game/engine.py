@@ -826,9 +826,18 @@ class Engine(LogMixin, NamesMixin,
     def run(self) -> None:
         '''
         Loop of `self.run_tick()` until `self.stopped()` is True.
+
+        If TimeManager's pacer is enabled, game-loop (TICKS_LIFE) ticks are
+        paced to its ticks-per-second instead of running back-to-back.
+        Start-up and shut-down ticks are never paced. Anything that wakes the
+        pacer early (e.g. messages) is serviced between ticks; it does not get
+        a tick of its own, so game time only steps once per period.
         '''
+        pacer = self.meeting.time.pacer
         while not self.stopped(log_stopped=True):
             self.run_tick()
+            if pacer and self.life_cycle == SystemTick.TICKS_LIFE:
+                pacer.wait()
 
     def run_tick(self) -> Optional[VerediHealth]:
         '''
@@ -8,7 +8,7 @@ Events for the game engine itself.
 # Imports
 # -----------------------------------------------------------------------------
 
-from .ecs.event import Event
+from .ecs.event import Event, EventPriority
 
 
 # -----------------------------------------------------------------------------
@@ -22,6 +22,8 @@ class EngineEvent(Event,
     Base class for Veredi game Engine itself.
     '''
 
+    PRIORITY = EventPriority.ENGINE
+
     def __str__(self):
         return f"{self.klass}()"
 
@@ -14,7 +14,7 @@ import enum
 
 from veredi.base.context           import VerediContext
 from veredi.game.ecs.base.identity import MonotonicId
-from veredi.game.ecs.event         import Event
+from veredi.game.ecs.event         import Event, EventPriority
 
 
 # -----------------------------------------------------------------------------
@@ -24,6 +24,8 @@ from veredi.game.ecs.event         import Event
 class InputEvent(Event,
                  name_dotted='veredi.interface.input.event',
                  name_string='input'):
+    PRIORITY = EventPriority.INPUT
+
     # def __init__(self,
     #              id:           Union[int, MonotonicId],
     #              type:         Union[int, enum.Enum],
@@ -58,6 +60,8 @@ class InputEvent(Event,
 class UserInputEvent(Event,
                      name_dotted='veredi.interface.input.event.user',
                      name_string='input.user'):
+    PRIORITY = EventPriority.INPUT
+
     # -------------------------------------------------------------------------
     # To String
     # -------------------------------------------------------------------------
@@ -18,7 +18,8 @@ converts it into JSON for sending.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Union, Any, Awaitable, Iterable, Tuple, Literal)
+                    Optional, Union, Any, Awaitable, Iterable, Tuple, List,
+                    Literal)
 if TYPE_CHECKING:
     import re
 
@@ -150,6 +151,17 @@ class Mediator(ABC, LogMixin, NamesMixin):
         Queue for received data from this mediator to be passed to the game.
         '''
 
+        self._game_ready: asyncio.Event = asyncio.Event()
+        '''
+        Set by our asyncio loop (see `_game_reader_start()`) when the game pipe
+        has data to read.
+        '''
+
+        self._game_reader: bool = False
+        '''
+        True if the game pipe is registered as a reader with our asyncio loop.
+        '''
+
     def __init__(self, context: VerediContext) -> None:
         # ------------------------------
         # Make our vars first.
@@ -356,6 +368,16 @@ class Mediator(ABC, LogMixin, NamesMixin):
                    msg, ctx)
         return msg, ctx
 
+    def _game_pipe_get_all(self) -> List[Tuple[Message, MessageContext]]:
+        '''
+        Gets (no wait) everything the game pipe currently has for sending.
+        '''
+        batch = self._comms.recv_many()
+        self.debug("_game_pipe_get_all: "
+                   "Got {} from game pipe for sending.",
+                   len(batch))
+        return batch
+
     def _game_pipe_put(self, msg: Message, ctx: MessageContext) -> None:
         '''Puts data into game pipe for game to receive.'''
         self.debug("_game_pipe_get: "
@@ -364,6 +386,25 @@ class Mediator(ABC, LogMixin, NamesMixin):
                    msg, ctx)
         self._comms.send(msg, ctx)
 
+    def _game_pipe_put_all(self,
+                           batch: List[Tuple[Message, MessageContext]]
+                           ) -> None:
+        '''
+        Puts all of `batch` into game pipe for game to receive: as one batched
+        frame if our comms are batched, else one at a time.
+        '''
+        if not batch:
+            return
+        if not self._comms.batched:
+            for msg, ctx in batch:
+                self._game_pipe_put(msg, ctx)
+            return
+
+        self.debug("_game_pipe_put_all: "
+                   "Received {} into game pipe for game to process.",
+                   len(batch))
+        self._comms.send_many(batch)
+
     def _game_pipe_clear(self) -> None:
         '''
         Removes all current data for us in our side of the game pipe
@@ -375,6 +416,65 @@ class Mediator(ABC, LogMixin, NamesMixin):
         while self._game_has_data():
             self._game_pipe_get()
 
+    def _game_reader_start(self) -> bool:
+        '''
+        Registers the game pipe with the running asyncio loop so that
+        `self._game_ready` is set whenever the pipe has data.
+
+        Returns False if the loop can't watch the pipe (e.g. Windows' proactor
+        loop). `_game_pipe_wait()` falls back to polling in that case.
+        '''
+        try:
+            loop = asyncio.get_running_loop()
+            loop.add_reader(self._comms.pipe.fileno(), self._game_ready.set)
+        except (NotImplementedError, AttributeError, OSError, ValueError):
+            self.debug("_game_reader_start: Cannot watch game pipe; "
+                       "will poll it instead.")
+            return False
+
+        self._game_reader = True
+        return True
+
+    def _game_reader_stop(self) -> None:
+        '''
+        Unregisters the game pipe from the running asyncio loop, if
+        `_game_reader_start()` registered it.
+        '''
+        if not self._game_reader:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+            loop.remove_reader(self._comms.pipe.fileno())
+        except (NotImplementedError, AttributeError, OSError, ValueError):
+            # Pipe or loop is already gone; nothing left to unregister.
+            pass
+        self._game_reader = False
+
+    async def _game_pipe_wait(self) -> bool:
+        '''
+        Waits until the game pipe has data.
+
+        Returns True when it does. Returns False if we should shutdown
+        instead.
+        '''
+        while not self.any_shutdown():
+            if self._game_has_data():
+                return True
+
+            if not self._game_reader:
+                await self._continuing()
+                continue
+
+            # Clear, then check again so we can't miss data that arrived
+            # between the check above and the clear.
+            self._game_ready.clear()
+            if self._game_has_data():
+                return True
+            await self._game_ready.wait()
+
+        return False
+
     # ------------------------------
     # Mediator-RX -> Mediator-to-Game Queue
     # ------------------------------
@@ -404,6 +504,21 @@ class Mediator(ABC, LogMixin, NamesMixin):
                    msg, ctx)
         await self._med_to_game_queue.put((msg, ctx))
 
+    async def _med_to_game_get_all(self) -> List[Tuple[Message,
+                                                       MessageContext]]:
+        '''
+        Waits for data in _med_to_game_queue, then gets (no wait) everything
+        in it.
+        '''
+        batch = [await self._med_to_game_queue.get()]
+        while not self._med_to_game_queue.empty():
+            batch.append(self._med_to_game_queue.get_nowait())
+
+        self.debug("_med_to_game_get_all: "
+                   "Got {} from _med_to_game_queue to give to game.",
+                   len(batch))
+        return batch
+
     def _med_to_game_clear(self) -> None:
         '''
         Removes all current data for us from self._med_to_game_queue.
@@ -581,6 +696,18 @@ class Mediator(ABC, LogMixin, NamesMixin):
         # Shutdown has been signaled to us somehow; make sure we signal to
         # other processes/awaitables.
         self.set_all_shutdown()
+        self._wake_watchers()
+
+    def _wake_watchers(self) -> None:
+        '''
+        Wakes up any watchers that are waiting on the game pipe or on our
+        queues so that they can notice shutdown.
+
+        Queue watchers get a (None, None) message, which they ignore.
+        '''
+        self._game_ready.set()
+        self._med_to_game_queue.put_nowait((None, None))
+        self._med_rx_queue.put_nowait((None, None))
 
     async def _med_queue_watcher(self) -> None:
         '''
@@ -592,16 +719,10 @@ class Mediator(ABC, LogMixin, NamesMixin):
             if self.any_shutdown():
                 break
 
-            # Check for something in connection to send; don't block.
-            if not self._med_rx_has_data():
-                await self._continuing()
-                continue
-
-            # Else get one thing and process it.
-            msg, ctx = self._med_rx_get()
+            # Wait for something to process.
+            msg, ctx = await self._med_rx_queue.get()
             if not msg:
                 self.debug("_med_queue_watcher: received: {}", msg)
-                await self._continuing()
                 continue
 
             # Deal with this msg to us?
@@ -612,9 +733,6 @@ class Mediator(ABC, LogMixin, NamesMixin):
                     await self._med_tx_put(msg, ctx)
                     # Done; continue and reloop.
 
-            await self._continuing()
-            continue
-
     async def _test_watcher(self) -> None:
         '''
         Looks for a unit testing message to take from unit testing pipe and
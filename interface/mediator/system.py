@@ -23,7 +23,7 @@ MediatorServer.
 # ---
 from typing import (TYPE_CHECKING,
                     Optional, Union, Any, Type, Awaitable, Callable,
-                    Iterable, Set, Tuple, Literal)
+                    Iterable, Set, List, Tuple, Literal)
 from veredi.base.null import Null, null_to_none
 if TYPE_CHECKING:
     from decimal                   import Decimal
@@ -274,6 +274,12 @@ class MediatorSystem(System,
         total max per full tick cycle.
         '''
 
+        self._outbox: List[Tuple[Message, VerediContext]] = []
+        '''
+        Messages waiting to be sent to MediatorServer in one batch, if our IPC
+        is batched ('server.mediator.ipc.batched' config setting).
+        '''
+
         # ---
         # Context Stuff
         # ---
@@ -316,6 +322,16 @@ class MediatorSystem(System,
         # Grab ut flag from background?
         ut_flagged = background.testing.get_unit_testing()
 
+        # IPC: One message per send, or batches of them?
+        ipc_batched = bool(config.get('server', 'mediator', 'ipc', 'batched'))
+        ipc_compress = int(config.get('server', 'mediator', 'ipc', 'compress')
+                           or 0)
+        # IPC: Over a pipe, or shared memory?
+        ipc_transport = null_to_none(config.get('server', 'mediator',
+                                                'ipc', 'transport'))
+        ipc_size = null_to_none(config.get('server', 'mediator',
+                                           'ipc', 'shm-size'))
+
         # ...And get ready for running our sub-proc.
         self.server = multiproc.set_up(
             proc_name=self.dotted_server,
@@ -324,7 +340,11 @@ class MediatorSystem(System,
             entry_fn=_start_server,
             initial_log_level=initial_log_level,
             debug_flags=debug_flags,
-            unit_testing=ut_flagged)
+            unit_testing=ut_flagged,
+            ipc_batched=ipc_batched,
+            ipc_compress=ipc_compress,
+            ipc_transport=ipc_transport,
+            ipc_size=ipc_size)
 
     @property
     def _background(self):
@@ -474,8 +494,22 @@ class MediatorSystem(System,
         # ------------------------------
         # Send Message to MediatorServer
         # ------------------------------
+        if self.server.batched:
+            # Sent with the rest of this tick's messages.
+            self._outbox.append((send_msg, send_ctx))
+            return
         self.server.send(send_msg, send_ctx)
 
+    def _send_outbox(self) -> None:
+        '''
+        Sends all messages waiting in our outbox to MediatorServer as one
+        batch.
+        '''
+        if not self._outbox:
+            return
+        self.server.send_many(self._outbox)
+        self._outbox = []
+
     # -------------------------------------------------------------------------
     # Data Flow: MediatorServer -> Game
     # -------------------------------------------------------------------------
@@ -600,6 +634,11 @@ class MediatorSystem(System,
         # ------------------------------
         self.server.start()
 
+        # Let the engine's pacer wake up for messages from the server instead
+        # of sleeping through them.
+        self._manager.time.pacer.add_waitable(self.server.pipe,
+                                              self._service_messages)
+
         # Did a thing this tick so say we're PENDING...
         return VerediHealth.PENDING
 
@@ -712,17 +751,33 @@ class MediatorSystem(System,
         '''
         if max_messages is None:
             max_messages = self._msg_max_per_update
-        for i in range(max_messages):
-            # No data in pipe so we're done early.
-            if not self.server.has_data():
-                break
-
-            # Get message, context and process it.
-            message, context = self.server.recv()
+        for message, context in self.server.recv_many(max_messages):
             # Delivery can be vetoed by message_fn.
             if not message_fn or message_fn(message, context):
                 self._deliver_message(message, context)
 
+    def _service_messages(self) -> Optional[bool]:
+        '''
+        Called by the engine's pacer between game-loop ticks when the
+        MediatorServer's pipe has data. Reads and delivers messages (events
+        get queued for the next tick) and sends anything in our outbox; does
+        not step game time.
+
+        Returns True if more messages are ready to be read right now.
+        Returns None if we can't read the pipe right now (unhealthy, or the
+        pipe is closed), so the pacer stops waiting on it until next tick.
+        '''
+        if not self._healthy(SystemTick.POST):
+            return None
+
+        try:
+            self._get_external_messages()
+            self._send_outbox()
+            return self.server.has_data()
+        except (EOFError, OSError):
+            # Pipe is at EOF or closed; nothing we can service.
+            return None
+
     # -------------------------------------------------------------------------
     # Game Loop Tick Functions
     # -------------------------------------------------------------------------
@@ -748,6 +803,7 @@ class MediatorSystem(System,
         # Process messages in pipe.
         # ------------------------------
         self._get_external_messages()
+        self._send_outbox()
         return self._health_check(SystemTick.PRE)
 
     def _update_post(self) -> VerediHealth:
@@ -771,6 +827,7 @@ class MediatorSystem(System,
         # Process messages in pipe.
         # ------------------------------
         self._get_external_messages()
+        self._send_outbox()
         return self._health_check(SystemTick.POST)
 
     # -------------------------------------------------------------------------
@@ -826,6 +883,9 @@ class MediatorSystem(System,
 
         health = tick_health_init(SystemTick.AUTOPHAGY)
 
+        # Don't leave anything from the game sitting around.
+        self._send_outbox()
+
         if self.server.has_data():
             # (Try to) Process messages, with our autophagy ignore-messages
             # filter.
@@ -899,6 +959,8 @@ class MediatorSystem(System,
         self._health = self._health.update(VerediHealth.APOPTOSIS)
 
         # Start the teardown... We'll wait on it during _update_apoptosis().
+        self._send_outbox()
+        self._manager.time.pacer.remove_waitable(self.server.pipe)
         multiproc.nonblocking_tear_down_start(self.server)
 
         return VerediHealth.APOPTOSIS
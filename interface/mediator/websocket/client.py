@@ -250,7 +250,8 @@ class WebSocketClient(WebSocketMediator,
         '''
         if (self._debug
                 and self._debug.any(DebugFlag.MEDIATOR_BASE,
-                                    DebugFlag.MEDIATOR_CLIENT)):
+                                    DebugFlag.MEDIATOR_CLIENT)
+                and self._log_will_output(log.Group.DATA_PROCESSING)):
             msg = f"{self.name}: " + msg
             kwargs = log.incr_stack_level(kwargs)
             self._log_data_processing(self.dotted,
@@ -341,52 +342,35 @@ class WebSocketClient(WebSocketMediator,
     async def _queue_watcher(self) -> None:
         '''
         Loop waiting on messages in our _rx_queue to send down to the game.
+
+        Sleeps until the queue has something, then sends everything it has.
         '''
         while True:
             # Die if requested.
             if self.any_shutdown():
                 break
 
-            # Check for something in connection to send; don't block.
-            if not self._med_to_game_has_data():
-                await self._continuing()
-                continue
-
-            # Else get one thing and send it off this round.
-            try:
-                msg, ctx = self._med_to_game_get()
+            batch = []
+            for msg, ctx in await self._med_to_game_get_all():
                 self.debug("_queue_watcher (_med_to_game_queue->game_pipe): "
                            "_med_to_game_queue has message to process: "
                            "msg: {}, ctx: {}",
                            msg, ctx)
                 if not msg or not ctx:
-                    self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
+                    self.debug("_queue_watcher (_med_to_game_queue->game_pipe): "
                                "Got nothing for message to process? "
                                "Need both message and context! "
                                "msg: {}, ctx: {}",
                                msg, ctx)
-                    await self._continuing()
                     continue
-            except asyncio.QueueEmpty:
-                # get_nowait() got nothing. That's fine; go back to waiting.
-                await self._continuing()
-                continue
+                batch.append((msg, ctx))
 
             # Transfer from 'received from server queue' to
             # 'sent to game connection'.
-            self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
-                       "Send to game pipe: {}, {}",
-                       msg, ctx)
-            self._game_pipe_put(msg, ctx)
-
-            self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
-                       "Done processing message: {}, {}",
-                       msg, ctx)
-
-            # Skip this - we used get_nowait(), not get().
-            # self._rx_queue.task_done()
-            await self._continuing()
-            continue
+            self.debug("_queue_watcher (_med_to_game_queue->game_pipe): "
+                       "Send {} to game pipe.",
+                       len(batch))
+            self._game_pipe_put_all(batch)
 
     @contextmanager
     def _connect_manager(self) -> 'WebSocketClient':
@@ -95,11 +95,14 @@ class VebSocketServer(VebSocket):
 
         self._unregistered = unregister_fn
 
-        self.debug(f"host: {str(type(self._host))}({self._host}), "
-                   f"port: {str(type(self._port))}({self._port}), "
-                   f"secure: {str(type(secure))}({secure})")
+        self.debug("host: {}({}), "
+                   "port: {}({}), "
+                   "secure: {}({})",
+                   type(self._host), self._host,
+                   type(self._port), self._port,
+                   type(secure), secure)
 
-        self.debug(f"created {self.uri}...")
+        self.debug("created {}...", self.uri)
 
         # bad: self._server = websockets.serve(hello, "localhost", 8765)
         # bad: self._server = websockets.serve(hello, "::1", 8765)
@@ -138,11 +141,11 @@ class VebSocketServer(VebSocket):
 
         # Create it here, then... don't await it. Let self._a_wait_close() wait
         # on both server and our close flag.
-        self.debug(f"Starting server {self.uri}...")
+        self.debug("Starting server {}...", self.uri)
         self._listener = await websockets.serve(self.handler_ppc,
                                                 self._host,
                                                 self._port)
-        self.debug(f"Serving {self.uri}...")
+        self.debug("Serving {}...", self.uri)
         await self._a_wait_close(self._listener)
 
     # -------------------------------------------------------------------------
@@ -371,7 +374,7 @@ class ClientRegistry:
         Creates a User instance and indexes it by all the things we
         can get it by.
         '''
-        log.debug(f"Register user: {user_id} {user_key} {conn}")
+        log.debug("Register user: {} {} {}", user_id, user_key, conn)
 
         if not user_id or not conn:
             msg = ("UserId and UserConnToken required to register a user! "
@@ -403,7 +406,7 @@ class ClientRegistry:
         # 0) Find client using whatever was provided. This relies on Null/None
         # being returned if client not found.
         client = self.get(user_id, user_key, conn)
-        log.debug(f"Unregister user: {user_id} {user_key} {conn}")
+        log.debug("Unregister user: {} {} {}", user_id, user_key, conn)
 
         # Not registered, maybe?
         if not client:
@@ -690,7 +693,8 @@ class WebSocketServer(WebSocketMediator,
         '''
         if (self._debug
                 and self._debug.any(DebugFlag.MEDIATOR_BASE,
-                                    DebugFlag.MEDIATOR_SERVER)):
+                                    DebugFlag.MEDIATOR_SERVER)
+                and self._log_will_output(log.Group.DATA_PROCESSING)):
             msg = f"{self.name}: " + msg
             kwargs = log.incr_stack_level(kwargs)
             self._log_data_processing(self.dotted,
@@ -798,20 +802,16 @@ class WebSocketServer(WebSocketMediator,
         '''
         Deals with sending data in our queue out to the game over our
         multiprocessing connection to it.
+
+        Sleeps until the queue has something, then sends everything it has.
         '''
-        # Don't block...
         while True:
             if self.any_shutdown():
                 # Finish out of this coroutine if we should die.
                 return
 
-            if not self._med_to_game_has_data():
-                await self._continuing()
-                continue
-
-            # Else get one thing and send it off this round.
-            try:
-                msg, ctx = self._med_to_game_get()
+            batch = []
+            for msg, ctx in await self._med_to_game_get_all():
                 self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
                            "_med_to_game_queue has message to process: "
                            "msg: {}, ctx: {}",
@@ -822,113 +822,101 @@ class WebSocketServer(WebSocketMediator,
                                "Need both message and context! "
                                "msg: {}, ctx: {}",
                                msg, ctx)
-                    await self._continuing()
                     continue
-
-            except asyncio.QueueEmpty:
-                # get_nowait() got nothing. That's fine; go back to waiting.
-                await self._continuing()
-                continue
+                batch.append((msg, ctx))
 
             # Transfer from 'received from client queue' to
             # 'sent to game connection'.
             self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
-                       "Send to game pipe: {}, {}",
-                       msg, ctx)
-            self._game_pipe_put(msg, ctx)
-
-            self.debug("_to_game_watcher (_med_to_game_queue->game_pipe): "
-                       "Done processing message: {}, {}",
-                       msg, ctx)
-
-            # Skip this - we used get_nowait(), not get().
-            # self._rx_queue.task_done()
-            await self._continuing()
-            continue
+                       "Send {} to game pipe.",
+                       len(batch))
+            self._game_pipe_put_all(batch)
 
     async def _from_game_watcher(self) -> None:
         '''
         Watches game pipe. Gets messages from it and demarks for specific
         user(s).
-        '''
-        # Don't block...
-        while True:
-            if self.any_shutdown():
-                # Finish out of this coroutine if we should die.
-                return
-
-            if not self._game_has_data():
-                await self._continuing()
-                continue
-
-            # Else get one thing and send it off this round.
-            try:
-                msg, ctx = self._game_pipe_get()
-                self.debug("_from_game_watcher (game_pipe->client_queue): "
-                           "Got message from game to send: {} {}",
-                           msg, ctx)
-
-            except EOFError as error:
-                log.exception(error,
-                              "Failed getting from game pipe; "
-                              "ignoring and continuing.")
-                # EOFError gets raised if nothing left to receive or other end
-                # closed. Wait til we know what that means to our game/mediator
-                # pair before deciding to take (drastic?) action here...
-                await self._continuing()
-                continue
 
-            else:
-                # None/IGNORE check.
-                if not msg or not ctx:
-                    self.debug("_from_game_watcher (game_pipe->client_queue): "
-                               "Got nothing for message to process? "
-                               "Need both message and context! "
-                               "msg: {}, ctx: {}",
-                               msg, ctx)
-                    await self._continuing()
-                    continue
-                if msg.type == MsgType.IGNORE:
-                    self.debug("_from_game_watcher (game_pipe->client_queue): "
-                               "Ignoring IGNORE msg: {}",
-                               msg)
+        Sleeps until the game pipe has something, then processes everything
+        it has.
+        '''
+        self._game_reader_start()
+        try:
+            while await self._game_pipe_wait():
+                try:
+                    batch = self._game_pipe_get_all()
+
+                except EOFError as error:
+                    log.exception(error,
+                                  "Failed getting from game pipe; "
+                                  "ignoring and continuing.")
+                    # EOFError gets raised if nothing left to receive or other
+                    # end closed. Wait til we know what that means to our
+                    # game/mediator pair before deciding to take (drastic?)
+                    # action here... Give it a moment before trying again.
                     await self._continuing()
                     continue
 
-            # ---
-            # Multiple Recipients
-            # ---
+                for msg, ctx in batch:
+                    await self._from_game_process(msg, ctx)
+        finally:
+            self._game_reader_stop()
+
+    async def _from_game_process(self,
+                                 msg: Message,
+                                 ctx: MessageContext) -> None:
+        '''
+        Sends a message from the game pipe off to its recipient(s).
+        '''
+        self.debug("_from_game_watcher (game_pipe->client_queue): "
+                   "Got message from game to send: {} {}",
+                   msg, ctx)
+
+        # None/IGNORE check.
+        if not msg or not ctx:
             self.debug("_from_game_watcher (game_pipe->client_queue): "
-                       "Figuring out recipient(s): {} {}",
+                       "Got nothing for message to process? "
+                       "Need both message and context! "
+                       "msg: {}, ctx: {}",
                        msg, ctx)
+            return
+        if msg.type == MsgType.IGNORE:
+            self.debug("_from_game_watcher (game_pipe->client_queue): "
+                       "Ignoring IGNORE msg: {}",
+                       msg)
+            return
 
-            # Is it an Envelope? They can be addressed to many clients.
-            if msg.type == MsgType.ENVELOPE:
-                self.debug("_from_game_watcher (game_pipe->client_queue): "
-                           "Envelope - creating message for each recipient: "
-                           "{} {}",
-                           msg, ctx)
-                # Process the envelope message into client messages.
-                await self._envelope_to_messages(msg, ctx)
-                self.debug("_from_game_watcher (game_pipe->client_queue): "
-                           "Done processing envelope message.")
-
-                # Skip the rest of the steps - they're for non-envelopes.
-                await self._continuing()
-                continue
+        # ---
+        # Multiple Recipients
+        # ---
+        self.debug("_from_game_watcher (game_pipe->client_queue): "
+                   "Figuring out recipient(s): {} {}",
+                   msg, ctx)
 
-            # ---
-            # Single Recipient
-            # ---
+        # Is it an Envelope? They can be addressed to many clients.
+        if msg.type == MsgType.ENVELOPE:
             self.debug("_from_game_watcher (game_pipe->client_queue): "
-                       "Solo message - giving message to user: "
+                       "Envelope - creating message for each recipient: "
                        "{} {}",
                        msg, ctx)
-            await self._message_to_client(msg, ctx)
+            # Process the envelope message into client messages.
+            await self._envelope_to_messages(msg, ctx)
             self.debug("_from_game_watcher (game_pipe->client_queue): "
-                       "Done processing solo message.")
-            await self._continuing()
-            continue
+                       "Done processing envelope message.")
+
+            # Skip the rest of the steps - they're for non-envelopes.
+            return
+
+        # ---
+        # Single Recipient
+        # ---
+        self.debug("_from_game_watcher (game_pipe->client_queue): "
+                   "Solo message - giving message to user: "
+                   "{} {}",
+                   msg, ctx)
+        await self._message_to_client(msg, ctx)
+        self.debug("_from_game_watcher (game_pipe->client_queue): "
+                   "Done processing solo message.")
 
     # -------------------------------------------------------------------------
     # Game Message Processors
@@ -1100,11 +1088,11 @@ class WebSocketServer(WebSocketMediator,
         Read from client, send reply, close connection.
         '''
         uri = self._socket.uri
-        self.debug(f"_serve: Starting to serve: {uri}")
+        self.debug("_serve: Starting to serve: {}", uri)
         # await self._socket.serve_basic(self._handle_basic)
         await self._socket.serve_parallel(self._handle_produce,
                                           self._handle_consume)
-        self.debug(f"_serve: Done serving: {uri}")
+        self.debug("_serve: Done serving: {}", uri)
 
     def _hook_user_auth(self,
                         msg:     Optional[Message],
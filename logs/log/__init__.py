@@ -64,6 +64,8 @@ from .log import (
 
     will_output,
     format_pretty,
+    Lazy,
+    lazy_pretty,
     incr_stack_level,
 
     ultra_mega_debug,
@@ -169,6 +171,8 @@ __all__ = [
 
     'will_output',
     'format_pretty',
+    'Lazy',
+    'lazy_pretty',
     'incr_stack_level',
 
     'ultra_mega_debug',
@@ -25,6 +25,7 @@ from . import const as const_f
 
 from . import time
 from . import yaml
+from . import json
 
 
 # -----------------------------------------------------------------------------
@@ -42,6 +43,7 @@ __all__ = [
     # Types & Consts
     # ------------------------------
     'FormatInitTypes',
+    'FORMATTERS',
 
 
     # ------------------------------
@@ -57,10 +59,11 @@ __all__ = [
 FormatInitTypes = NewType('FormatInitTypes',
                           Union[logging.Formatter,
                                 Type[logging.Formatter],
+                                str,
                                 None])
 '''
-During init, can take a formatter instance, a formatter class, or None for
-default.
+During init, can take a formatter instance, a formatter class, a formatter
+name (from FORMATTERS), or None for default.
 '''
 
 
@@ -70,6 +73,14 @@ default.
 
 _DEFAULT_FORMATTER_CLASS = yaml.FormatYaml
 
+FORMATTERS = {
+    'yaml': yaml.FormatYaml,
+    'json': json.FormatJson,
+}
+'''
+Formatter name (e.g. from config's 'logging.format') -> formatter class.
+'''
+
 
 # -----------------------------------------------------------------------------
 # Variables
@@ -95,8 +106,16 @@ def init(logger:      logging.Logger,
     Initialize the handler/formatter provided and add them to the logger.
 
     If the formatter is a type we know (e.g. FormatYaml), create an instance of
-    that type.
+    that type. If it is a name in FORMATTERS, create an instance of that
+    formatter.
     '''
+    if isinstance(formatter, str):
+        try:
+            formatter = FORMATTERS[formatter.lower()]
+        except KeyError as error:
+            raise ValueError(f"Unknown log formatter '{formatter}'. "
+                             f"Expected one of: {list(FORMATTERS)}") from error
+
     if not formatter:
         formatter = _DEFAULT_FORMATTER_CLASS()
     elif isinstance(formatter, logging.Formatter):
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+'''
+Custom JSON-lines Formatter for Logging.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+# ------------------------------
+# JSON Formatted Logging
+# ------------------------------
+
+from . import record
+from .format import FormatJson
+
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    # ------------------------------
+    # File-Local
+    # ------------------------------
+    'init',
+
+    # ------------------------------
+    # Types & Consts
+    # ------------------------------
+
+    # ------------------------------
+    # Classes
+    # ------------------------------
+    'FormatJson',
+]
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+def init(fmt:      str  = None,
+         datefmt:  str  = None,
+         validate: bool = True) -> FormatJson:
+    '''
+    Initialize a JSON-lines formatter and return it.
+
+    Recommend leaving all params defaulted.
+    '''
+    return FormatJson(fmt=fmt,
+                      datefmt=datefmt,
+                      validate=validate)
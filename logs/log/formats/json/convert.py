@@ -0,0 +1,81 @@
+# coding: utf-8
+
+'''
+Offline conversion of JSON-lines logs (FormatJson) into the YAML log format
+(FormatYaml), for humans.
+
+Usage:
+  python -m veredi.logs.log.formats.json.convert [input.jsonl [output.yaml]]
+
+Reads stdin and/or writes stdout if input/output isn't given.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Iterable, List, TextIO
+
+import argparse
+import json
+import sys
+
+
+from ..yaml.record import LogRecordYaml
+
+
+# -----------------------------------------------------------------------------
+# Conversion
+# -----------------------------------------------------------------------------
+
+def to_yaml(lines:  Iterable[str],
+            output: TextIO) -> int:
+    '''
+    Converts each JSON log record line in `lines` to a YAML log record and
+    writes it to `output`. Blank lines are skipped.
+
+    Returns the number of records converted.
+    '''
+    record = LogRecordYaml()
+    converted = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        record.load(json.loads(line))
+        output.write(str(record))
+        # Same line terminator logging.StreamHandler would have added.
+        output.write('\n')
+        converted += 1
+    return converted
+
+
+# -----------------------------------------------------------------------------
+# Command Line
+# -----------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    '''
+    Convert a JSON-lines log file to a YAML log file.
+    '''
+    parser = argparse.ArgumentParser(
+        description="Convert Veredi JSON-lines logs to YAML logs.")
+    parser.add_argument('input',
+                        nargs='?',
+                        type=argparse.FileType('r', encoding='utf-8'),
+                        default=sys.stdin,
+                        help="JSON-lines log file (default: stdin)")
+    parser.add_argument('output',
+                        nargs='?',
+                        type=argparse.FileType('w', encoding='utf-8'),
+                        default=sys.stdout,
+                        help="YAML log file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    with args.input, args.output:
+        to_yaml(args.input, args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# coding: utf-8
+
+'''
+JSON-lines log format for Veredi Logger.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from veredi.base.strings import label
+
+from ..yaml.format       import FormatYaml
+from .record             import LogRecordJson
+
+
+# -----------------------------------------------------------------------------
+# The Record Formatter
+# -----------------------------------------------------------------------------
+
+class FormatJson(FormatYaml):
+    '''
+    Log to a JSON-lines format: one JSON object per record.
+
+    Fills out the same record fields as FormatYaml; just uses a LogRecordJson
+    to turn them into a string.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Constants
+    # -------------------------------------------------------------------------
+
+    _DOC_TYPE = label.normalize('veredi', 'log', 'formatter', 'json')
+    _DOTTED = _DOC_TYPE
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        super()._define_vars()
+
+        self._record_fmt: LogRecordJson = LogRecordJson()
+        '''
+        Ordered Collection for help creating our JSON record string of the
+        log record.
+        '''
@@ -0,0 +1,93 @@
+# coding: utf-8
+
+'''
+Veredi's log record as one line of JSON.
+
+Same fields and layout as LogRecordYaml, but dumped with the `json` module's
+C encoder instead of emitted as a YAML document, so it's much cheaper per
+record. Use `convert.py` to turn these into the YAML format for reading.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Any
+
+import enum
+import json
+
+
+from veredi.base.strings import label
+
+from ...                 import const as const_l
+from ..yaml.record       import LogRecordYaml
+
+
+# -----------------------------------------------------------------------------
+# The Record Format Itself
+# -----------------------------------------------------------------------------
+
+class LogRecordJson(LogRecordYaml):
+    '''
+    A helpful container for building a JSON-lines log record.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Layout
+    # -------------------------------------------------------------------------
+    # Record should become a string formatted approximately like so (but all
+    # on one line):
+    #   {"timestamp":"2021-02-21 21:11:50.146",
+    #    "level":{"name":"INFO","id":20},
+    #    "dotted":"veredi.repository.file-bare",
+    #    "python":{"module":"log","function":"group",...},
+    #    "group":{"name":"data-processing",
+    #             "dotted":"veredi.repository.file-bare"},
+    #    "success":{"normalized":"[_OK_]","verbatim":"[ OK ]","dry-run":true},
+    #    "context":{"DataBareContext":{...}},
+    #    "message":"Load..."}
+    #
+    # Optional, empty entries are left out, same as LogRecordYaml.
+
+    # -------------------------------------------------------------------------
+    # Constants
+    # -------------------------------------------------------------------------
+
+    _DOC_TYPE = label.normalize('veredi', 'log', 'json')
+    _DOTTED = _DOC_TYPE
+    _DOC_TYPE_TAG = '!' + _DOC_TYPE
+
+    _SEPARATORS = (',', ':')
+    '''Most compact separators for `json.dumps()`.'''
+
+    # -------------------------------------------------------------------------
+    # Formatting
+    # -------------------------------------------------------------------------
+
+    def _literal(self, string: str) -> str:
+        '''
+        JSON has no multi-line literals; just use the string.
+        '''
+        return string
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        '''
+        `json.dumps()` `default` for anything it can't serialize itself.
+        Matches how LogRecordYaml's YAML represents it.
+        '''
+        if isinstance(value, const_l.SuccessType):
+            return str(value)
+        if isinstance(value, enum.Enum):
+            return value.value
+        return str(value)
+
+    def __str__(self) -> str:
+        '''
+        Convert this formatted log record into a (single line) string.
+        '''
+        self.filter()
+        return json.dumps(self._dict_record,
+                          separators=self._SEPARATORS,
+                          default=self._default)
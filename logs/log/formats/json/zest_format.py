@@ -0,0 +1,136 @@
+# coding: utf-8
+
+'''
+Tests for the JSON-lines log formatter, and converting its logs to YAML.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, Literal
+
+import json as py_json
+import logging
+import sys
+from io import StringIO
+
+
+from veredi.zest.base.unit import ZestBase
+from veredi.base           import yaml
+from veredi.base.context   import UnitTestContext
+
+from ...                   import const as const_l
+from ...filter             import RecordGroup, RecordSuccess
+from ..                    import FORMATTERS
+from ..yaml                import FormatYaml
+from ..yaml.record         import LogRecordYaml
+
+
+# ------------------------------
+# What we're testing:
+# ------------------------------
+from .format  import FormatJson
+from .convert import to_yaml
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_FormatJson(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.json = FormatJson()
+        self.yaml = FormatYaml()
+
+    def tear_down(self):
+        self.json = None
+        self.yaml = None
+
+    def record(self, exception: bool = False) -> logging.LogRecord:
+        '''
+        Make a LogRecord with veredi's extra fields filled in.
+        '''
+        exc_info = None
+        if exception:
+            try:
+                raise ValueError("jeff is not a value")
+            except ValueError:
+                exc_info = sys.exc_info()
+
+        record = logging.LogRecord('veredi.zest.format.json',
+                                   logging.INFO,
+                                   __file__,
+                                   42,
+                                   "Hello, %s.\nSecond line.  ",
+                                   ('jeff', ),
+                                   exc_info,
+                                   func='record')
+        record.group = RecordGroup(const_l.Group.DATA_PROCESSING,
+                                   'veredi.zest.format.json')
+        record.success = RecordSuccess(const_l.SuccessType.SUCCESS,
+                                       const_l.SuccessType.SUCCESS,
+                                       True)
+        record.context = UnitTestContext(self,
+                                         'record',
+                                         data={'jeff': 1})
+        return record
+
+    def test_format(self):
+        line = self.json.format(self.record())
+        self.assertNotIn('\n', line)
+
+        data = py_json.loads(line)
+        self.assertEqual(list(data),
+                         ['timestamp', 'level', 'dotted', 'python', 'group',
+                          'success', 'context', 'message'])
+        self.assertEqual(data['level'], {'name': 'INFO', 'id': logging.INFO})
+        self.assertEqual(data['group']['name'],
+                         const_l.Group.DATA_PROCESSING.value)
+        self.assertEqual(data['success']['verbatim'],
+                         str(const_l.SuccessType.SUCCESS))
+        self.assertIs(data['success']['dry-run'], True)
+        self.assertEqual(data['message'], "Hello, jeff.\nSecond line.  ")
+
+        self.assertIs(FORMATTERS['json'], FormatJson)
+        self.assertIs(FORMATTERS['yaml'], FormatYaml)
+
+    def test_convert(self):
+        for exception in (False, True):
+            with self.subTest(exception=exception):
+                # Same record formatted both ways...
+                record = self.record(exception)
+                yaml_log = self.yaml.format(record) + '\n'
+                json_log = self.json.format(record) + '\n'
+
+                # ...converts to the same YAML records. (FormatYaml can use
+                # YAML aliases for repeated enums, so compare loaded records.)
+                output = StringIO()
+                self.assertEqual(to_yaml(StringIO(json_log + '\n' + json_log),
+                                         output),
+                                 2)
+                self.assertTrue(output.getvalue().startswith(
+                    '\n--- ' + LogRecordYaml.yaml_tag()))
+                self.assertEqual(list(yaml.safe_load_all(output.getvalue())),
+                                 list(yaml.safe_load_all(yaml_log + yaml_log)))
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.logs.log.formats.json.zest_format
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -10,7 +10,7 @@ etc.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Any, Type, NewType, Tuple)
+                    Optional, Any, Type, NewType, Mapping, Tuple)
 if TYPE_CHECKING:
     from veredi.base.context       import VerediContext
     from veredi.base.numbers.const import NumberTypes
@@ -400,6 +400,12 @@ class LogRecordYaml:
     # Sub-Entries
     # ------------------------------
 
+    def _literal(self, string: str) -> yaml.LiteralString:
+        '''
+        Returns `string` marked for output as a multi-line literal.
+        '''
+        return yaml.LiteralString(string)
+
     def _python(self, key: str, value: [str, 'NumberTypes']) -> None:
         '''
         Add a key/value pair to the 'python' sub-dictionary.
@@ -510,7 +516,7 @@ class LogRecordYaml:
         '''
         Set the message field.
         '''
-        self._dict_record['message'] = yaml.LiteralString(message)
+        self._dict_record['message'] = self._literal(message)
 
     def context(self, context: 'VerediContext') -> None:
         '''
@@ -602,10 +608,10 @@ class LogRecordYaml:
                             exception_info[2],
                             None,
                             stream)
-            self._error('exception-python', yaml.LiteralString(stream.getvalue()))
+            self._error('exception-python', self._literal(stream.getvalue()))
 
         if exception:
-            self._error('exception', yaml.LiteralString(str(exception)))
+            self._error('exception', self._literal(str(exception)))
 
     def stack(self,
               stack_info: Optional[str] = None,
@@ -614,10 +620,49 @@ class LogRecordYaml:
         Set the stack trace data.
         '''
         if stack_info:
-            self._error('stack-python', yaml.LiteralString(stack_info))
+            self._error('stack-python', self._literal(stack_info))
 
         if stack:
-            self._error('stack', yaml.LiteralString(stack))
+            self._error('stack', self._literal(stack))
+
+    # ------------------------------
+    # Loading
+    # ------------------------------
+
+    def load(self, data: Mapping[str, Any]) -> None:
+        '''
+        Reset this record and set its fields from `data`: an already
+        formatted record's dictionary (e.g. a deserialized LogRecordJson).
+        '''
+        self.reset()
+
+        self.timestamp(data.get('timestamp', None))
+        level = data.get('level', None)
+        if level:
+            self.level(level['id'])
+        self.logger_dotted(data.get('dotted', None))
+
+        python = dict(data.get('python', None) or {})
+        process = python.pop('process', None) or {}
+        thread = process.get('thread', None) or {}
+        for key, value in python.items():
+            self._python(key, value)
+        self.process_name(process.get('name', None))
+        self.process_id(process.get('id', None))
+        self.thread_name(thread.get('name', None))
+        self.thread_id(thread.get('id', None))
+
+        group = data.get('group', None) or {}
+        self.group(group.get('name', None), group.get('dotted', None))
+        for key, value in (data.get('success', None) or {}).items():
+            self._success(key, value)
+
+        if data.get('context', None):
+            self._dict_record['context'] = data['context']
+        self.message(data.get('message', None) or '')
+
+        for key, value in (data.get('error', None) or {}).items():
+            self._error(key, self._literal(value))
 
     # ------------------------------
     # Process Info
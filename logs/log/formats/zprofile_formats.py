@@ -0,0 +1,158 @@
+# coding: utf-8
+
+'''
+Profile/benchmark log formatters: records per second for FormatYaml vs
+FormatJson.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, List, Literal
+
+import logging
+import time
+
+
+from veredi.zest.base.unit import ZestBase
+from veredi.base.context   import UnitTestContext
+
+from ..                    import const as const_l
+from ..filter              import RecordGroup, RecordSuccess
+
+
+# ------------------------------
+# What we're testing:
+# ------------------------------
+from .yaml import FormatYaml
+from .json import FormatJson
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+RECORDS = 2000
+'''How many records to format per timing.'''
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class ZestFormatSpeed(ZestBase):
+    '''
+    Time formatting log records with each formatter.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Set-Up
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Defines any instance variables with type hinting, docstrs.
+        Happens ASAP during unittest.setUp().
+        '''
+        # ------------------------------
+        # Parent!
+        # ------------------------------
+        super()._define_vars()
+
+        self.records: List[logging.LogRecord] = []
+        '''The log records we're formatting.'''
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self) -> None:
+        '''
+        Make all the records up front so we're only timing formatting.
+        '''
+        for i in range(RECORDS):
+            record = logging.LogRecord('veredi.zest.format.speed',
+                                       logging.INFO,
+                                       __file__,
+                                       i,
+                                       "Record %d of %d.",
+                                       (i, RECORDS),
+                                       None,
+                                       func='set_up')
+            # Every other one gets all of veredi's extra fields.
+            if i % 2:
+                record.group = RecordGroup(const_l.Group.DATA_PROCESSING,
+                                           'veredi.zest.format.speed')
+                record.success = RecordSuccess(const_l.SuccessType.SUCCESS,
+                                               const_l.SuccessType.SUCCESS,
+                                               False)
+                record.context = UnitTestContext(self,
+                                                 'set_up',
+                                                 data={'record': i})
+            self.records.append(record)
+
+    # -------------------------------------------------------------------------
+    # Tear-Down
+    # -------------------------------------------------------------------------
+
+    def tear_down(self) -> None:
+        '''
+        Do any of our own clean-up.
+        '''
+        self.records = []
+
+    # -------------------------------------------------------------------------
+    # Test Helpers
+    # -------------------------------------------------------------------------
+
+    def records_per_second(self, formatter: logging.Formatter) -> float:
+        '''
+        Format all our records with `formatter`.
+
+        Returns records per second.
+        '''
+        start = time.perf_counter()
+        for record in self.records:
+            formatter.format(record)
+        return len(self.records) / (time.perf_counter() - start)
+
+    def report(self, rates: List[Tuple[str, float]]) -> None:
+        '''
+        Print the timings, if debugging.
+        '''
+        msg = ', '.join(f"{name}: {rate:,.0f} records/sec"
+                        for name, rate in rates)
+        if self.debugging:
+            print(msg)
+
+    # -------------------------------------------------------------------------
+    # Tests
+    # -------------------------------------------------------------------------
+
+    def test_records_per_second(self) -> None:
+        rates = []
+        for formatter in (FormatYaml(), FormatJson()):
+            rate = self.records_per_second(formatter)
+            self.assertGreater(rate, 0)
+            rates.append((formatter.__class__.__name__, rate))
+        self.report(rates)
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi run logs/log/formats/zprofile_formats.py
+
+if __name__ == '__main__':
+    import unittest
+    import cProfile
+    cProfile.run('unittest.main()',
+                 # filename='whatever'
+                 sort='time')
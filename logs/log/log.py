@@ -10,7 +10,7 @@ Logging utilities for Veredi.
 
 from typing import (TYPE_CHECKING,
                     Optional, Union, Any, NewType, Type, Callable,
-                    Mapping, MutableMapping, Iterable, Dict, List)
+                    Mapping, MutableMapping, Iterable, Tuple, Dict, List)
 if TYPE_CHECKING:
     from veredi.base.context    import VerediContext
 
@@ -56,6 +56,8 @@ __all__ = [
 
     'will_output',
     'format_pretty',
+    'Lazy',
+    'lazy_pretty',
     'incr_stack_level',
 
     'ultra_mega_debug',
@@ -344,6 +346,19 @@ def will_output(*args:         Union[const.LogLvlConversion, const.Group],
     return False
 
 
+def _dropped(level:         const.Level,
+             veredi_logger: LoggerInput = None) -> bool:
+    '''
+    Returns True if a log at `level` won't be output, so there's no point in
+    formatting it.
+
+    Always False while a unit test is watching logs (see `ut_set_up()`).
+    '''
+    if _unit_test_callback:
+        return False
+    return not will_output(level, veredi_logger=veredi_logger)
+
+
 # -----------------------------------------------------------------------------
 # Log Output Formatting
 # -----------------------------------------------------------------------------
@@ -377,6 +392,77 @@ def format_pretty(object:     object,
     return pretty
 
 
+class Lazy:
+    '''
+    A log message argument that isn't evaluated until the log message is
+    actually formatted - which only happens if the log will be output. E.g.:
+
+      log.debug("data: {}", log.Lazy(expensive_summary, data))
+      log.debug("data:\n{}", log.lazy_pretty(data, prefix='  '))
+
+    Result is evaluated at most once.
+    '''
+
+    __slots__ = ('_function', '_args', '_kwargs', '_result', '_evaluated')
+
+    def __init__(self,
+                 function: Callable[..., Any],
+                 *args:    Any,
+                 **kwargs: Any) -> None:
+        self._function: Callable[..., Any] = function
+        '''Called with `_args` and `_kwargs` to get the actual log argument.'''
+
+        self._args: Tuple[Any, ...] = args
+        '''Positional args for `_function`.'''
+
+        self._kwargs: Dict[str, Any] = kwargs
+        '''Keyword args for `_function`.'''
+
+        self._result: Any = None
+        '''`_function`'s result, once evaluated.'''
+
+        self._evaluated: bool = False
+        '''Has `_function` been called yet?'''
+
+    def evaluate(self) -> Any:
+        '''
+        Call our function (first time only) and return its result.
+        '''
+        if not self._evaluated:
+            self._result = self._function(*self._args, **self._kwargs)
+            self._evaluated = True
+        return self._result
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.evaluate(), format_spec)
+
+    def __str__(self) -> str:
+        return str(self.evaluate())
+
+    def __repr__(self) -> str:
+        return repr(self.evaluate())
+
+
+def lazy_pretty(object:     object,
+                prefix:     Optional[str] = None,
+                indent:     int           = 2,
+                width:      int           = 120,
+                depth:      Optional[int] = None,
+                compact:    bool          = False,
+                sort_dicts: bool          = True) -> Lazy:
+    '''
+    `format_pretty()`, but not until/unless the log is output.
+    '''
+    return Lazy(format_pretty,
+                object,
+                prefix=prefix,
+                indent=indent,
+                width=width,
+                depth=depth,
+                compact=compact,
+                sort_dicts=sort_dicts)
+
+
 # NOTE: Would make sense to puth these in formats/, but log.py owns the filter
 # right now so they're here for now.
 
@@ -738,6 +824,8 @@ def trace(msg:           str,
           veredi_logger: LoggerInput     = None,
           context:       'VerediContext' = None,
           **kwargs:      Any) -> None:
+    if _dropped(const.Level.TRACE, veredi_logger):
+        return
     log_kwargs = pop_log_kwargs(kwargs)
     output = _format(msg,
                      *args,
@@ -755,6 +843,8 @@ def debug(msg:           str,
           veredi_logger: LoggerInput     = None,
           context:       'VerediContext' = None,
           **kwargs:      Any) -> None:
+    if _dropped(const.Level.DEBUG, veredi_logger):
+        return
     log_kwargs = pop_log_kwargs(kwargs)
     output = _format(msg,
                      *args,
@@ -772,6 +862,8 @@ def info(msg:           str,
          veredi_logger: LoggerInput     = None,
          context:       'VerediContext' = None,
          **kwargs:      Any) -> None:
+    if _dropped(const.Level.INFO, veredi_logger):
+        return
     log_kwargs = pop_log_kwargs(kwargs)
     output = _format(msg,
                      *args,
@@ -789,6 +881,8 @@ def notice(msg:           str,
            veredi_logger: LoggerInput     = None,
            context:       'VerediContext' = None,
            **kwargs:      Any) -> None:
+    if _dropped(const.Level.NOTICE, veredi_logger):
+        return
     log_kwargs = pop_log_kwargs(kwargs)
     output = _format(msg,
                      *args,
@@ -0,0 +1,258 @@
+# coding: utf-8
+
+'''
+Test lazy log arguments, and check that our hot paths don't format log
+messages before knowing the log will be output.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Iterator, Tuple, List, Literal
+
+
+import ast
+
+
+from veredi.zest.base.unit  import ZestBase
+from veredi.base.const      import LIB_VEREDI_ROOT
+
+
+# ------------------------------
+# What we're testing:
+# ------------------------------
+from . import log
+from . import const
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+HOT_MODULES = (
+    'data/codec/codec.py',
+    'data/codec/registry.py',
+    'data/codec/index.py',
+    'data/repository/file/tree.py',
+    'interface/mediator/websocket/server.py',
+)
+'''
+Modules (relative to LIB_VEREDI_ROOT) whose logging runs per value, per file,
+or per message - so they should never format a log unless it'll be output.
+'''
+
+LAZY_LOG_FUNCS = frozenset((
+    'trace',
+    'debug',
+    'info',
+    'notice',
+    'group',
+    'data_processing',
+    'registration',
+    'parallel',
+    'start_up',
+    'shutdown',
+))
+'''
+Log functions (and `LogMixin._log_*` versions of them) that are expected to
+be dropped most of the time.
+'''
+
+EAGER_CALLS = frozenset((
+    'format_pretty',
+    'indented',
+    'str',
+    'repr',
+    'format',
+))
+'''
+Function/method names that format immediately if used as a log argument.
+'''
+
+GUARD_CALLS = frozenset((
+    'will_output',
+    '_log_will_output',
+))
+'''
+Log calls nested inside an `if` testing one of these are already lazy.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Eager Formatting Check
+# -----------------------------------------------------------------------------
+
+def _name(node: ast.AST) -> Optional[str]:
+    '''
+    Returns the called name of a Call's `func`: 'x' for `x()`, `a.b.x()`.
+    '''
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _is_log_call(node: ast.Call) -> bool:
+    '''
+    Is this a call to one of the LAZY_LOG_FUNCS (or a `_log_` version)?
+    '''
+    name = _name(node.func)
+    if not name or not isinstance(node.func, ast.Attribute):
+        return False
+    if name.startswith('_log_'):
+        name = name[len('_log_'):]
+    return name in LAZY_LOG_FUNCS
+
+
+def _eager(node: ast.AST) -> Optional[str]:
+    '''
+    Returns a reason if log argument `node` is formatted immediately, else
+    None.
+    '''
+    if isinstance(node, ast.JoinedStr):
+        if any(isinstance(value, ast.FormattedValue)
+               for value in node.values):
+            return 'f-string'
+        return None
+    if isinstance(node, ast.BinOp):
+        if (isinstance(node.op, ast.Mod)
+                and isinstance(node.left, (ast.Constant, ast.JoinedStr))):
+            return '%-format'
+        return _eager(node.left) or _eager(node.right)
+    if isinstance(node, ast.Call) and _name(node.func) in EAGER_CALLS:
+        return f'{_name(node.func)}()'
+    return None
+
+
+class _EagerFinder(ast.NodeVisitor):
+    '''
+    Collects (line, function, reason) for eagerly formatted log arguments.
+    '''
+
+    def __init__(self) -> None:
+        self.found: List[Tuple[int, str, str]] = []
+        self._guarded: int = 0
+
+    def visit_If(self, node: ast.If) -> None:
+        guarded = any(isinstance(child, ast.Call)
+                      and _name(child.func) in GUARD_CALLS
+                      for child in ast.walk(node.test))
+        self._guarded += guarded
+        for child in node.body:
+            self.visit(child)
+        self._guarded -= guarded
+        for child in node.orelse:
+            self.visit(child)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not self._guarded and _is_log_call(node):
+            arguments = list(node.args)
+            arguments.extend(keyword.value for keyword in node.keywords
+                             if keyword.arg is not None)
+            for argument in arguments:
+                reason = _eager(argument)
+                if reason:
+                    self.found.append((node.lineno, _name(node.func), reason))
+        self.generic_visit(node)
+
+
+def find_eager(path: str) -> Iterator[Tuple[int, str, str]]:
+    '''
+    Yields (line, log function, reason) for each log call in the module at
+    `path` that formats its message or arguments immediately, instead of
+    only when the log will be output.
+    '''
+    source = (LIB_VEREDI_ROOT / path).read_text()
+    finder = _EagerFinder()
+    finder.visit(ast.parse(source, filename=path))
+    yield from finder.found
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_LazyLog(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.calls = 0
+
+    def tear_down(self):
+        self.calls = None
+
+    def expensive(self, value):
+        self.calls += 1
+        return f"<{value}>"
+
+    def test_lazy(self):
+        lazy = log.Lazy(self.expensive, 'jeff')
+        self.assertEqual(self.calls, 0)
+        self.assertEqual("{}: {!s} {!r}".format(lazy, lazy, lazy),
+                         "<jeff>: <jeff> '<jeff>'")
+        # Evaluated only once.
+        self.assertEqual(self.calls, 1)
+
+        pretty = log.lazy_pretty({'b': 2, 'a': 1}, prefix='  ')
+        self.assertEqual(str(pretty),
+                         log.format_pretty({'b': 2, 'a': 1}, prefix='  '))
+
+    def test_dropped(self):
+        # Not evaluated if the log level drops it...
+        log.ut_tear_down()
+        with log.LoggingManager.at_level(const.Level.WARNING):
+            log.debug("{}", log.Lazy(self.expensive, 'jeff'))
+            log.info("{}", log.Lazy(self.expensive, 'jeff'))
+            log.data_processing('veredi.logs.log.zest_lazy',
+                                "{}", log.Lazy(self.expensive, 'jeff'))
+        self.assertEqual(self.calls, 0)
+
+        # ...but is if it doesn't.
+        with log.LoggingManager.at_level(const.Level.DEBUG):
+            log.debug("{}", log.Lazy(self.expensive, 'jeff'))
+        self.assertEqual(self.calls, 1)
+
+    def test_finder(self):
+        source = '''
+log.debug(f"x: {x}")
+log.debug("x: {}", x)
+log.debug("x: {}", log.format_pretty(x))
+log.debug("x: {}", log.lazy_pretty(x))
+self._log_data_processing(self.dotted, "x: " + str(x))
+log.warning(f"x: {x}")
+if log.will_output(log.Level.DEBUG):
+    log.debug(f"x: {x}")
+'''
+        finder = _EagerFinder()
+        finder.visit(ast.parse(source))
+        self.assertEqual(finder.found, [
+            (2, 'debug', 'f-string'),
+            (4, 'debug', 'format_pretty()'),
+            (6, '_log_data_processing', 'str()'),
+        ])
+
+    def test_hot_modules(self):
+        for path in HOT_MODULES:
+            with self.subTest(module=path):
+                self.assertEqual(list(find_eager(path)), [])
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.logs.log.zest_lazy
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -5,6 +5,10 @@ This is the client-side of a multiprocess/thread safe logger.
 
 It will set up log.py so that logs get routed to a log server instead of output
 through this process/thread/whatever.
+
+Logs can be sent one record at a time (`logging.handlers.SocketHandler`, which
+blocks the logging thread on TCP), or batched (`LogBatchHandler`, which just
+queues the record for a background thread to send).
 '''
 
 
@@ -12,10 +16,15 @@ through this process/thread/whatever.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import Union
+from typing import Optional, Union, Any, Dict, List
 
 import logging
 import logging.handlers
+import pickle
+import struct
+import threading
+import zlib
+from collections import deque
 
 from . import log
 
@@ -33,24 +42,296 @@ _socket_handler: logging.Handler = None
 _client_name: str = None
 
 
+FRAME_BATCH = b'vb:'
+'''
+Header for a batched frame: a pickled list of LogRecord dicts.
+
+Pickles start with a protocol opcode (b'\x80'), so a batch can't be mistaken
+for a single pickled LogRecord dict from a `logging.handlers.SocketHandler`.
+'''
+
+FRAME_BATCH_ZLIB = b'vz:'
+'''
+Header for a zlib-compressed batched frame.
+'''
+
+BUFFER_SIZE = 10000
+'''
+Default max number of records `LogBatchHandler` will hold waiting to be sent.
+Oldest are dropped to make room for new ones.
+'''
+
+BATCH_SIZE = 256
+'''
+Default number of records `LogBatchHandler` will send per frame. Reaching this
+many records also wakes up the sender.
+'''
+
+FLUSH_SECONDS = 0.1
+'''
+Default max seconds `LogBatchHandler` will wait before sending what it has.
+'''
+
+CLOSE_SECONDS = 5.0
+'''
+Max seconds `LogBatchHandler.close()` will wait for the sender to finish
+sending what it has.
+'''
+
+_EXC_FORMATTER = logging.Formatter()
+'''Just for formatting exceptions into `exc_text` in `record_dict()`.'''
+
+
+# -----------------------------------------------------------------------------
+# Framing
+# -----------------------------------------------------------------------------
+
+def record_dict(record: logging.LogRecord) -> Dict[str, Any]:
+    '''
+    Returns a picklable dict of `record`, the same way
+    `logging.handlers.SocketHandler.makePickle()` does: message merged with
+    its args, exception info formatted into `exc_text`.
+    '''
+    if record.exc_info and not record.exc_text:
+        record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+    data = dict(record.__dict__)
+    data['msg'] = record.getMessage()
+    data['args'] = None
+    data['exc_info'] = None
+    data.pop('message', None)
+    return data
+
+
+def encode_batch(records:  List[Dict[str, Any]],
+                 compress: int = 0) -> bytes:
+    '''
+    Returns a frame of `records` (from `record_dict()`): a 4 byte length, then
+    the batch header and pickled `records`.
+
+    If `compress` is non-zero and the pickled records are at least `compress`
+    bytes, they are zlib-compressed.
+    '''
+    data = pickle.dumps(records)
+    if compress and len(data) >= compress:
+        data = FRAME_BATCH_ZLIB + zlib.compress(data)
+    else:
+        data = FRAME_BATCH + data
+    return struct.pack('>L', len(data)) + data
+
+
+def decode_frame(data: bytes) -> List[Dict[str, Any]]:
+    '''
+    Decodes one frame's data (without its 4 byte length) into a list of
+    LogRecord dicts: just one if it was from a
+    `logging.handlers.SocketHandler`, or however many were in a batched frame.
+    '''
+    header = data[:len(FRAME_BATCH)]
+    if header == FRAME_BATCH:
+        return pickle.loads(data[len(FRAME_BATCH):])
+    if header == FRAME_BATCH_ZLIB:
+        return pickle.loads(zlib.decompress(data[len(FRAME_BATCH_ZLIB):]))
+    return [pickle.loads(data)]
+
+
+# -----------------------------------------------------------------------------
+# Batching Handler
+# -----------------------------------------------------------------------------
+
+class LogBatchHandler(logging.Handler):
+    '''
+    Queues up LogRecords and sends them to the log server in batches from a
+    background thread, so logging never waits on the socket.
+
+    At most `buffer_size` records are kept waiting; when full, the oldest
+    record is dropped for each new one (and counted in `dropped`).
+    '''
+
+    def __init__(self,
+                 host:        str,
+                 port:        int,
+                 name:        Optional[str] = None,
+                 buffer_size: int           = BUFFER_SIZE,
+                 batch_size:  int           = BATCH_SIZE,
+                 flush:       float         = FLUSH_SECONDS,
+                 compress:    int           = 0) -> None:
+        super().__init__()
+
+        self._buffer: deque = deque(maxlen=max(buffer_size, 1))
+        '''
+        LogRecord dicts waiting to be sent. Appending to a full one drops the
+        oldest.
+        '''
+
+        self._batch_size: int = max(batch_size, 1)
+        '''Max records per frame, and how many will wake up the sender.'''
+
+        self._flush: float = flush
+        '''Max seconds the sender waits before sending what it has.'''
+
+        self._compress: int = compress
+        '''
+        Compress frames of at least this many bytes. 0 means never compress.
+        '''
+
+        self._socket: logging.handlers.SocketHandler = (
+            logging.handlers.SocketHandler(host, port))
+        '''
+        Just used for its connect/retry/send; it never gets a LogRecord.
+        '''
+
+        self._wake: threading.Event = threading.Event()
+        '''Set to get the sender to send now.'''
+
+        self._closing: threading.Event = threading.Event()
+        '''Set to get the sender to send everything and then stop.'''
+
+        self.dropped: int = 0
+        '''
+        Number of records dropped (buffer full, or couldn't be pickled).
+        '''
+
+        self.sent: int = 0
+        '''Number of records sent (or at least given to the socket).'''
+
+        self._sender: threading.Thread = threading.Thread(
+            target=self._run,
+            name=f"{name or 'veredi'}.log_client",
+            daemon=True)
+        '''Background thread that does all the socket work.'''
+        self._sender.start()
+
+    # -------------------------------------------------------------------------
+    # Logging Thread(s)
+    # -------------------------------------------------------------------------
+
+    def emit(self, record: logging.LogRecord) -> None:
+        '''
+        Queue `record` to be sent.
+        '''
+        try:
+            data = record_dict(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(data)
+        if len(self._buffer) >= self._batch_size:
+            self._wake.set()
+
+    def flush(self) -> None:
+        '''
+        Wake up the sender to send what it has now. Doesn't wait for it.
+        '''
+        self._wake.set()
+
+    def close(self) -> None:
+        '''
+        Send everything queued (waiting at most CLOSE_SECONDS), then close the
+        socket.
+        '''
+        self._closing.set()
+        self._wake.set()
+        if (self._sender.is_alive()
+                and self._sender is not threading.current_thread()):
+            self._sender.join(CLOSE_SECONDS)
+        self._socket.close()
+        super().close()
+
+    # -------------------------------------------------------------------------
+    # Sender Thread
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        '''
+        Sender thread: send batches whenever woken up or every `_flush`
+        seconds, until closing and out of records.
+        '''
+        while True:
+            self._wake.wait(self._flush)
+            self._wake.clear()
+            closing = self._closing.is_set()
+            self._send_all()
+            if closing:
+                return
+
+    def _send_all(self) -> None:
+        '''
+        Send everything in the buffer, in batches of at most `_batch_size`.
+        '''
+        while self._buffer:
+            batch = []
+            while self._buffer and len(batch) < self._batch_size:
+                batch.append(self._buffer.popleft())
+            frame = self._encode(batch)
+            if frame:
+                self._socket.send(frame)
+
+    def _encode(self, batch: List[Dict[str, Any]]) -> Optional[bytes]:
+        '''
+        Encode `batch` into a frame. If that fails, encode just the records
+        that can be pickled, dropping the rest.
+        '''
+        try:
+            frame = encode_batch(batch, self._compress)
+            self.sent += len(batch)
+            return frame
+        except Exception:
+            pass
+
+        picklable = []
+        for data in batch:
+            try:
+                pickle.dumps(data)
+                picklable.append(data)
+            except Exception:
+                self.dropped += 1
+        if not picklable:
+            return None
+        self.sent += len(picklable)
+        return encode_batch(picklable, self._compress)
+
+
 # -----------------------------------------------------------------------------
 # Code
 # -----------------------------------------------------------------------------
 
 
 def init(client_name: str,
-         level:       Union[log.Level, int, None] = log.DEFAULT_LEVEL) -> None:
+         level:       Union[log.Level, int, None] = log.DEFAULT_LEVEL,
+         batched:     bool                        = False,
+         compress:    int                         = 0,
+         buffer_size: Optional[int]               = None,
+         flush:       Optional[float]             = None) -> None:
     '''
     Initialize log.py for non-local logging.
+
+    If `batched`, logs are sent by a `LogBatchHandler` instead of one at a time
+    by a `logging.handlers.SocketHandler`. `compress`, `buffer_size`, and
+    `flush` are for the LogBatchHandler (None for default).
     '''
     global _client_name
     _client_name = client_name
 
     # We'll use a socket handler to send out the logs.
     global _socket_handler
-    _socket_handler = logging.handlers.SocketHandler(
-        'localhost',
-        logging.handlers.DEFAULT_TCP_LOGGING_PORT)
+    if batched:
+        _socket_handler = LogBatchHandler(
+            'localhost',
+            logging.handlers.DEFAULT_TCP_LOGGING_PORT,
+            name=client_name,
+            buffer_size=(BUFFER_SIZE
+                         if buffer_size is None else
+                         buffer_size),
+            flush=(FLUSH_SECONDS
+                   if flush is None else
+                   flush),
+            compress=compress)
+    else:
+        _socket_handler = logging.handlers.SocketHandler(
+            'localhost',
+            logging.handlers.DEFAULT_TCP_LOGGING_PORT)
 
     # Don't bother with a formatter, since a socket handler sends the event as
     # an unformatted pickle.
@@ -59,7 +340,7 @@ def init(client_name: str,
              formatter=None,
              reinitialize=True)
     # log.set_level(level)
-    log.debug(f"log_client init: {_client_name}")
+    log.debug("log_client init: {} (batched: {})", _client_name, batched)
 
 def close():
     '''
@@ -12,12 +12,11 @@ logs from one game/server are well-formatted and in one place.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Optional, Any, Dict, List
 
 import multiprocessing
 from multiprocessing.connection import Connection as mp_conn
 from ctypes import c_int
-import pickle
 import logging
 import logging.handlers
 import socketserver
@@ -26,7 +25,8 @@ import select
 from datetime import datetime
 
 
-from .                          import log
+from veredi.base.null           import null_to_none
+from .                          import log, log_client
 from veredi.parallel            import multiproc
 from veredi.debug.const         import DebugFlag
 from veredi.data                import background
@@ -51,13 +51,19 @@ class LogServerComm(multiproc.ProcToSubComm):
                  shutdown:        multiprocessing.Event                 = None,
                  ignore_logs:     multiprocessing.Event                 = None,
                  ignored_counter: multiprocessing.Value                 = None,
-                 ut_pipe:            mp_conn = None
+                 ut_pipe:            mp_conn = None,
+                 batched:         bool                                  = False,
+                 compress:        int                                   = 0,
+                 child_pipe:      mp_conn = None
                  ) -> None:
         super().__init__(name=name,
                          process=process,
                          pipe=pipe,
                          shutdown=shutdown,
-                         ut_pipe=ut_pipe)
+                         ut_pipe=ut_pipe,
+                         batched=batched,
+                         compress=compress,
+                         child_pipe=child_pipe)
         self.ignore_logs = ignore_logs
         self.ignored_counter = ignored_counter
 
@@ -85,14 +91,18 @@ class LogServerSub(multiproc.SubToProcComm):
                  ignore_logs:     multiprocessing.Event = None,
                  ignored_counter: multiprocessing.Value = None,
                  debug_flags:     Optional[DebugFlag]   = None,
-                 ut_pipe:         Optional[mp_conn]     = None) -> None:
+                 ut_pipe:         Optional[mp_conn]     = None,
+                 batched:         bool                  = False,
+                 compress:        int                   = 0) -> None:
         super().__init__(name=name,
                          config=config,
                          entry_fn=entry_fn,
                          pipe=pipe,
                          shutdown=shutdown,
                          debug_flags=debug_flags,
-                         ut_pipe=ut_pipe)
+                         ut_pipe=ut_pipe,
+                         batched=batched,
+                         compress=compress)
         self.ignore_logs = ignore_logs
         self.ignored_counter = ignored_counter
 
@@ -124,23 +134,27 @@ class LogRecordStreamHandler(socketserver.StreamRequestHandler):
     def handle(self) -> None:
         '''
         Handle multiple requests - each expected to be a 4-byte length,
-        followed by the LogRecord in pickle format. Logs the record
-        according to whatever policy is configured locally.
+        followed by either a LogRecord in pickle format, or a batch of them
+        from a `log_client.LogBatchHandler`. Logs the record(s) according to
+        whatever policy is configured locally.
         '''
         while True:
-            chunk = self.connection.recv(4)
+            chunk = self.rfile.read(4)
             if len(chunk) < 4:
                 break
             slen = struct.unpack('>L', chunk)[0]
-            chunk = self.connection.recv(slen)
-            while len(chunk) < slen:
-                chunk = chunk + self.connection.recv(slen - len(chunk))
-            obj = self.unpickle(chunk)
-            record = logging.makeLogRecord(obj)
-            self.handle_log_record(record)
+            chunk = self.rfile.read(slen)
+            if len(chunk) < slen:
+                break
+            for obj in self.unpickle(chunk):
+                record = logging.makeLogRecord(obj)
+                self.handle_log_record(record)
 
-    def unpickle(self, data: bytes) -> object:
-        return pickle.loads(data)
+    def unpickle(self, data: bytes) -> List[Dict[str, Any]]:
+        '''
+        Returns the LogRecord dict(s) in the frame `data`.
+        '''
+        return log_client.decode_frame(data)
 
     def handle_log_record(self, record: logging.LogRecord) -> None:
         # Check if we should be ignoring log records (unit testing).
@@ -300,7 +314,13 @@ def run(comms: multiproc.SubToProcComm, context: VerediContext = None) -> None:
     # Set Up Logging, Init Server
     # ------------------------------
     log_level = ConfigContext.log_level(context)
-    log.init(level=log_level)
+    # Formatter: 'yaml' (default) or e.g. 'json' for JSON lines.
+    log_format = (null_to_none(comms.config.get('logging', 'format'))
+                  if comms.config else
+                  None)
+    log.init(level=log_level,
+             formatter=log_format,
+             reinitialize=bool(log_format))
     # TODO [2020-09-12]: Ideally init would stick the level but that wasn't
     # the case back when I started doing the multiproc stuff... Check
     # again/fix.
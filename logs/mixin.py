@@ -16,7 +16,8 @@ lumberjack.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Union, Any, Type, MutableMapping, Iterable)
+                    Optional, Union, Any, Type, Callable,
+                    MutableMapping, Iterable)
 if TYPE_CHECKING:
     from veredi.base.context import VerediContext
 
@@ -120,6 +121,17 @@ class LogMixin:
         '''
         return self._lumberjack.will_output(*args)
 
+    def _log_lazy(self,
+                  function: Callable[..., Any],
+                  *args:    Any,
+                  **kwargs: Any) -> log.Lazy:
+        '''
+        Wrap an expensive log message argument so that `function(*args,
+        **kwargs)` is only called if the log is actually output. See
+        `log.Lazy`.
+        '''
+        return log.Lazy(function, *args, **kwargs)
+
     def _log_stack(self,
                    amount: int = 1,
                    **kwargs: Any) -> MutableMapping[Any, Any]:
@@ -0,0 +1,173 @@
+# coding: utf-8
+
+'''
+Tests for log_client.py's batched log shipping, and log_server.py decoding it.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, List, Literal
+
+import logging
+import logging.handlers
+import threading
+import time
+
+
+from veredi.zest.base.unit import ZestBase
+
+
+# ------------------------------
+# What we're testing:
+# ------------------------------
+from . import log_client
+from . import log_server
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+WAIT_SECONDS = 5.0
+'''Max seconds to wait for the server to receive records.'''
+
+
+# -----------------------------------------------------------------------------
+# Mockups
+# -----------------------------------------------------------------------------
+
+class ZestRecordHandler(log_server.LogRecordStreamHandler):
+    '''
+    Collects received records on the server instead of logging them.
+    '''
+
+    def handle_log_record(self, record: logging.LogRecord) -> None:
+        with self.server.records_lock:
+            self.server.records.append(record)
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_LogClient(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.shutdown = threading.Event()
+        self.server = log_server.LogRecordSocketReceiver(
+            self.shutdown,
+            port=0,
+            handler=ZestRecordHandler)
+        self.server.records = []
+        self.server.records_lock = threading.Lock()
+        self.port = self.server.server_address[1]
+        self.serving = threading.Thread(
+            target=self.server.serve_until_stopped,
+            daemon=True)
+        self.serving.start()
+
+    def tear_down(self):
+        self.shutdown.set()
+        self.serving.join()
+        self.server.server_close()
+        self.server = None
+        self.serving = None
+
+    def record(self, number: int) -> logging.LogRecord:
+        return logging.makeLogRecord({
+            'name': 'veredi.zest.log_client',
+            'levelno': logging.INFO,
+            'levelname': 'INFO',
+            'msg': 'record %d of %s',
+            'args': (number, 'jeff'),
+        })
+
+    def received(self, count: int) -> List[logging.LogRecord]:
+        '''
+        Wait (a bit) for the server to have `count` records, then return what
+        it has.
+        '''
+        deadline = time.monotonic() + WAIT_SECONDS
+        while time.monotonic() < deadline:
+            with self.server.records_lock:
+                if len(self.server.records) >= count:
+                    break
+            time.sleep(0.01)
+        with self.server.records_lock:
+            return list(self.server.records)
+
+    def test_frames(self):
+        records = [log_client.record_dict(self.record(i)) for i in range(50)]
+        self.assertEqual(records[1]['msg'], 'record 1 of jeff')
+        self.assertIsNone(records[1]['args'])
+
+        for compress in (0, 1):
+            with self.subTest(compress=compress):
+                frame = log_client.encode_batch(records, compress)
+                header = (log_client.FRAME_BATCH_ZLIB
+                          if compress else
+                          log_client.FRAME_BATCH)
+                self.assertEqual(frame[4:4 + len(header)], header)
+                self.assertEqual(log_client.decode_frame(frame[4:]), records)
+
+    def test_batched(self):
+        handler = log_client.LogBatchHandler('localhost', self.port,
+                                             batch_size=16,
+                                             compress=256)
+        for i in range(100):
+            handler.handle(self.record(i))
+        handler.close()
+
+        records = self.received(100)
+        self.assertEqual([record.getMessage() for record in records],
+                         [f'record {i} of jeff' for i in range(100)])
+        self.assertEqual(handler.sent, 100)
+        self.assertEqual(handler.dropped, 0)
+
+    def test_socket_handler(self):
+        # Server still takes one-at-a-time records too.
+        handler = logging.handlers.SocketHandler('localhost', self.port)
+        for i in range(3):
+            handler.handle(self.record(i))
+        handler.close()
+
+        records = self.received(3)
+        self.assertEqual([record.getMessage() for record in records],
+                         [f'record {i} of jeff' for i in range(3)])
+
+    def test_drop_oldest(self):
+        # Never woken up by size or time, so nothing goes out until close().
+        handler = log_client.LogBatchHandler('localhost', self.port,
+                                             buffer_size=4,
+                                             batch_size=10,
+                                             flush=60)
+        for i in range(10):
+            handler.handle(self.record(i))
+        self.assertEqual(handler.dropped, 6)
+        handler.close()
+
+        records = self.received(4)
+        self.assertEqual([record.getMessage() for record in records],
+                         [f'record {i} of jeff' for i in range(6, 10)])
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.logs.zest_log_client
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
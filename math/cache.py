@@ -0,0 +1,202 @@
+# coding: utf-8
+
+'''
+Resolution cache for MathSystem: remembers what an entity's math variables
+canonicalized and filled in to, and which resolved values were built from
+which others, so e.g. a cached 'strength.modifier' gets dropped when
+'strength.score' changes.
+
+Derived stats are read much more often than they are written, so this saves
+re-canonicalizing and re-querying the same names every time they come up.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import (TYPE_CHECKING,
+                    Optional, Any, Iterable, Tuple, Set, Dict)
+if TYPE_CHECKING:
+    from veredi.game.ecs.base.component import Component
+
+
+from veredi.base                    import numbers
+from veredi.game.data.component     import DataComponent
+from veredi.game.ecs.base.identity  import ComponentId
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+CACHE_VALUE_TYPES = numbers.NumberTypesTuple + (str, )
+'''
+Fill values we'll cache: numbers and math strings. Anything else (e.g. Null
+for "not found") is not remembered.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Code
+# -----------------------------------------------------------------------------
+
+class MathCache:
+    '''
+    One entity's resolved math variables, for one canonicalize/fill source.
+
+    Invalidated by the entity's DataComponents changing - see `sync()`.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._canon: Dict[Tuple[str, Optional[str]], str] = {}
+        '''(moniker, milieu) -> canonical name.'''
+
+        self._values: Dict[str, Tuple[Any, str]] = {}
+        '''Canonical name -> (value, milieu) it was filled in with.'''
+
+        self._dependents: Dict[str, Set[str]] = {}
+        '''
+        Canonical name -> canonical names whose values were resolved using it.
+        E.g. 'strength.score' -> {'strength.modifier'}
+        '''
+
+        self._revisions: Dict[ComponentId, int] = {}
+        '''DataComponent's ID -> its revision when we last synced.'''
+
+    def __init__(self) -> None:
+        self._define_vars()
+
+    # -------------------------------------------------------------------------
+    # Canonical Names
+    # -------------------------------------------------------------------------
+
+    def canonical(self,
+                  moniker: str,
+                  milieu:  Optional[str]) -> Optional[str]:
+        '''
+        Returns the cached canonical name for `moniker` in `milieu`, or None.
+        '''
+        return self._canon.get((moniker, milieu), None)
+
+    def set_canonical(self,
+                      moniker: str,
+                      milieu:  Optional[str],
+                      canon:   str) -> None:
+        '''
+        Remember that `moniker` in `milieu` canonicalizes to `canon`.
+        '''
+        self._canon[(moniker, milieu)] = canon
+
+    # -------------------------------------------------------------------------
+    # Values
+    # -------------------------------------------------------------------------
+
+    def get(self, canon: str) -> Optional[Tuple[Any, str]]:
+        '''
+        Returns cached (value, milieu) for the canonical name, or None.
+        '''
+        return self._values.get(canon, None)
+
+    def set(self, canon: str, value: Any, milieu: str) -> bool:
+        '''
+        Cache the canonical name's (value, milieu), if it is a cacheable type
+        of value.
+
+        Returns True if cached.
+        '''
+        if not isinstance(value, CACHE_VALUE_TYPES):
+            return False
+        self._values[canon] = (value, milieu)
+        return True
+
+    def depend(self, canon: str, dependent: str) -> None:
+        '''
+        Record that `dependent`'s value was resolved using `canon`'s value, so
+        `dependent` must be dropped whenever `canon` is.
+        '''
+        if canon == dependent:
+            return
+        self._dependents.setdefault(canon, set()).add(dependent)
+
+    def __contains__(self, canon: str) -> bool:
+        return canon in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def invalidate(self, *canons: str) -> Set[str]:
+        '''
+        Drop the canonical names and everything resolved using them
+        (transitively).
+
+        Returns the set of canonical names dropped.
+        '''
+        dropped = set()
+        pending = list(canons)
+        while pending:
+            canon = pending.pop()
+            if canon in dropped:
+                continue
+            dropped.add(canon)
+            self._values.pop(canon, None)
+            pending.extend(self._dependents.pop(canon, ()))
+        return dropped
+
+    def clear(self) -> None:
+        '''
+        Drop everything (except the component revisions).
+        '''
+        self._canon.clear()
+        self._values.clear()
+        self._dependents.clear()
+
+    def sync(self, components: Iterable['Component']) -> bool:
+        '''
+        Check the entity's DataComponents for changes since we last synced,
+        and invalidate whatever changed.
+
+        Returns False if there are no DataComponents to watch for changes (so
+        nothing should be cached), else True.
+        '''
+        watching = False
+        for component in components:
+            if not isinstance(component, DataComponent):
+                continue
+            watching = True
+
+            seen = self._revisions.get(component.id, None)
+            if seen == component.revision:
+                continue
+
+            changes = (None
+                       if seen is None else
+                       component.changes_since(seen))
+            if changes is None:
+                # New component or wholesale data change.
+                self.clear()
+            else:
+                self.invalidate(*changes)
+            self._revisions[component.id] = component.revision
+
+        return watching
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self._values})"
+
+    def __repr__(self) -> str:
+        return '<v.math.cache:' + str(self) + '>'
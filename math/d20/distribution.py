@@ -0,0 +1,357 @@
+# coding: utf-8
+
+'''
+Roll distributions for d20 trees: exactly (by convolution) or by sampling
+lots of rolls at once.
+
+For GM tools and balance checks, e.g. "what does `1d20 + ${str.mod}` look
+like?" Variables need their values filled in first, same as for evaluating.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import (Optional, Union, Any, Callable,
+                    Iterable, Sequence, List, Dict)
+
+import operator
+from fractions import Fraction
+
+
+from veredi.base         import numbers
+
+from ..exceptions        import MathError
+from .                   import tree
+from .                   import roller
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+PERCENTILES_DEFAULT = (5, 25, 50, 75, 95)
+'''Percentiles `Distribution.summary()` includes by default.'''
+
+
+# -----------------------------------------------------------------------------
+# Operators
+# -----------------------------------------------------------------------------
+
+def _operator(node: tree.Branch) -> Callable[[Any, Any], Any]:
+    '''
+    Returns the Python operator function for a math branch node.
+    '''
+    try:
+        return node.py_operator
+    except (AttributeError, NotImplementedError) as error:
+        raise MathError(f"No operator known for node: {node}",
+                        data={
+                            'node': node,
+                        }) from error
+
+
+def _sign(node: tree.Leaf) -> int:
+    '''
+    Returns 1 or -1 for the leaf's unary sign.
+
+    Only needed for dice - constants and variables have their sign applied to
+    their value already.
+    '''
+    return -1 if node._sign < 0 else 1
+
+
+def _variable_value(node: tree.Variable) -> numbers.NumberTypes:
+    '''
+    Returns the variable's value, or raises MathError if it doesn't have one.
+    '''
+    if node.value is None:
+        raise MathError(f"Variable '{node.moniker}' has no value. "
+                        "Variables must be filled in first.",
+                        data={
+                            'node': node,
+                        })
+    return node.value
+
+
+# -----------------------------------------------------------------------------
+# Exact Distribution
+# -----------------------------------------------------------------------------
+
+class Distribution:
+    '''
+    Exact distribution of a roll: every possible value and how many of the
+    equally likely outcomes give it.
+
+    Counts are ints, so probabilities are exact (`Fraction`s) until asked for
+    as floats.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._counts: Dict[numbers.NumberTypes, int] = {}
+        '''Value -> number of outcomes that give that value.'''
+
+        self._total: int = 0
+        '''Total number of outcomes.'''
+
+    def __init__(self, counts: Dict[numbers.NumberTypes, int]) -> None:
+        self._define_vars()
+
+        self._counts = dict(sorted(counts.items()))
+        self._total = sum(self._counts.values())
+
+    @classmethod
+    def constant(klass: 'Distribution',
+                 value: numbers.NumberTypes) -> 'Distribution':
+        '''
+        Distribution of a constant: always `value`.
+        '''
+        return klass({value: 1})
+
+    @classmethod
+    def dice(klass: 'Distribution',
+             dice:  int,
+             faces: int) -> 'Distribution':
+        '''
+        Distribution of rolling `dice` dice of `faces` faces each and summing
+        them up.
+        '''
+        # counts[i]: ways to roll a total of i (+ number of dice rolled).
+        counts = [1]
+        for _ in range(dice):
+            # Convolve with one more die. Running window sum of the last
+            # `faces` counts is the number of ways to get each new total.
+            rolled = [0] * (len(counts) + faces - 1)
+            window = 0
+            for i in range(len(rolled)):
+                if i < len(counts):
+                    window += counts[i]
+                if i >= faces:
+                    window -= counts[i - faces]
+                rolled[i] = window
+            counts = rolled
+
+        return klass({dice + i: count for i, count in enumerate(counts)})
+
+    # -------------------------------------------------------------------------
+    # Combining
+    # -------------------------------------------------------------------------
+
+    def combine(self,
+                other: 'Distribution',
+                op:    Callable[[Any, Any], Any]) -> 'Distribution':
+        '''
+        Distribution of `op(self, other)` for independent `self` and `other`:
+        the convolution for add/sub, and the general case for anything else.
+        '''
+        counts = {}
+        for left, left_count in self._counts.items():
+            for right, right_count in other._counts.items():
+                try:
+                    value = op(left, right)
+                except ZeroDivisionError as error:
+                    raise MathError("Roll distribution divides by zero.",
+                                    data={
+                                        'left': left,
+                                        'right': right,
+                                    }) from error
+                counts[value] = counts.get(value, 0) + left_count * right_count
+        return Distribution(counts)
+
+    def negate(self) -> 'Distribution':
+        '''
+        Distribution of `-self`.
+        '''
+        return Distribution({-value: count
+                             for value, count in self._counts.items()})
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    @property
+    def min(self) -> numbers.NumberTypes:
+        '''Lowest possible value.'''
+        return next(iter(self._counts))
+
+    @property
+    def max(self) -> numbers.NumberTypes:
+        '''Highest possible value.'''
+        return next(reversed(self._counts))
+
+    @property
+    def mean(self) -> float:
+        '''Expected value.'''
+        return float(sum(Fraction(value) * count
+                         for value, count in self._counts.items())
+                     / self._total)
+
+    def probability(self, value: numbers.NumberTypes) -> Fraction:
+        '''
+        Exact probability of rolling exactly `value`.
+        '''
+        return Fraction(self._counts.get(value, 0), self._total)
+
+    def pmf(self) -> Dict[numbers.NumberTypes, float]:
+        '''
+        Probability mass function: value -> probability of rolling it.
+        '''
+        return {value: count / self._total
+                for value, count in self._counts.items()}
+
+    def percentile(self, percent: numbers.NumberTypes) -> numbers.NumberTypes:
+        '''
+        Smallest value that at least `percent` percent of rolls are less than
+        or equal to.
+        '''
+        needed = Fraction(percent) / 100 * self._total
+        cumulative = 0
+        for value, count in self._counts.items():
+            cumulative += count
+            if cumulative >= needed:
+                return value
+        return self.max
+
+    def summary(self,
+                percentiles: Iterable[numbers.NumberTypes] = PERCENTILES_DEFAULT
+                ) -> Dict[str, Any]:
+        '''
+        Returns dict of min, max, mean, and `percentiles` (percent -> value).
+        '''
+        return {
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'percentiles': {percent: self.percentile(percent)
+                            for percent in percentiles},
+        }
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        '''Number of distinct possible values.'''
+        return len(self._counts)
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"min: {self.min}, max: {self.max}, mean: {self.mean:.3f})")
+
+    def __repr__(self) -> str:
+        return '<v.distribution:' + str(self) + '>'
+
+
+def distribution(root: tree.Node) -> Distribution:
+    '''
+    Exact distribution of the d20 tree `root`. No rolling involved.
+
+    Variables must have their values filled in first. Every dice node is
+    independent of the others (as they are when rolled).
+    '''
+    if isinstance(root, tree.Dice):
+        dist = Distribution.dice(root.dice, root.faces)
+        return dist.negate() if _sign(root) < 0 else dist
+
+    if isinstance(root, tree.Variable):
+        return Distribution.constant(_variable_value(root))
+
+    if isinstance(root, tree.Constant):
+        return Distribution.constant(root.value)
+
+    if isinstance(root, tree.Branch):
+        op = _operator(root)
+        dist = None
+        for child in root.children:
+            child_dist = distribution(child)
+            dist = (child_dist
+                    if dist is None else
+                    dist.combine(child_dist, op))
+        return dist
+
+    raise MathError(f"Cannot get distribution of unknown node: {root}",
+                    data={
+                        'node': root,
+                    })
+
+
+# -----------------------------------------------------------------------------
+# Sampling
+# -----------------------------------------------------------------------------
+
+Samples = Union[numbers.NumberTypes, Sequence[numbers.NumberTypes]]
+'''
+One value for all the samples (e.g. a constant), or one value per sample.
+'''
+
+
+def _apply(op: Callable[[Any, Any], Any],
+           left: Samples,
+           right: Samples) -> Samples:
+    '''
+    Apply `op` sample by sample. NumPy arrays do this themselves.
+    '''
+    if roller.vectorized() or not (isinstance(left, list)
+                                   or isinstance(right, list)):
+        return op(left, right)
+    if not isinstance(right, list):
+        return [op(each, right) for each in left]
+    if not isinstance(left, list):
+        return [op(left, each) for each in right]
+    return [op(each_left, each_right)
+            for each_left, each_right in zip(left, right)]
+
+
+def _sample(root: tree.Node, count: int) -> Samples:
+    '''
+    Sample `count` rolls of `root`.
+    '''
+    if isinstance(root, tree.Dice):
+        totals = roller.roll_totals(root.dice, root.faces, count)
+        if roller.vectorized():
+            totals = roller.numpy.asarray(totals)
+        return _apply(operator.mul, totals, _sign(root))
+
+    if isinstance(root, tree.Variable):
+        return _variable_value(root)
+
+    if isinstance(root, tree.Constant):
+        return root.value
+
+    if isinstance(root, tree.Branch):
+        op = _operator(root)
+        samples = None
+        for child in root.children:
+            child_samples = _sample(child, count)
+            samples = (child_samples
+                       if samples is None else
+                       _apply(op, samples, child_samples))
+        return samples
+
+    raise MathError(f"Cannot sample unknown node: {root}",
+                    data={
+                        'node': root,
+                    })
+
+
+def sample(root: tree.Node, count: int) -> List[numbers.NumberTypes]:
+    '''
+    Roll the d20 tree `root` `count` times, all at once. Returns each roll's
+    total. Does not change the tree.
+
+    Variables must have their values filled in first.
+    '''
+    samples = _sample(root, count)
+    if roller.vectorized() and hasattr(samples, 'tolist'):
+        samples = samples.tolist()
+    if not isinstance(samples, list):
+        # No dice - same every time.
+        samples = [samples] * count
+    return samples
@@ -14,7 +14,9 @@ Some code used from Lark's calc example:
 # -----------------------------------------------------------------------------
 
 from typing import (Optional, Any, Type, NewType, Protocol,
-                    Iterable, MutableMapping)
+                    Iterable, MutableMapping, Tuple)
+
+from collections import OrderedDict
 
 import lark  # Lark, Transformer, Visitor, v_args
 
@@ -75,8 +77,12 @@ var: "$" NAME_STRICT
 // ---
 // Alias out to die/dice instead of optional amount.
 // Lets me know more explicitly which is which.
-?roll: ("d"|"D") INT            -> die
-     | INT ("d"|"D") INT        -> dice
+?roll: _D INT                   -> die
+     | INT _D INT               -> dice
+
+// The 'd' in '1d12'/'d20'. Only a 'd' if followed by a number, and higher
+// priority than names, so the lexer never takes 'd20' as a NAME_FUNC.
+_D.2: /[dD](?=[0-9])/
 
 // ---
 // Names:
@@ -85,7 +91,10 @@ var: "$" NAME_STRICT
 //  - Strict can exist more on their own. So they need to not be
 //    confusable with math. But I do need/want period for dotted names.
 
-NAME_LAX: LETTER (LETTER | DIGIT | "." | " " | ":" | "(" | "_" | "-")* (LETTER | ")")
+// Lax Names are only ever followed by '=' (assignment) or '}' (in ${...}).
+// Lookahead for that, so the lexer can tell 'max' in "max(1, 2)" (NAME_FUNC)
+// from 'jeff' in "jeff = 10" (NAME_LAX).
+NAME_LAX.3: /[a-zA-Z][a-zA-Z0-9. :(_-]*[a-zA-Z)](?=\\s*[=}])/
 
 NAME_STRICT: LETTER (LETTER | DIGIT | "." | "_")* (LETTER | DIGIT)
 
@@ -98,9 +107,12 @@ NAME_FUNC: CNAME
 %import common.DIGIT
 %import common.WORD
 %import common.CNAME
-%import common.NUMBER
+%import common.FLOAT
 %import common.INT
 
+// Just floats - ints are INT. Otherwise the lexer can't tell which "10" is.
+NUMBER: FLOAT
+
 %import common.WS_INLINE
 %ignore WS_INLINE
 
@@ -112,13 +124,16 @@ NAME_FUNC: CNAME
 # -----------------------------------------------------------------------------
 
 class Parser:
-    # LALR parser doesn't like the ambiguity between INTs and dice... It thinks
-    # that "1d12" is the number 1 and wtf is "d". I do not know enough
-    # EBNF/LALR/whatever to fix it or know if it's possible to fix...
+    # LALR w/ contextual lexer: only considers the terminals that are valid
+    # where it is in the grammar, and the grammar's terminal priorities and
+    # lookaheads settle the rest (e.g. "1d12" is INT, _D, INT; not INT, NAME).
     #
-    # Maybe this to fix ambiguity?
-    # https://github.com/lark-parser/lark/blob/master/docs/grammar.md#priority
-    parser = lark.Lark(grammar)
+    # `cache`: Lark serializes the compiled parser to a temp file keyed on the
+    # grammar & options, and loads that instead of compiling on later runs.
+    parser = lark.Lark(grammar,
+                       parser='lalr',
+                       lexer='contextual',
+                       cache=True)
 
     @classmethod
     def parse(klass: Type['Parser'], text: str) -> tree.Node:
@@ -313,6 +328,18 @@ class D20Parser(MathParser,
         A string to insert into the `milieu` of any tree.Variable returned.
         '''
 
+        self._cache: OrderedDict[Tuple[str, Optional[str]], tree.Node] = (
+            OrderedDict()
+        )
+        '''
+        LRU cache of (string, milieu) -> parsed & transformed math tree.
+
+        These are templates - never give them out. Give out a `clone()`.
+        '''
+
+    CACHE_SIZE = 1024
+    '''Max number of parsed trees to keep in the LRU cache.'''
+
     def _set_up(self, milieu: Optional[str]) -> None:
         '''
         Initialize/reset/clear/whatever our instance variables in prep for next
@@ -330,6 +357,30 @@ class D20Parser(MathParser,
         '''
         Parse input `string` and return the resultant MathTree, or None if
         parsing/transforming failed at some point.
+
+        Returns a fresh tree every time, even when cached, so it is the
+        caller's to evaluate/change.
+        '''
+        key = (string, milieu)
+        template = self._cache.get(key)
+        if template is not None:
+            self._cache.move_to_end(key)
+            return template.clone()
+
+        template = self._parse(string, milieu)
+        if template is None:
+            return None
+
+        self._cache[key] = template
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return template.clone()
+
+    def _parse(self,
+               string: str,
+               milieu: Optional[str] = None) -> Optional['MathTree']:
+        '''
+        Actually parse and transform input `string` (no cache).
         '''
         # Set milieu and clear any old vars, also set up our xformer.
         self._set_up(milieu)
@@ -0,0 +1,85 @@
+# coding: utf-8
+
+'''
+Dice rolling for d20 trees.
+
+Small rolls go through `veredi.base.random` one die at a time, same as
+always. Big rolls (and many rolls at once) are done in batches: vectorized
+with NumPy if it is installed, or with `random.choices()` if not. Either way
+the randomness comes from `veredi.base.random`, so seeding it makes all rolls
+reproducible.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+from veredi.base import random
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+VECTOR_MIN = 32
+'''
+Roll at least this many dice at once to use the batched/vectorized roller.
+Below it, per-die overhead is less than the batch set-up.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Vectorized Randomness
+# -----------------------------------------------------------------------------
+
+def _rng() -> 'numpy.random.Generator':
+    '''
+    Returns a NumPy random generator seeded from `veredi.base.random`, so that
+    seeding it (or replacing it via `random.singleton()`) applies to
+    vectorized rolls too.
+    '''
+    return numpy.random.default_rng(random.getrandbits(64))
+
+
+def vectorized() -> bool:
+    '''
+    Returns True if big rolls are vectorized (i.e. we have NumPy).
+    '''
+    return numpy is not None
+
+
+# -----------------------------------------------------------------------------
+# Rolling
+# -----------------------------------------------------------------------------
+
+def roll(dice: int, faces: int) -> List[int]:
+    '''
+    Roll `dice` dice of `faces` faces each. Returns each die's result.
+    '''
+    if dice < VECTOR_MIN:
+        return [random.randint(1, faces) for _ in range(dice)]
+
+    if numpy is not None:
+        return _rng().integers(1, faces + 1, size=dice).tolist()
+    return random.choices(range(1, faces + 1), k=dice)
+
+
+def roll_totals(dice: int, faces: int, count: int) -> List[int]:
+    '''
+    Roll `dice` dice of `faces` faces each, `count` times. Returns the total
+    of each of the `count` rolls.
+    '''
+    if numpy is not None:
+        return _rng().integers(1, faces + 1,
+                               size=(count, dice)).sum(axis=1).tolist()
+
+    sides = range(1, faces + 1)
+    return [sum(random.choices(sides, k=dice)) for _ in range(count)]
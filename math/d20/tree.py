@@ -8,7 +8,7 @@ Tree base classes for a d20 roll tree.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import (TYPE_CHECKING, Optional, Any, Type, Dict, List)
+from typing import (TYPE_CHECKING, Optional, Any, Type, Callable, Dict, List)
 if TYPE_CHECKING:
     import re
 
@@ -16,16 +16,19 @@ from abc import ABC, abstractmethod
 
 
 from functools import reduce
+import operator
 
 
-from veredi.base         import random, numbers
+from veredi.base         import numbers
 from veredi.data.codec   import (Codec,
                                  Encodable,
                                  EncodedComplex,
                                  EncodedSimple)
 
-from ..parser            import MathTree, NodeType, VTags
+from ..parser            import (MathTree, NodeType, VTags,
+                                 FINAL_VALUE_TYPES)
 from .const              import FormatOptions
+from .                   import roller
 
 
 # TODO [2020-10-28]: Type hinting for this file.
@@ -323,6 +326,28 @@ class Leaf(Node,
         '''
         return str(self)
 
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def value(self) -> Any:
+        '''
+        This leaf's value, with its sign already applied.
+        '''
+        return self._value
+
+    @value.setter
+    def value(self, new_value: Any) -> None:
+        '''
+        Set value if allowed by NodeType. A negated leaf (e.g. '-$str')
+        negates the value it is given.
+        Raise AttributeError if not allowed.
+        '''
+        if self._sign < 0 and isinstance(new_value, FINAL_VALUE_TYPES):
+            new_value = -new_value
+        MathTree.value.fset(self, new_value)
+
     # -------------------------------------------------------------------------
     # Unary Operators
     # -------------------------------------------------------------------------
@@ -332,6 +357,8 @@ class Leaf(Node,
         Negate this leaf (i.e. flip the sign).
         '''
         self._sign = self._sign * -1
+        if isinstance(self._value, FINAL_VALUE_TYPES):
+            self._value = -self._value
 
     def pos(self) -> None:
         '''
@@ -391,12 +418,10 @@ class Dice(Leaf,
         and saving results internally.
         '''
         # Roll each die, record result.
-        self.roll = []
-        for i in range(self.dice):
-            self.roll.append(random.randint(1, self.faces))
+        self.roll = roller.roll(self.dice, self.faces)
 
-        # Save total as value.
-        self._value = sum(self.roll)
+        # Save (signed) total as value.
+        self._value = sum(self.roll) * self._sign
 
     def _expr_str(self, options: FormatOptions = None) -> str:
         '''
@@ -509,7 +534,6 @@ class Constant(Leaf,
         return (
             f"{self.klass}"
             f"("
-            f"{'-' if self._sign < 0 else ''}"
             f"{self._value}"
             f")"
         )
@@ -835,6 +859,16 @@ class OperatorMath(Branch,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    @abstractmethod
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''
+        The Python operator function for this node's math, for things that
+        work on plain values instead of nodes (compiled trees, distributions).
+        '''
+        raise NotImplementedError(f"{self.klass}.py_operator is "
+                                  "not implemented.")
+
     def _expr_str(self, options: FormatOptions = None) -> str:
         '''
         String for this node's math expression representation.
@@ -863,6 +897,11 @@ class OperatorAdd(OperatorMath,
                          OperatorAdd.STR_UNICODE,
                          tags)
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return operator.add
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
@@ -929,6 +968,11 @@ class OperatorSub(OperatorMath,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return operator.sub
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
@@ -995,6 +1039,11 @@ class OperatorMult(OperatorMath,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return operator.mul
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
@@ -1083,6 +1132,13 @@ class OperatorDiv(OperatorMath,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return (operator.truediv
+                if self.truediv else
+                operator.floordiv)
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
@@ -1153,6 +1209,11 @@ class OperatorMod(OperatorMath,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return operator.mod
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
@@ -1220,6 +1281,11 @@ class OperatorPow(OperatorMath,
     # Node Functions
     # -------------------------------------------------------------------------
 
+    @property
+    def py_operator(self) -> Callable[[Any, Any], Any]:
+        '''Python operator function for this node's math.'''
+        return operator.pow
+
     def _evaluate_children(self,
                            left: 'Node',
                            right: 'Node') -> numbers.NumberTypes:
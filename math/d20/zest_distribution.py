@@ -0,0 +1,162 @@
+# coding: utf-8
+
+'''
+Unit tests for:
+  veredi/math/d20/distribution.py
+  veredi/math/d20/roller.py
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, Literal
+
+from fractions import Fraction
+
+
+from veredi.zest.base.unit import ZestBase
+from veredi.base           import random
+
+from ..exceptions          import MathError
+from ..evaluator           import Evaluator
+from .                     import parser
+from .                     import roller
+from .                     import distribution
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_Distribution(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.parser = parser.D20Parser(None)
+
+    def tear_down(self):
+        self.parser = None
+
+    def parse(self, string, **values):
+        '''
+        Parse `string` and fill in variables from `values`.
+        '''
+        math = self.parser.parse(string)
+        for node in math.walk():
+            if node.moniker in values:
+                node.value = values[node.moniker]
+        return math
+
+    def test_roll(self):
+        # Small and large (batched/vectorized) rolls.
+        for dice in (3, roller.VECTOR_MIN * 4):
+            rolled = roller.roll(dice, 6)
+            self.assertEqual(len(rolled), dice)
+            self.assertTrue(all(1 <= each <= 6 for each in rolled))
+            self.assertTrue(all(isinstance(each, int) for each in rolled))
+
+        totals = roller.roll_totals(40, 6, 100)
+        self.assertEqual(len(totals), 100)
+        self.assertTrue(all(40 <= each <= 240 for each in totals))
+
+    def test_roll_seeded(self):
+        # Batched/vectorized rolls must obey veredi.base.random's seed.
+        dice = roller.VECTOR_MIN * 2
+        rolls = []
+        for _ in range(2):
+            random.seed(1234)
+            rolls.append((roller.roll(dice, 20),
+                          roller.roll_totals(dice, 20, 10)))
+        self.assertEqual(rolls[0], rolls[1])
+
+        # ...and not just be the same every time.
+        random.seed(4321)
+        self.assertNotEqual(roller.roll(dice, 20), rolls[0][0])
+
+    def test_dice(self):
+        dist = distribution.Distribution.dice(2, 6)
+        self.assertEqual((dist.min, dist.max), (2, 12))
+        self.assertEqual(len(dist), 11)
+        self.assertEqual(dist.probability(7), Fraction(6, 36))
+        self.assertEqual(dist.probability(2), Fraction(1, 36))
+        self.assertEqual(dist.probability(13), 0)
+        self.assertAlmostEqual(dist.mean, 7.0)
+        self.assertAlmostEqual(sum(dist.pmf().values()), 1.0)
+
+        # Big ones are fine too.
+        dist = distribution.Distribution.dice(40, 6)
+        self.assertEqual((dist.min, dist.max), (40, 240))
+        self.assertAlmostEqual(dist.mean, 140.0)
+
+    def test_tree(self):
+        math = self.parse("1d20 + ${str.mod}", **{'str.mod': 3})
+        dist = distribution.distribution(math)
+        summary = dist.summary(percentiles=(5, 50, 100))
+        self.assertEqual(summary['min'], 4)
+        self.assertEqual(summary['max'], 23)
+        self.assertAlmostEqual(summary['mean'], 13.5)
+        self.assertEqual(summary['percentiles'], {5: 4, 50: 13, 100: 23})
+
+        # Tree wasn't rolled or changed.
+        self.assertIsNone(math.value)
+
+        # Unary minus and non-additive operators.
+        dist = distribution.distribution(self.parse("-d4 * 2"))
+        self.assertEqual((dist.min, dist.max), (-8, -2))
+        dist = distribution.distribution(self.parse("(2d6 + 1) // 2"))
+        self.assertEqual((dist.min, dist.max), (1, 6))
+
+        # Variables must be filled in.
+        with self.assertRaises(MathError):
+            distribution.distribution(self.parse("d20 + $unknown"))
+
+    def test_sample(self):
+        math = self.parse("1d20 + ${str.mod}", **{'str.mod': 3})
+        samples = distribution.sample(math, 1000)
+        self.assertEqual(len(samples), 1000)
+        self.assertTrue(all(4 <= each <= 23 for each in samples))
+        # 1000 rolls of a d20: would be astronomically unlucky to miss these.
+        self.assertIn(4, samples)
+        self.assertIn(23, samples)
+
+        self.assertEqual(distribution.sample(self.parse("2 + 3"), 3),
+                         [5, 5, 5])
+
+    def test_negated_leaves(self):
+        # Distribution, sampling, and evaluating must all agree on unary minus.
+        for string, values, low, high in (
+                ("10 + -2",        {},           8,  8),
+                ("-3 + 1d4",       {},          -2,  1),
+                ("-${str.mod} + 1", {'str.mod': 3}, -2, -2),
+                ("5 - -1d4",       {},           6,  9)):
+            with self.subTest(string=string):
+                dist = distribution.distribution(self.parse(string, **values))
+                self.assertEqual((dist.min, dist.max), (low, high))
+
+                samples = distribution.sample(self.parse(string, **values),
+                                              100)
+                self.assertTrue(all(low <= each <= high
+                                    for each in samples))
+
+                for _ in range(20):
+                    total = Evaluator.eval(self.parse(string, **values))
+                    self.assertTrue(low <= total <= high, total)
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.math.d20.zest_distribution
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -410,7 +410,8 @@ class Test_Transformer(ZestBase):
 
         # Make sure we only have what we input.
         self.assertTrue(isinstance(roll_tree, tree.Constant))
-        self.assertEqual(roll_tree.value, 20)
+        # Value has the sign applied.
+        self.assertEqual(roll_tree.value, -20)
         self.assertEqual(roll_tree._sign, -1)
 
     def test_pos(self):
@@ -506,7 +507,75 @@ class Test_Transformer(ZestBase):
     # TODO: test transform with milieu value
 
 
-# TODO [2020-12-04]: Make a test of D20Parser.
+# -----------------------------------------------------------------------------
+# Test::D20Parser (Input String -> Veredi tree)
+# -----------------------------------------------------------------------------
+
+class Test_D20Parser(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__,
+                           extra=('d20-parser', ))
+
+    def set_up(self):
+        self.parser = parser.D20Parser(None)
+
+    def tear_down(self):
+        self.parser = None
+
+    def test_dice(self):
+        # LALR must not mistake dice for numbers or function names.
+        roll_tree = self.parser.parse("1d12 + d20 - $dex")
+        self.assertIsInstance(roll_tree, tree.OperatorSub)
+        add, variable = roll_tree.children
+        self.assertIsInstance(add, tree.OperatorAdd)
+        self.assertIsInstance(variable, tree.Variable)
+        self.assertIsInstance(add.children[0], tree.Dice)
+        self.assertEqual((add.children[0].dice, add.children[0].faces),
+                         (1, 12))
+        self.assertEqual((add.children[1].dice, add.children[1].faces),
+                         (1, 20))
+
+    def test_cache(self):
+        string = "(${this.score} - 10) // 2"
+        first = self.parser.parse(string, 'strength')
+        self.assertEqual(len(self.parser._cache), 1)
+
+        # Cached, but a new tree each time.
+        second = self.parser.parse(string, 'strength')
+        self.assertEqual(len(self.parser._cache), 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(str(first), str(second))
+        self.assertIsNot(first.children[0], second.children[0])
+
+        # Changing one mustn't change the other, or the cached template.
+        variable = first.children[0].children[0]
+        self.assertIsInstance(variable, tree.Variable)
+        self.assertEqual(variable.milieu, 'strength')
+        variable.value = 14
+        self.assertEqual(variable.value, 14)
+        self.assertIsNone(second.children[0].children[0].value)
+        third = self.parser.parse(string, 'strength')
+        self.assertIsNone(third.children[0].children[0].value)
+
+        # Milieu is part of the key.
+        other = self.parser.parse(string, 'dexterity')
+        self.assertEqual(len(self.parser._cache), 2)
+        self.assertEqual(other.children[0].children[0].milieu, 'dexterity')
+
+    def test_cache_size(self):
+        self.parser.CACHE_SIZE = 2
+        self.parser.parse("1")
+        self.parser.parse("2")
+        self.parser.parse("1")
+        self.parser.parse("3")
+        # "2" was least recently used.
+        self.assertEqual(list(self.parser._cache),
+                         [("1", None), ("3", None)])
 
 
 # --------------------------------Unit Testing---------------------------------
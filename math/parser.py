@@ -16,6 +16,7 @@ from abc import ABC, abstractmethod
 # from queue import Queue, LifoQueue
 from collections import deque
 import enum
+import copy
 from decimal import Decimal
 
 from veredi.logs               import log
@@ -219,6 +220,24 @@ class MathTree(Encodable, ABC):
         self._tags: VTags = tags or None
         '''Tags, traits, whatever.'''
 
+    # -------------------------------------------------------------------------
+    # Copying
+    # -------------------------------------------------------------------------
+
+    def clone(self) -> 'MathTree':
+        '''
+        Returns a copy of this tree: new nodes all the way down, so the copy
+        can be evaluated/changed without affecting this tree.
+
+        Much cheaper than parsing the tree's string again.
+        '''
+        node = copy.copy(self)
+        if self._children:
+            node._children = [child.clone() for child in self._children]
+        if self._tags:
+            node._tags = copy.copy(self._tags)
+        return node
+
     # -------------------------------------------------------------------------
     # Properties
     # -------------------------------------------------------------------------
@@ -19,13 +19,15 @@ Handles:
 # ---
 from typing import (TYPE_CHECKING,
                     Optional, Union, Type, NewType, NamedTuple, Callable,
-                    Set, Tuple)
+                    Any, Iterable, Deque, Set, Tuple, List, Dict)
 from veredi.base.null import NullNoneOr
 if TYPE_CHECKING:
     from veredi.base.context     import VerediContext
     from veredi.game.ecs.manager import EcsManager
 
 from decimal import Decimal
+import time as py_time
+from collections import deque
 
 # ---
 # Code
@@ -38,7 +40,9 @@ from veredi.base                        import numbers
 from veredi.game.ecs.event              import EventManager, Event
 from veredi.game.ecs.time               import TimeManager
 from veredi.game.ecs.component          import ComponentManager
-from veredi.game.ecs.entity             import EntityManager
+from veredi.game.ecs.entity             import (EntityManager,
+                                                EntityLifeEvent,
+                                                EntityLifeCycle)
 from veredi.game.ecs.system             import SystemManager
 
 from veredi.game.ecs.const              import (SystemTick,
@@ -55,6 +59,7 @@ from veredi.math.parser                 import MathTree
 
 # Maths
 from .evaluator                         import Evaluator
+from .cache                             import MathCache
 from .exceptions                        import MathError
 from .                                  import event as math_event
 
@@ -70,6 +75,15 @@ MathVarFill = NewType(
     'MathVarFill',
     Callable[[EntityId, str, Optional[InputContext]], VerediHealth])
 
+MathVarFillMany = NewType(
+    'MathVarFillMany',
+    Callable[[EntityId, Iterable[str], Optional[InputContext]],
+             Dict[str, Tuple[Any, str]]])
+
+MathCacheKey = NewType(
+    'MathCacheKey',
+    Tuple[MathVarCanonicalize, MathVarFill])
+
 
 # -----------------------------------------------------------------------------
 # Code
@@ -90,6 +104,10 @@ class MathEntry(NamedTuple):
       - Event:
         - Should be filled out already - we don't replace 'root' so it can be
           put in there.
+      - Optional function:
+        - fill_many:
+          - Same as `fill`, but for many canonicalized strings at once.
+            Returns dict of canonical string -> (value, milieu).
     '''
     # Inputs from InputSystem / User
     root:         MathTree
@@ -103,21 +121,55 @@ class MathEntry(NamedTuple):
     # What to do with Result
     event:       Event
 
+    # Optional batch version of `fill`.
+    fill_many:   Optional[MathVarFillMany] = None
+
 
 class MathQueue:
     '''
     A FIFO queue of MathEntries.
+
+    Remembers when each entry was first queued (by `MathSystem.command()`),
+    even through being re-queued, for latency stats.
     '''
 
     def __init__(self) -> None:
-        self._queue = []
+        self._queue: Deque[Tuple[float, MathEntry]] = deque()
 
     def push(self,
-             entry: MathEntry) -> None:
-        self._queue.append(entry)
+             entry:  MathEntry,
+             queued: Optional[float] = None) -> None:
+        '''
+        Queue `entry`. `queued` is when it was first queued, if it's being
+        re-queued; defaults to now.
+        '''
+        if queued is None:
+            queued = py_time.perf_counter()
+        self._queue.append((queued, entry))
 
-    def pop(self):
-        return self._queue.pop()
+    def pop(self) -> MathEntry:
+        '''
+        Pop the oldest entry.
+        '''
+        return self._queue.popleft()[1]
+
+    def take(self) -> List[Tuple[float, MathEntry]]:
+        '''
+        Pop everything currently queued, oldest first, as (first queued time,
+        entry) tuples.
+        '''
+        taken = list(self._queue)
+        self._queue.clear()
+        return taken
+
+    @property
+    def age(self) -> float:
+        '''
+        Seconds the oldest entry has been waiting. 0.0 if empty.
+        '''
+        if not self._queue:
+            return 0.0
+        return py_time.perf_counter() - self._queue[0][0]
 
     def __len__(self):
         return len(self._queue)
@@ -129,10 +181,41 @@ class MathQueue:
         return f"<MathQueue({self._queue})>"
 
 
+class MathTickStats(NamedTuple):
+    '''
+    How much math MathSystem got done in its last tick (PRE, STANDARD, and
+    POST all together).
+    '''
+    resolved:     int
+    '''Resolve steps done (an entry resolved once counts once).'''
+
+    finalized:    int
+    '''Entries evaluated and sent out as result events.'''
+
+    passes:       int
+    '''Passes over the recurse queue.'''
+
+    latency_max:  float
+    '''Most seconds a finalized entry spent queued, from command to result.'''
+
+    latency_mean: float
+    '''Average seconds finalized entries spent queued.'''
+
+    seconds:      float
+    '''Seconds spent doing math this tick.'''
+
+
 class MathSystem(System,
                  name_dotted='veredi.math.system',
                  name_string='system.math'):
 
+    PASSES_MAX = 16
+    '''
+    Most passes over the recurse queue per tick. Math still not resolved
+    after that (e.g. a variable that resolves to itself) waits for the
+    next tick instead of hanging this one.
+    '''
+
     def _configure(self, context: 'VerediContext') -> None:
         '''
         Make our stuff from context/config data.
@@ -140,6 +223,15 @@ class MathSystem(System,
         self._recurse:  'MathQueue' = MathQueue()
         self._finalize: 'MathQueue' = MathQueue()
 
+        self._stats: MathTickStats = MathTickStats(0, 0, 0, 0.0, 0.0, 0.0)
+        '''Stats from our last tick. Reset in PRE, added to after.'''
+
+        self._caches: Dict[EntityId, Dict[MathCacheKey, MathCache]] = {}
+        '''
+        Resolved variables, per entity, per canonicalize/fill source. Only
+        for entities with DataComponents to tell us when things change.
+        '''
+
         # ---
         # Health Stuff
         # ---
@@ -171,26 +263,40 @@ class MathSystem(System,
         # Math when everyone's done?
         return SystemPriority.LOW
 
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def stats(self) -> MathTickStats:
+        '''
+        Throughput and latency of our last tick's math.
+        '''
+        return self._stats
+
     # -------------------------------------------------------------------------
     # Events
     # -------------------------------------------------------------------------
 
-    # TODO: subscribe to cmd reg event? Subscribe to 'math me plz' event.
+    def _subscribe(self) -> VerediHealth:
+        '''
+        Subscribe to any life-long event subscriptions here. Can hold on to
+        event_manager if need to sub/unsub more dynamically.
+        '''
+        # MathSystem subs to:
+        # - EntityLifeEvent: To drop dead entities' caches.
+        self._manager.event.subscribe(EntityLifeEvent,
+                                      self.event_entity_life)
+        return VerediHealth.HEALTHY
 
-    # def _subscribe(self) -> VerediHealth:
-    #     '''
-    #     Subscribe to any life-long event subscriptions here. Can hold on to
-    #     event_manager if need to sub/unsub more dynamically.
-    #     '''
-    #     super().subscribe(event_manager)
-    #     # MathSystem subs to:
-    #     # - CommandRegistrationBroadcast
-    #     # - SkillRequests
-    #     self._manager.event.subscribe(CommandRegistrationBroadcast,
-    #                                   self.event_cmd_reg)
-    #     self._manager.event.subscribe(SkillRequest,
-    #                                   self.event_skill_req)
-    #     return VerediHealth.HEALTHY
+    def event_entity_life(self, event: EntityLifeEvent) -> None:
+        '''
+        Entity life-cycle changed; forget about it if it's dead.
+        '''
+        if event.type == EntityLifeCycle.DEAD:
+            self._caches.pop(event.id, None)
+
+    # TODO: subscribe to cmd reg event? Subscribe to 'math me plz' event.
 
     # def event_cmd_reg(self, event: CommandRegistrationBroadcast) -> None:
     #     '''
@@ -259,7 +365,8 @@ class MathSystem(System,
                 canonicalize_fn: MathVarCanonicalize,
                 fill_fn: MathVarFill,
                 result_event: Event,
-                context: Optional[InputContext] = None
+                context: Optional[InputContext] = None,
+                fill_many_fn: Optional[MathVarFillMany] = None
                 ) -> CommandStatus:
         '''
         Command helper for math-based commands. MathSystem will call invokees,
@@ -270,6 +377,9 @@ class MathSystem(System,
         in in-place.
           - If the event is a MathEvent or child class, we will fill in its
             math tree and result total for you.
+
+        If `fill_many_fn` is supplied, it is used instead of `fill_fn` to fill
+        in all of an entity's variables at once.
         '''
         # Doctor checkup.
         if not self._health_ok_msg("Command ignored due to bad health.",
@@ -287,7 +397,8 @@ class MathSystem(System,
                           eid,
                           canonicalize_fn,
                           fill_fn,
-                          result_event)
+                          result_event,
+                          fill_many_fn)
         failed_on = self.resolve(entry)
         if failed_on:
             return CommandStatus.parsing(
@@ -296,12 +407,102 @@ class MathSystem(System,
                 f"Failed parsing '{failed_on}' into math expression.")
         return CommandStatus.successful(entry.context)
 
+    # -------------------------------------------------------------------------
+    # Resolution Cache
+    # -------------------------------------------------------------------------
+
+    def _cache(self, entry: MathEntry) -> Optional[MathCache]:
+        '''
+        Get `entry`'s entity's cache for `entry`'s canonicalize/fill source,
+        brought up to date with any changes to the entity's data.
+
+        Returns None if entity doesn't exist or has no DataComponents (so
+        nothing would tell us if its values change).
+        '''
+        entity = self._manager.entity.get(entry.entity_id)
+        if not entity:
+            self._caches.pop(entry.entity_id, None)
+            return None
+
+        caches = self._caches.setdefault(entry.entity_id, {})
+        key = (entry.canonicalize, entry.fill)
+        cache = caches.get(key, None)
+        if cache is None:
+            cache = MathCache()
+        if not cache.sync(entity.components):
+            caches.pop(key, None)
+            return None
+
+        caches[key] = cache
+        return cache
+
+    def invalidate(self, entity_id: EntityId, *canons: str) -> None:
+        '''
+        Drop `entity_id`'s cached resolutions of the canonical names `canons`,
+        and anything resolved using them. Drop all of the entity's cached
+        resolutions if no `canons`.
+
+        Changes made through `DataComponent.set()`/`DataComponent.changed()`
+        are noticed automatically; this is for anything else.
+        '''
+        if not canons:
+            self._caches.pop(entity_id, None)
+            return
+
+        for cache in self._caches.get(entity_id, {}).values():
+            cache.invalidate(*canons)
+
+    def _canonicalize(self,
+                      entry: MathEntry,
+                      cache: Optional[MathCache],
+                      var:   MathTree) -> Optional[str]:
+        '''
+        Canonicalize `var`'s moniker, from `cache` if possible.
+        '''
+        if cache is not None:
+            canon = cache.canonical(var.moniker, var.milieu)
+            if canon:
+                return canon
+
+        canon = entry.canonicalize(var.moniker, var.milieu)
+        if cache is not None and canon:
+            cache.set_canonical(var.moniker, var.milieu, canon)
+        return canon
+
+    def _fill(self,
+              entry:  MathEntry,
+              cache:  Optional[MathCache],
+              canons: List[str]) -> Dict[str, Tuple[Any, str]]:
+        '''
+        Fill in the canonical names' (value, milieu) with one `fill_many` call
+        if `entry` has one, else one `fill` call per name. Caches the results.
+
+        Returns dict of canonical name -> (value, milieu).
+        '''
+        if entry.fill_many:
+            filled = entry.fill_many(entry.entity_id, canons, entry.context)
+        else:
+            filled = {canon: entry.fill(entry.entity_id, canon, entry.context)
+                      for canon in canons}
+
+        if cache is not None:
+            for canon, (value, milieu) in filled.items():
+                cache.set(canon, value, milieu)
+        return filled
+
+    # -------------------------------------------------------------------------
+    # Resolution
+    # -------------------------------------------------------------------------
+
     def _resolve_var(self,
-                     entry: MathEntry,
-                     var:   MathTree,
-                     canon: str) -> Tuple[bool, Optional[MathTree]]:
+                     entry:  MathEntry,
+                     var:    MathTree,
+                     canon:  str,
+                     value:  Any,
+                     milieu: str) -> Tuple[bool, Optional[MathTree]]:
         '''
-        Resolves this one variable in the whole MathTree.
+        Resolves this one variable in the whole MathTree, with the `value` and
+        `milieu` its canonical name was filled in with.
 
         Returns: (success, replacement)
           replacement:
@@ -309,10 +510,6 @@ class MathSystem(System,
             - If finished (var resolved to a number), returns None.
             - Else returns MathTree of what var resolved to.
         '''
-
-        # Fill in canonical string's value.
-        value, milieu = entry.fill(entry.entity_id, canon, entry.context)
-
         if self._should_debug():
             self._log_debug(f"replace '{canon}' with "
                             "'{str(type(value))}({value})' and '{milieu}'")
@@ -349,15 +546,21 @@ class MathSystem(System,
 
             return True, replacement
 
-    def resolve(self, entry: MathEntry) -> Optional[MathTree]:
-        '''
-        Resolve vars in this entry; place result back into correct queue.
+    def _resolve_vars(self,
+                      entry: MathEntry,
+                      cache: Optional[MathCache]) -> List[Tuple[MathTree,
+                                                                str]]:
         '''
+        Canonicalize the vars in this entry that still need resolving.
 
-        # Resolve each var.
-        resolved = 0
-        replace = []
+        Returns list of (var, canonical name).
+        '''
+        pending = []
         for var in entry.root.each_var():
+            # Already filled in on a previous pass?
+            if isinstance(var.value, numbers.NumberTypesTuple):
+                continue
+
             if self._should_debug():
                 self._log_debug(f"      ----- working on var: {var} -----")
                 self._log_debug("canonicalize_fn: "
@@ -365,11 +568,42 @@ class MathSystem(System,
                                 f"var.milieu: {var.milieu}")
             # If the function can canonicalize this variable's moniker, we'll
             # assume it's the owner and have it fill it in.
-            canon = entry.canonicalize(var.moniker, var.milieu)
+            canon = self._canonicalize(entry, cache, var)
             if not canon:
                 continue
 
-            success, replacement = self._resolve_var(entry, var, canon)
+            # `var` came from resolving its milieu (e.g. 'this.score' from
+            # 'strength.modifier'), so its milieu depends on it.
+            if cache is not None and var.milieu and var.milieu in cache:
+                cache.depend(canon, var.milieu)
+
+            pending.append((var, canon))
+        return pending
+
+    def _resolve_entry(self,
+                       entry:   MathEntry,
+                       queued:  Optional[float],
+                       cache:   Optional[MathCache],
+                       pending: List[Tuple[MathTree, str]],
+                       filled:  Dict[str, Tuple[Any, str]]
+                       ) -> Optional[MathTree]:
+        '''
+        Resolve `pending` vars in this entry from `filled` (or `cache`); place
+        result back into correct queue.
+
+        Returns what we failed on, or None if successful.
+        '''
+        # Resolve each var.
+        resolved = 0
+        replace = []
+        for var, canon in pending:
+            if canon in filled:
+                value, milieu = filled[canon]
+            else:
+                value, milieu = cache.get(canon)
+
+            success, replacement = self._resolve_var(entry, var, canon,
+                                                     value, milieu)
             if not success:
                 # Return what we failed on.
                 return replacement
@@ -395,19 +629,80 @@ class MathSystem(System,
             self._log_debug("Replaced: {}", replaced)
         if not resolved and not replaced:
             # Math has come to steady state... stick in final queue.
-            self._finalize.push(entry)
+            self._finalize.push(entry, queued)
             if self._should_debug():
                 self._log_debug('Pushed to finalize. len: {}',
                                 len(self._finalize))
         else:
             # Math is still wibbly-wobbly.
-            self._recurse.push(entry)
+            self._recurse.push(entry, queued)
             if self._should_debug():
                 self._log_debug('Pushed to recurse. len: {}',
                                 len(self._recurse))
 
         return None
 
+    def _resolve_all(self,
+                     queued: List[Tuple[Optional[float], MathEntry]]
+                     ) -> List[Tuple[MathEntry, MathTree]]:
+        '''
+        Resolve vars in all these (first queued time, entry) tuples in one
+        pass; place each result back into correct queue.
+
+        Variables are filled in grouped by entity and fill source, so e.g. an
+        entity's AbilityComponent gets one query for all of the variables in
+        all of the entity's math.
+
+        Returns list of (entry, what it failed on) for any failures.
+        '''
+        # ---
+        # Canonicalize everything and figure out what needs filling.
+        # ---
+        work = []
+        wanted: Dict[Tuple[EntityId, MathVarFill],
+                     Tuple[MathEntry, Optional[MathCache], Dict[str, None]]]
+        wanted = {}
+        for time_queued, entry in queued:
+            cache = self._cache(entry)
+            pending = self._resolve_vars(entry, cache)
+            for _, canon in pending:
+                if cache is not None and canon in cache:
+                    continue
+                group = wanted.setdefault((entry.entity_id, entry.fill),
+                                          (entry, cache, {}))
+                # Dict as an ordered set.
+                group[2][canon] = None
+            work.append((time_queued, entry, cache, pending))
+
+        # ---
+        # Fill in, grouped by entity & fill source.
+        # ---
+        filled = {key: self._fill(entry, cache, list(canons))
+                  for key, (entry, cache, canons) in wanted.items()}
+
+        # ---
+        # Resolve the trees.
+        # ---
+        failures = []
+        for time_queued, entry, cache, pending in work:
+            failed_on = self._resolve_entry(
+                entry, time_queued, cache, pending,
+                filled.get((entry.entity_id, entry.fill), {}))
+            if failed_on:
+                failures.append((entry, failed_on))
+        return failures
+
+    def resolve(self, entry: MathEntry) -> Optional[MathTree]:
+        '''
+        Resolve vars in this entry; place result back into correct queue.
+
+        Returns what we failed on, or None if successful.
+        '''
+        failures = self._resolve_all([(None, entry)])
+        if failures:
+            return failures[0][1]
+        return None
+
     # -------------------------------------------------------------------------
     # Game Update Loop/Tick Functions
     # -------------------------------------------------------------------------
@@ -416,48 +711,78 @@ class MathSystem(System,
         '''
         SystemTick.PRE
         '''
-        return self._update_any()
+        # New tick; new stats.
+        self._stats = MathTickStats(0, 0, 0, 0.0, 0.0, 0.0)
+        return self._update_any(SystemTick.PRE)
 
     def _update(self) -> VerediHealth:
         '''
-        SystemTick.PRE
+        SystemTick.STANDARD
         '''
-        return self._update_any()
+        return self._update_any(SystemTick.STANDARD)
 
     def _update_post(self) -> VerediHealth:
         '''
-        SystemTick.PRE
+        SystemTick.POST
         '''
-        return self._update_any()
+        return self._update_any(SystemTick.POST)
 
-    def _update_any(self) -> VerediHealth:
+    def _stats_add(self,
+                   resolved:  int,
+                   passes:    int,
+                   latencies: List[float],
+                   seconds:   float) -> None:
+        '''
+        Add a tick state's work to this tick's stats.
+        '''
+        stats = self._stats
+        finalized = stats.finalized + len(latencies)
+        latency_mean = stats.latency_mean
+        if latencies:
+            latency_mean = ((stats.latency_mean * stats.finalized
+                             + sum(latencies))
+                            / finalized)
+        self._stats = MathTickStats(
+            stats.resolved + resolved,
+            finalized,
+            stats.passes + passes,
+            max(stats.latency_max, max(latencies, default=0.0)),
+            latency_mean,
+            stats.seconds + seconds)
+
+    def _update_any(self, tick: SystemTick) -> VerediHealth:
         '''
         Generic tick function. We do the same thing every tick state we process
         so do it all here.
         '''
         # Doctor checkup.
-        if not self._health_ok_tick(SystemTick.STANDARD):
+        if not self._health_ok_tick(tick):
             return self.health
 
-        # TODO [2020-07-04]: Could have these do a max amount per tick.
-
-        # Do however many we have queued up. Ignore requeues...
-        for i in range(len(self._recurse)):
-            entry = self._recurse.pop()
-            failure = self.resolve(entry)
-            if failure:
+        start = py_time.perf_counter()
+        resolved = 0
+        passes = 0
+
+        # Resolve everything queued up, in one pass per level of recursion,
+        # until it's all resolved (or we've done enough passes this tick).
+        while self._recurse and passes < self.PASSES_MAX:
+            queued = self._recurse.take()
+            resolved += len(queued)
+            passes += 1
+            for entry, failure in self._resolve_all(queued):
                 if self._should_debug():
-                    self._log_debug('recurse failure:', failure)
+                    self._log_debug('recurse failure: {}', failure)
                 # TODO [2020-07-05]: let someone known or something?
                 # Send out result event as error somehow.
                 self._log_error("TODO: let someone known or something? "
                                 "failure: {}",
                                 failure)
-                continue
 
         # Do however many we have queued up.
-        for i in range(len(self._finalize)):
-            entry = self._finalize.pop()
+        now = py_time.perf_counter()
+        latencies = []
+        for queued, entry in self._finalize.take():
+            latencies.append(now - queued)
             total = None
             try:
                 total = Evaluator.eval(entry.root)
@@ -482,8 +807,13 @@ class MathSystem(System,
                 entry.event.finalize(entry.root, total)
             self._event_notify(entry.event)
 
+        self._stats_add(resolved,
+                        passes,
+                        latencies,
+                        py_time.perf_counter() - start)
+
         if self._should_debug():
-            self._log_debug('Updated.')
+            self._log_debug('Updated. {}', self._stats)
             self._log_debug('    self._recurse:  {}',
                             self._recurse)
             self._log_debug('    self._finalize: {}',
@@ -491,4 +821,4 @@ class MathSystem(System,
 
         # Done for this tick.
         # TODO: Should time manager have current engine tick/life-cycle?
-        return self._health_check(SystemTick.STANDARD)
+        return self._health_check(tick)
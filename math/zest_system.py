@@ -16,9 +16,11 @@ from veredi.zest.zpath       import TestType
 
 from veredi.zest             import zontext
 from veredi.base.const       import VerediHealth
+from veredi.base.strings     import label
 from veredi.data             import background
+from veredi.game.data.component import DataComponent
 
-from .system                 import MathSystem
+from .system                 import MathSystem, MathQueue
 from .event                  import MathResult
 from .parser                 import MathTree
 from .d20.parser             import D20Parser
@@ -37,6 +39,22 @@ from veredi.interface.input.parse import UTParcel
 # -----------------------------------------------------------------------------
 
 
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+class MathZestComponent(DataComponent,
+                        name_dotted='veredi.math.zest_system.component',
+                        name_string='math.zest_system.component'):
+    '''
+    DataComponent with one ability-ish stat for testing the resolution cache.
+    '''
+
+    _REQ_KEYS = {
+        'strength': ['score', 'modifier'],
+    }
+
+
 # -----------------------------------------------------------------------------
 # Test Code
 # -----------------------------------------------------------------------------
@@ -231,6 +249,174 @@ class Test_MathSystem(ZestSystem):
         for var in result.root.walk(MathTree._predicate_variable_nodes):
             self.fail('No variables should be present in output tree.')
 
+    def test_math_cache(self):
+        '''
+        Check that resolved variables are cached per entity, and dropped (with
+        whatever depends on them) when the entity's data changes.
+        '''
+        entity = self.create_entity()
+        cid = self.manager.component.create(
+            MathZestComponent, None,
+            data={
+                'strength': {
+                    'score': 20,
+                    'modifier': '(${this.score} - 10) // 2',
+                },
+            })
+        component = self.manager.component.get(cid)
+        self.manager.entity.attach(entity.id, component)
+
+        filled = []
+
+        def canonicalize(moniker, milieu):
+            names = label.regularize(moniker)
+            if names[0] == 'this':
+                names[0] = label.regularize(milieu)[0]
+            return label.normalize(*names)
+
+        def fill(entity_id, canon, context):
+            filled.append(canon)
+            return component.query(canon), canon
+
+        def roll(string):
+            math = self.parser.parse(string)
+            self.system.command(math, canonicalize, fill,
+                                MathResult(entity.id, 0, self.context, math),
+                                self.context)
+            self.system._update()
+            self.manager.event.publish()
+            return self.events.pop().total
+
+        self.assertEqual(roll('${strength.modifier} + 1'), 6)
+        self.assertEqual(filled, ['strength.modifier', 'strength.score'])
+
+        # Cached now.
+        filled.clear()
+        self.assertEqual(roll('${strength.modifier} * 2'), 10)
+        self.assertEqual(filled, [])
+
+        # Changing the score drops the modifier too.
+        component.set(12, 'strength.score')
+        self.assertEqual(roll('${strength.modifier} * 2'), 2)
+        self.assertEqual(filled, ['strength.modifier', 'strength.score'])
+
+        # Changing only the modifier keeps the score.
+        filled.clear()
+        component.set('${this.score} - 2', 'strength.modifier')
+        self.assertEqual(roll('${strength.modifier} + 1'), 11)
+        self.assertEqual(filled, ['strength.modifier'])
+
+        # Entities without DataComponents aren't cached.
+        self.assertNotIn(0, self.system._caches)
+
+    def test_math_queue(self):
+        '''
+        MathQueue is first in, first out.
+        '''
+        queue = MathQueue()
+        for each in range(3):
+            queue.push(each)
+        self.assertEqual(queue.pop(), 0)
+        queue.push(3, queued=1.0)
+        self.assertEqual([entry for _, entry in queue.take()], [1, 2, 3])
+        self.assertEqual(len(queue), 0)
+        self.assertEqual(queue.age, 0.0)
+
+    def test_math_batch(self):
+        '''
+        Check that all queued math gets done in one tick, with variables
+        filled in one call per entity.
+        '''
+        self.value_canon = 'jeff.jefferson'
+        filled = []
+
+        def fill_many(entity_id, canons, context):
+            filled.append((entity_id, list(canons)))
+            return {canon: ('${this.ranks} + 1', canon)
+                    if canon == 'jeff.jefferson' else
+                    (20, canon)
+                    for canon in canons}
+
+        maths = []
+        for eid in (1, 1, 2):
+            math = self.parser.parse('$jeff + 2')
+            maths.append(math)
+            self.system.command(math,
+                                self.canonicalize,
+                                self.fill,
+                                MathResult(eid, 0, self.context, math),
+                                self.context,
+                                fill_many_fn=fill_many)
+        self.assertEqual(filled, [(1, ['jeff.jefferson']),
+                                  (1, ['jeff.jefferson']),
+                                  (2, ['jeff.jefferson'])])
+        self.assertEqual(len(self.system._recurse), 3)
+
+        # One tick does it all: both entity 1 entries' vars are filled with
+        # one call.
+        filled.clear()
+        self.value_canon = 'jeff.ranks'
+        self.system._update()
+        self.assertEqual(filled, [(1, ['jeff.ranks']),
+                                  (2, ['jeff.ranks'])])
+        self.assertEqual(len(self.system._recurse), 0)
+        self.assertEqual(len(self.system._finalize), 0)
+
+        stats = self.system.stats
+        self.assertEqual(stats.resolved, 3)
+        self.assertEqual(stats.finalized, 3)
+        self.assertEqual(stats.passes, 1)
+        self.assertGreater(stats.latency_max, 0.0)
+        self.assertGreaterEqual(stats.latency_max, stats.latency_mean)
+
+        self.manager.event.publish()
+        self.assertEqual([result.total for result in self.events],
+                         [23, 23, 23])
+
+    def test_math_stats(self):
+        '''
+        Check that stats add up over a tick's PRE, STANDARD, and POST, and
+        start over next tick.
+        '''
+        def canonicalize(moniker, milieu):
+            return moniker
+
+        def fill(entity_id, canon, context):
+            # 'jeff' needs another resolve pass in a tick.
+            return ('$ranks + 1' if canon == 'jeff' else 20), canon
+
+        def command(count):
+            for _ in range(count):
+                math = self.parser.parse('$jeff + 2')
+                self.system.command(math,
+                                    canonicalize,
+                                    fill,
+                                    MathResult(1, 0, self.context, math),
+                                    self.context)
+
+        command(2)
+        self.system._update_pre()
+        command(1)
+        self.system._update()
+        # Nothing to do in POST; shouldn't wipe out the rest of the tick.
+        self.system._update_post()
+
+        stats = self.system.stats
+        self.assertEqual(stats.resolved, 3)
+        self.assertEqual(stats.finalized, 3)
+        self.assertEqual(stats.passes, 2)
+        self.assertGreater(stats.latency_max, 0.0)
+        self.assertGreaterEqual(stats.latency_max, stats.latency_mean)
+        self.assertGreater(stats.seconds, 0.0)
+
+        # Next tick starts over.
+        self.system._update_pre()
+        self.assertEqual(self.system.stats.finalized, 0)
+
+        self.manager.event.publish()
+        self.assertEqual([result.total for result in self.events],
+                         [23, 23, 23])
+
     # def test_math_milieu(self):
     #     '''
     #     Check to make sure our milieu (value parsing contextual name)
@@ -11,20 +11,24 @@ Only really tests the websockets and Mediator.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional, Any, Type, NewType, Callable, Tuple, List
+from typing import (Optional, Any, Type, NewType, Callable,
+                    Iterable, Tuple, List, Dict, Deque)
 
 import enum
 import signal
 import time as py_time
 import multiprocessing
+import zlib
 from multiprocessing.connection import Connection as mp_conn
+from multiprocessing.reduction  import ForkingPickler
 from ctypes                     import c_int
-from collections                import namedtuple
+from collections                import namedtuple, deque
 from datetime                   import datetime
 
 
 import veredi.time.machine
 
+from veredi.base.null            import null_to_none
 from veredi.base.enum            import FlagCheckMixin
 from veredi.base.const           import VerediHealth
 from veredi.base.strings         import label
@@ -37,6 +41,7 @@ from veredi.data.config.context  import ConfigContext
 from veredi.debug.const          import DebugFlag
 
 from .exceptions                 import MultiProcError
+from .                           import shm
 
 
 # -----------------------------------------------------------------------------
@@ -82,6 +87,31 @@ Name and exitcode tuple.
 '''
 
 
+_FRAME_BATCH = b'vb:'
+'''
+Header for a batched IPC frame: a pickled list of (package, context) tuples.
+
+Pickles start with a protocol opcode (b'\x80'), so a frame can't be mistaken
+for a single pickled (package, context) from `send()`.
+'''
+
+_FRAME_BATCH_ZLIB = b'vz:'
+'''
+Header for a zlib-compressed batched IPC frame.
+'''
+
+
+IPC_TRANSPORT_PIPE = 'pipe'
+'''
+`set_up()` ipc_transport for a regular `multiprocessing.Pipe()`.
+'''
+
+IPC_TRANSPORT_SHM = 'shm'
+'''
+`set_up()` ipc_transport for shared-memory ring buffers (`shm.pipe()`).
+'''
+
+
 @enum.unique
 class ProcTest(FlagCheckMixin, enum.Flag):
     NONE = enum.auto()
@@ -147,6 +177,67 @@ def _sigalrm_end() -> None:
     signal.alarm(0)
 
 
+# -----------------------------------------------------------------------------
+# IPC Transport & Framing
+# -----------------------------------------------------------------------------
+
+def _pipe(transport: Optional[str], size: Optional[int]) -> Tuple[Any, Any]:
+    '''
+    Creates the (child, parent) connection pair for `transport`.
+
+    `size` is only used by the shared-memory transport: the size (in bytes)
+    of its ring buffers.
+    '''
+    if not transport or transport == IPC_TRANSPORT_PIPE:
+        return multiprocessing.Pipe()
+
+    if transport == IPC_TRANSPORT_SHM:
+        # Parent owns the shared memory, so it gets the owner's end.
+        parent_pipe, child_pipe = shm.pipe(size)
+        return child_pipe, parent_pipe
+
+    raise MultiProcError(f"Unknown IPC transport '{transport}'. Expected "
+                         f"'{IPC_TRANSPORT_PIPE}' or '{IPC_TRANSPORT_SHM}'.",
+                         data={
+                             'transport': transport,
+                             'size': size,
+                         })
+
+
+def _pipe_send_many(pipe:     mp_conn,
+                    items:    List[Tuple[Any, VerediContext]],
+                    compress: int) -> None:
+    '''
+    Sends all of `items` (package & context tuples) as one frame in one
+    `send_bytes()`.
+
+    If `compress` is non-zero and the frame is at least `compress` bytes, the
+    frame is zlib-compressed.
+    '''
+    data = bytes(ForkingPickler.dumps(items))
+    if compress and len(data) >= compress:
+        pipe.send_bytes(_FRAME_BATCH_ZLIB + zlib.compress(data))
+        return
+    pipe.send_bytes(_FRAME_BATCH + data)
+
+
+def _pipe_recv_frame(pipe: mp_conn) -> List[Tuple[Any, VerediContext]]:
+    '''
+    Receives one frame from `pipe`. Waits/blocks until it receives something.
+
+    Returns a list of package & context tuples: just one if it was a `send()`,
+    or however many were in a batched frame.
+    '''
+    data = pipe.recv_bytes()
+    header = data[:len(_FRAME_BATCH)]
+    if header == _FRAME_BATCH:
+        return ForkingPickler.loads(data[len(_FRAME_BATCH):])
+    if header == _FRAME_BATCH_ZLIB:
+        return ForkingPickler.loads(
+            zlib.decompress(data[len(_FRAME_BATCH_ZLIB):]))
+    return [ForkingPickler.loads(data)]
+
+
 # -----------------------------------------------------------------------------
 # Process Info Tuple-ish Class
 # -----------------------------------------------------------------------------
@@ -169,7 +260,10 @@ class ProcToSubComm(NamesMixin,
                  process:    multiprocessing.Process,
                  pipe:       mp_conn,
                  shutdown:   multiprocessing.Event,
-                 ut_pipe:    Optional[mp_conn] = None) -> None:
+                 ut_pipe:    Optional[mp_conn] = None,
+                 batched:    bool              = False,
+                 compress:   int               = 0,
+                 child_pipe: Optional[mp_conn] = None) -> None:
         # Updated name descriptor to parameter.
         self.name = name
 
@@ -178,6 +272,30 @@ class ProcToSubComm(NamesMixin,
         self.shutdown:   multiprocessing.Event   = shutdown
         self.ut_pipe:    Optional[mp_conn]       = ut_pipe
 
+        self._child_pipe: Optional[mp_conn]      = child_pipe
+        '''
+        Our copy of the sub-process's end of a shared-memory `pipe`. We let go
+        of it once the sub-process has been started with it.
+        '''
+
+        self.batched:    bool                    = batched
+        '''
+        If True, users of this should collect up their packages and use
+        `send_many()` instead of calling `send()` for each.
+        '''
+
+        self.compress:   int                     = compress
+        '''
+        `send_many()` compresses frames of at least this many bytes.
+        0 means never compress.
+        '''
+
+        self._rx_buffer: Deque[Tuple[Any, VerediContext]] = deque()
+        '''
+        Packages received in a batched frame that haven't been returned by
+        `recv()`/`recv_many()` yet.
+        '''
+
         self.timer_val:  Optional[float]         = None
         '''
         We don't (currently) manage this, but do hold on to it for
@@ -226,6 +344,11 @@ class ProcToSubComm(NamesMixin,
         self.time_start = veredi.time.machine.utcnow()
         self.process.start()
 
+        # Sub-process has its own copy of its end of the pipe now.
+        if self._child_pipe is not None:
+            self._child_pipe.detach()
+            self._child_pipe = None
+
     def stop(self,
              wait_timeout: float = GRACEFUL_SHUTDOWN_TIME_SEC,
              time_sec:  Optional[float]    = None) -> None:
@@ -415,7 +538,7 @@ class ProcToSubComm(NamesMixin,
         No wait/block.
         Returns True if pipe has data to recv().
         '''
-        contains_data = self.pipe.poll()
+        contains_data = bool(self._rx_buffer) or self.pipe.poll()
         # log.data_processing(self.dotted,
         #                     "{} '{}' pipe has data?: {}",
         #                     self.klass, self.name,
@@ -434,17 +557,56 @@ class ProcToSubComm(NamesMixin,
                             package, context)
         self.pipe.send((package, context))
 
+    def send_many(self, items: Iterable[Tuple[Any, VerediContext]]) -> None:
+        '''
+        Push all of `items` (package & context tuples) into IPC pipe as one
+        batched frame.
+        '''
+        items = list(items)
+        if not items:
+            return
+        log.data_processing(self.dotted,
+                            "{} '{}' send to sub-proc: {} batched",
+                            self.klass, self.name,
+                            len(items))
+        _pipe_send_many(self.pipe, items, self.compress)
+
     def recv(self) -> Tuple[Any, VerediContext]:
         '''
         Pull a package & context from the IPC pipe.
+        Waits/blocks until it receives something.
         '''
-        package, context = self.pipe.recv()
+        if not self._rx_buffer:
+            self._rx_buffer.extend(_pipe_recv_frame(self.pipe))
+        package, context = self._rx_buffer.popleft()
         log.data_processing(self.dotted,
                             "{} '{}' recv from sub-proc: {}, {}",
                             self.klass, self.name,
                             package, context)
         return (package, context)
 
+    def recv_many(self,
+                  max_count: Optional[int] = None
+                  ) -> List[Tuple[Any, VerediContext]]:
+        '''
+        No wait/block.
+        Pull all available packages & contexts (or up to `max_count` of them)
+        from the IPC pipe.
+        '''
+        items = []
+        while ((max_count is None or len(items) < max_count)
+               and self.has_data()):
+            if not self._rx_buffer:
+                self._rx_buffer.extend(_pipe_recv_frame(self.pipe))
+            items.append(self._rx_buffer.popleft())
+
+        if items:
+            log.data_processing(self.dotted,
+                                "{} '{}' recv from sub-proc: {} batched",
+                                self.klass, self.name,
+                                len(items))
+        return items
+
     def _ut_exists(self) -> bool:
         '''
         Returns True if self._comms.ut_pipe is truthy.
@@ -518,7 +680,9 @@ class SubToProcComm(NamesMixin,
                  pipe:        mp_conn,
                  shutdown:    multiprocessing.Event,
                  debug_flags: Optional[DebugFlag] = None,
-                 ut_pipe:     Optional[mp_conn]   = None) -> None:
+                 ut_pipe:     Optional[mp_conn]   = None,
+                 batched:     bool                = False,
+                 compress:    int                 = 0) -> None:
         # Updated name descriptor to parameter.
         self.name = name
 
@@ -529,6 +693,24 @@ class SubToProcComm(NamesMixin,
         self.ut_pipe:     Optional[mp_conn]       = ut_pipe
         self._entry_fn:   StartProcFn             = entry_fn
 
+        self.batched:     bool                    = batched
+        '''
+        If True, users of this should collect up their packages and use
+        `send_many()` instead of calling `send()` for each.
+        '''
+
+        self.compress:    int                     = compress
+        '''
+        `send_many()` compresses frames of at least this many bytes.
+        0 means never compress.
+        '''
+
+        self._rx_buffer:  Deque[Tuple[Any, VerediContext]] = deque()
+        '''
+        Packages received in a batched frame that haven't been returned by
+        `recv()`/`recv_many()` yet.
+        '''
+
     # -------------------------------------------------------------------------
     # Process Control
     # -------------------------------------------------------------------------
@@ -552,7 +734,7 @@ class SubToProcComm(NamesMixin,
         No wait/block.
         Returns True if pipe has data to recv().
         '''
-        contains_data = self.pipe.poll()
+        contains_data = bool(self._rx_buffer) or self.pipe.poll()
         # log.data_processing(self.dotted,
         #                     "{} '{}' pipe has data?: {}",
         #                     self.klass, self.name,
@@ -570,17 +752,56 @@ class SubToProcComm(NamesMixin,
                             package, context)
         self.pipe.send((package, context))
 
+    def send_many(self, items: Iterable[Tuple[Any, VerediContext]]) -> None:
+        '''
+        Push all of `items` (package & context tuples) into IPC pipe as one
+        batched frame.
+        '''
+        items = list(items)
+        if not items:
+            return
+        log.data_processing(self.dotted,
+                            "{} '{}' pipe send to main proc: {} batched",
+                            self.klass, self.name,
+                            len(items))
+        _pipe_send_many(self.pipe, items, self.compress)
+
     def recv(self) -> Tuple[Any, VerediContext]:
         '''
         Pull a package & context from the IPC pipe.
+        Waits/blocks until it receives something.
         '''
-        package, context = self.pipe.recv()
+        if not self._rx_buffer:
+            self._rx_buffer.extend(_pipe_recv_frame(self.pipe))
+        package, context = self._rx_buffer.popleft()
         log.data_processing(self.dotted,
                             "{} '{}' pipe recv from main proc: {}, {}",
                             self.klass, self.name,
                             package, context)
         return (package, context)
 
+    def recv_many(self,
+                  max_count: Optional[int] = None
+                  ) -> List[Tuple[Any, VerediContext]]:
+        '''
+        No wait/block.
+        Pull all available packages & contexts (or up to `max_count` of them)
+        from the IPC pipe.
+        '''
+        items = []
+        while ((max_count is None or len(items) < max_count)
+               and self.has_data()):
+            if not self._rx_buffer:
+                self._rx_buffer.extend(_pipe_recv_frame(self.pipe))
+            items.append(self._rx_buffer.popleft())
+
+        if items:
+            log.data_processing(self.dotted,
+                                "{} '{}' pipe recv from main proc: {} batched",
+                                self.klass, self.name,
+                                len(items))
+        return items
+
     def _ut_exists(self) -> bool:
         '''
         Returns True if self._comms.ut_pipe is truthy.
@@ -649,7 +870,11 @@ def set_up(proc_name:         str,
            debug_flags:       Optional[DebugFlag]             = None,
            unit_testing:      Optional[bool]                  = False,
            proc_test:         Optional[ProcTest]              = None,
-           shutdown:          Optional[multiprocessing.Event] = None
+           shutdown:          Optional[multiprocessing.Event] = None,
+           ipc_batched:       bool                            = False,
+           ipc_compress:      int                             = 0,
+           ipc_transport:     Optional[str]                   = None,
+           ipc_size:          Optional[int]                   = None
            ) -> Optional[ProcToSubComm]:
     '''
     Get a process ready for _run_proc().
@@ -665,6 +890,13 @@ def set_up(proc_name:         str,
     `shutdown` is an optional param in case caller wants multiple sub-processes
     to share the same shutdown flag.
 
+    `ipc_batched` and `ipc_compress` are given to both comms objects as their
+    `batched` and `compress` settings.
+
+    `ipc_transport` is what carries the official IPC pipe's data:
+    IPC_TRANSPORT_PIPE (default) or IPC_TRANSPORT_SHM. `ipc_size` is the
+    shared-memory transport's ring buffer size.
+
     Returns a `t_proc_to_sub` (default: ProcToSubComm) object. When ready to
     start/run the subprocess, call start() on it.
     '''
@@ -696,7 +928,7 @@ def set_up(proc_name:         str,
                     veredi_logger=logger)
 
     # The official us<->them IPC pipe.
-    child_pipe, parent_pipe = multiprocessing.Pipe()
+    child_pipe, parent_pipe = _pipe(ipc_transport, ipc_size)
 
     # The side-channel/unit-test us<->them IPC pipe.
     ut_child_pipe, ut_parent_pipe = None, None
@@ -736,7 +968,9 @@ def set_up(proc_name:         str,
                           pipe=child_pipe,
                           shutdown=shutdown,
                           debug_flags=debug_flags,
-                          ut_pipe=ut_child_pipe)
+                          ut_pipe=ut_child_pipe,
+                          batched=ipc_batched,
+                          compress=ipc_compress)
 
     # ---
     # Updated Context w/ start-up info (SubToProcComm, etc).
@@ -775,7 +1009,13 @@ def set_up(proc_name:         str,
                          process=subprocess,
                          pipe=parent_pipe,
                          shutdown=shutdown,
-                         ut_pipe=ut_parent_pipe)
+                         ut_pipe=ut_parent_pipe,
+                         batched=ipc_batched,
+                         compress=ipc_compress,
+                         child_pipe=(child_pipe
+                                     if isinstance(child_pipe,
+                                                   shm.ShmConnection) else
+                                     None))
 
     # ------------------------------
     # Use Finalize Callback, if supplied.
@@ -800,6 +1040,25 @@ def set_up(proc_name:         str,
     return proc
 
 
+def _log_client_settings(config: Optional[Configuration]
+                         ) -> Dict[str, Any]:
+    '''
+    Returns `log_client.init()` kwargs for batching/compressing logs, from
+    `config`'s 'logging.client' settings (or defaults if no config).
+    '''
+    if not config:
+        return {}
+
+    buffer_size = null_to_none(config.get('logging', 'client', 'buffer'))
+    flush = null_to_none(config.get('logging', 'client', 'seconds'))
+    return {
+        'batched':     bool(config.get('logging', 'client', 'batched')),
+        'compress':    int(config.get('logging', 'client', 'compress') or 0),
+        'buffer_size': (None if buffer_size is None else int(buffer_size)),
+        'flush':       (None if flush is None else float(flush)),
+    }
+
+
 def _subproc_entry(context: VerediContext) -> None:
     '''
     Init and run a multiprocessing process.
@@ -857,7 +1116,8 @@ def _subproc_entry(context: VerediContext) -> None:
                         "Initializing log_client for '{}'",
                         proc.name,
                         veredi_logger=proc_log)
-        log_client.init(proc.name, initial_log_level)
+        log_client.init(proc.name, initial_log_level,
+                        **_log_client_settings(proc.config))
 
     # ------------------------------
     # More Sanity
@@ -0,0 +1,548 @@
+# coding: utf-8
+
+'''
+Shared-memory transport for inter-process communication.
+
+An alternative to `multiprocessing.Pipe()` for high message rates: each
+direction is a single-producer/single-consumer ring buffer in
+`multiprocessing.shared_memory`, carrying length-prefixed pickled messages.
+A regular pipe is only used for wake-ups - a byte is sent over it when the
+ring goes from empty to non-empty - so a busy link does no syscalls per
+message.
+
+`ShmConnection` has the parts of `multiprocessing.connection.Connection`'s
+API that the multiproc comms (and `multiprocessing.connection.wait()`, and
+asyncio's `add_reader()`) use, so it can be used anywhere a pipe end is.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Any, Union, Tuple
+
+import struct
+import time as py_time
+import multiprocessing
+from multiprocessing               import shared_memory
+from multiprocessing.connection    import Connection as mp_conn, wait
+from multiprocessing.reduction     import ForkingPickler
+
+
+from .exceptions                   import MultiProcError
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+SIZE_DEFAULT = 4 * 1024 * 1024
+'''Default size (in bytes) of each direction's ring buffer.'''
+
+SEND_TIMEOUT_SEC = 5.0
+'''
+How long a send will wait for the other side to make room in a full ring
+buffer before giving up.
+'''
+
+_SEND_WAIT_SEC = 0.0005
+'''Sleep time between checks for room in a full ring buffer.'''
+
+
+_HEADER_SIZE = 128
+'''
+Ring buffer header: the producer's and the consumer's fields are on separate
+cache lines.
+'''
+
+_OFF_HEAD = 0
+'''
+Header offset of total bytes ever written (unsigned 64 bit).
+Only ever written by the producer.
+'''
+
+_OFF_CLOSED = 8
+'''
+Header offset of the producer's 'closed' flag (one byte).
+Only ever written by the producer.
+'''
+
+_OFF_TAIL = 64
+'''
+Header offset of total bytes ever read (unsigned 64 bit).
+Only ever written by the consumer.
+'''
+
+_U64 = struct.Struct('<Q')
+_LEN = struct.Struct('<I')
+
+_WAKE = b'\x01'
+
+
+# -----------------------------------------------------------------------------
+# Ring Buffer
+# -----------------------------------------------------------------------------
+
+class ShmRing:
+    '''
+    Single-producer/single-consumer ring buffer of length-prefixed messages in
+    shared memory.
+
+    No locks: the head (write position) is only written by the producer and
+    the tail (read position) only by the consumer. Each is published after
+    the message bytes it covers are written/read.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._shm: shared_memory.SharedMemory = None
+        '''The shared memory block: header, then ring buffer.'''
+
+        self._owner: bool = False
+        '''True if we created the shared memory and so should unlink it.'''
+
+        self._capacity: int = 0
+        '''Size of ring buffer (shared memory size, minus header).'''
+
+    def __init__(self,
+                 name:  Optional[str] = None,
+                 size:  int           = SIZE_DEFAULT) -> None:
+        '''
+        Creates a new ring buffer of `size` bytes if `name` is None,
+        otherwise attaches to the existing one named `name`.
+        '''
+        self._define_vars()
+
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True,
+                                                   size=_HEADER_SIZE + size)
+            self._owner = True
+            self._shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        self._capacity = self._shm.size - _HEADER_SIZE
+
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        '''Name of the shared memory block.'''
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        '''Size of the ring buffer in bytes.'''
+        return self._capacity
+
+    @property
+    def _head(self) -> int:
+        return _U64.unpack_from(self._shm.buf, _OFF_HEAD)[0]
+
+    @property
+    def _tail(self) -> int:
+        return _U64.unpack_from(self._shm.buf, _OFF_TAIL)[0]
+
+    @property
+    def used(self) -> int:
+        '''Number of bytes waiting to be read.'''
+        return self._head - self._tail
+
+    @property
+    def readable(self) -> bool:
+        '''True if there is a message waiting to be read.'''
+        return self._head != self._tail
+
+    @property
+    def closed(self) -> bool:
+        '''True if the producer has closed its end.'''
+        return bool(self._shm.buf[_OFF_CLOSED])
+
+    def close_producer(self) -> None:
+        '''
+        Producer is done; consumer will get EOFError once the ring is empty.
+        '''
+        self._shm.buf[_OFF_CLOSED] = 1
+
+    # -------------------------------------------------------------------------
+    # Producer
+    # -------------------------------------------------------------------------
+
+    def _put(self, position: int, data: Union[bytes, memoryview]) -> None:
+        '''
+        Copies `data` into the ring at `position`, wrapping around if needed.
+        '''
+        start = _HEADER_SIZE + (position % self._capacity)
+        first = min(len(data), _HEADER_SIZE + self._capacity - start)
+        buf = self._shm.buf
+        buf[start:start + first] = data[:first]
+        if first < len(data):
+            buf[_HEADER_SIZE:_HEADER_SIZE + len(data) - first] = data[first:]
+
+    def write(self,
+              data:    Union[bytes, memoryview],
+              timeout: float = SEND_TIMEOUT_SEC) -> bool:
+        '''
+        Writes one message. If the ring is full, waits up to `timeout` seconds
+        for room.
+
+        Returns True if the ring was empty (as far as the consumer has read)
+        right before this message, in which case the consumer might be asleep
+        and need a wake-up.
+
+        Raises MultiProcError if the message can never fit or if there's still
+        no room after `timeout`.
+        '''
+        needed = _LEN.size + len(data)
+        if needed > self._capacity:
+            raise MultiProcError(
+                f"Message of {len(data)} bytes is too big for shared "
+                f"memory ring buffer of {self._capacity} bytes.")
+
+        head = self._head
+        timeout_at = None
+        while self._capacity - (head - self._tail) < needed:
+            now = py_time.monotonic()
+            if timeout_at is None:
+                timeout_at = now + timeout
+            elif now >= timeout_at:
+                raise MultiProcError(
+                    "Timed out waiting for room in shared memory ring "
+                    f"buffer ({self._capacity} bytes) to send {len(data)} "
+                    "bytes.")
+            py_time.sleep(_SEND_WAIT_SEC)
+
+        self._put(head, _LEN.pack(len(data)))
+        self._put(head + _LEN.size, data)
+        # Publish: message is readable once head moves past it.
+        _U64.pack_into(self._shm.buf, _OFF_HEAD, head + needed)
+
+        return self._tail == head
+
+    # -------------------------------------------------------------------------
+    # Consumer
+    # -------------------------------------------------------------------------
+
+    def _get(self, position: int, size: int) -> bytes:
+        '''
+        Copies `size` bytes out of the ring at `position`, wrapping around if
+        needed.
+        '''
+        start = _HEADER_SIZE + (position % self._capacity)
+        first = min(size, _HEADER_SIZE + self._capacity - start)
+        buf = self._shm.buf
+        if first == size:
+            return bytes(buf[start:start + size])
+        return (bytes(buf[start:start + first])
+                + bytes(buf[_HEADER_SIZE:_HEADER_SIZE + size - first]))
+
+    def read(self) -> Optional[bytes]:
+        '''
+        Reads one message, or returns None if there isn't one.
+        '''
+        tail = self._tail
+        if self._head == tail:
+            return None
+
+        size = _LEN.unpack(self._get(tail, _LEN.size))[0]
+        data = self._get(tail + _LEN.size, size)
+        # Release: producer can reuse the space once tail moves past it.
+        _U64.pack_into(self._shm.buf, _OFF_TAIL, tail + _LEN.size + size)
+        return data
+
+    # -------------------------------------------------------------------------
+    # Clean-Up
+    # -------------------------------------------------------------------------
+
+    def release(self) -> None:
+        '''
+        Detach from the shared memory, and destroy it if we're the owner.
+        '''
+        if not self._shm:
+            return
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        if not self._shm:
+            return f"{self.__class__.__name__}(released)"
+        return (f"{self.__class__.__name__}('{self.name}', "
+                f"{self.used}/{self._capacity})")
+
+    def __repr__(self) -> str:
+        return '<v.shm-ring:' + str(self) + '>'
+
+
+# -----------------------------------------------------------------------------
+# Connection
+# -----------------------------------------------------------------------------
+
+class ShmConnection:
+    '''
+    One end of a shared-memory 'pipe'. Use `pipe()` to create a pair.
+
+    Sends into one ring buffer and receives from the other. `fileno()` is the
+    wake-up pipe's, so these can be waited on just like a regular
+    `multiprocessing.connection.Connection`.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._tx: ShmRing = None
+        '''Ring buffer we send into.'''
+
+        self._rx: ShmRing = None
+        '''Ring buffer we receive from.'''
+
+        self._wake_tx: mp_conn = None
+        '''Wake-up pipe end for poking the other side.'''
+
+        self._wake_rx: mp_conn = None
+        '''Wake-up pipe end the other side pokes us with.'''
+
+    def __init__(self,
+                 tx:      ShmRing,
+                 rx:      ShmRing,
+                 wake_tx: mp_conn,
+                 wake_rx: mp_conn) -> None:
+        '''DO NOT CALL THIS - use `pipe()`.'''
+        self._define_vars()
+
+        self._tx      = tx
+        self._rx      = rx
+        self._wake_tx = wake_tx
+        self._wake_rx = wake_rx
+
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        '''True if this end has been closed.'''
+        return self._tx is None
+
+    def fileno(self) -> int:
+        '''
+        File descriptor that is readable when there is (probably) something
+        for us to receive.
+        '''
+        return self._wake_rx.fileno()
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _check_closed(self) -> None:
+        if self._tx is None:
+            raise OSError("handle is closed")
+
+    def _drain_wakes(self) -> None:
+        '''
+        Clear out wake-ups. Only call when our rx ring is empty, and always
+        check the ring again after - something could have been sent (with its
+        wake-up) right before we drained.
+        '''
+        try:
+            while self._wake_rx.poll():
+                self._wake_rx.recv_bytes()
+        except (EOFError, OSError):
+            # Other side is gone; nothing left to drain.
+            pass
+
+    # -------------------------------------------------------------------------
+    # Connection API
+    # -------------------------------------------------------------------------
+
+    def send_bytes(self,
+                   buf:    Union[bytes, bytearray, memoryview],
+                   offset: int           = 0,
+                   size:   Optional[int] = None) -> None:
+        '''
+        Send bytes; the other side gets them from `recv_bytes()`.
+        '''
+        self._check_closed()
+        data = memoryview(buf).cast('B')
+        if size is None:
+            size = len(data) - offset
+        if self._tx.write(data[offset:offset + size]):
+            try:
+                self._wake_tx.send_bytes(_WAKE)
+            except OSError:
+                # They hung up on us. Nothing to wake.
+                pass
+
+    def send(self, obj: Any) -> None:
+        '''
+        Send a picklable object; the other side gets it from `recv()`.
+        '''
+        self.send_bytes(ForkingPickler.dumps(obj))
+
+    def recv_bytes(self, maxlength: Optional[int] = None) -> bytes:
+        '''
+        Receive bytes. Blocks until there is something.
+
+        Raises EOFError if there is nothing and the other side closed.
+
+        Leaves the wake-ups alone - draining them here, after the ring empties,
+        could drain the wake-up of something sent right after our read.
+        `poll()` drains them and checks the ring again after.
+        '''
+        self._check_closed()
+        while True:
+            data = self._rx.read()
+            if data is not None:
+                if maxlength is not None and len(data) > maxlength:
+                    raise OSError("bad message length")
+                return data
+
+            if self._rx.closed:
+                raise EOFError
+            self.poll(None)
+
+    def recv(self) -> Any:
+        '''
+        Receive a picklable object. Blocks until there is something.
+        '''
+        return ForkingPickler.loads(self.recv_bytes())
+
+    def poll(self, timeout: Optional[float] = 0.0) -> bool:
+        '''
+        Returns True if there is something to receive (or the other side has
+        closed, so `recv()` won't block).
+
+        `timeout` is how long to wait; None is forever.
+        '''
+        self._check_closed()
+        timeout_at = (None
+                      if timeout is None else
+                      py_time.monotonic() + timeout)
+        while True:
+            if self._rx.readable or self._rx.closed:
+                return True
+            self._drain_wakes()
+            if self._rx.readable or self._rx.closed:
+                return True
+
+            remaining = (None
+                         if timeout_at is None else
+                         timeout_at - py_time.monotonic())
+            if remaining is not None and remaining <= 0:
+                return False
+            wait([self._wake_rx], remaining)
+
+    def close(self) -> None:
+        '''
+        Close this end. The other end will get EOFError once it has received
+        everything we sent.
+        '''
+        if self._tx is None:
+            return
+        self._tx.close_producer()
+        try:
+            self._wake_tx.send_bytes(_WAKE)
+        except OSError:
+            pass
+        self.detach()
+
+    def detach(self) -> None:
+        '''
+        Let go of this end without closing the connection - e.g. in the parent
+        process after this end has been handed to a sub-process. Copies of this
+        end elsewhere (the sub-process's) are still open and working.
+        '''
+        if self._tx is None:
+            return
+        self._wake_tx.close()
+        self._wake_rx.close()
+        self._tx.release()
+        self._rx.release()
+        self._tx = None
+        self._rx = None
+
+    # -------------------------------------------------------------------------
+    # Pickling
+    # -------------------------------------------------------------------------
+
+    def __reduce__(self) -> Tuple:
+        '''
+        Pickles down to the rings' names and the wake-up pipe ends, so this
+        can be handed to a spawned sub-process.
+        '''
+        self._check_closed()
+        return (_rebuild,
+                (self._tx.name, self._rx.name, self._wake_tx, self._wake_rx))
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(tx: {self._tx}, rx: {self._rx})"
+
+    def __repr__(self) -> str:
+        return '<v.shm-conn:' + str(self) + '>'
+
+
+def _rebuild(tx_name: str,
+             rx_name: str,
+             wake_tx: mp_conn,
+             wake_rx: mp_conn) -> ShmConnection:
+    '''
+    Unpickle a ShmConnection: attach to its rings.
+    '''
+    return ShmConnection(ShmRing(name=tx_name),
+                         ShmRing(name=rx_name),
+                         wake_tx,
+                         wake_rx)
+
+
+# -----------------------------------------------------------------------------
+# Pipe
+# -----------------------------------------------------------------------------
+
+def pipe(size: Optional[int] = None) -> Tuple[ShmConnection, ShmConnection]:
+    '''
+    Create a pair of connected ShmConnections, like `multiprocessing.Pipe()`.
+    The first one owns the shared memory, so give the second one to the
+    sub-process (and `detach()` from it once the sub-process has it).
+
+    `size` is the size (in bytes) of each direction's ring buffer. Defaults
+    to SIZE_DEFAULT.
+    '''
+    size = size or SIZE_DEFAULT
+    ring_ab = ShmRing(size=size)
+    ring_ba = ShmRing(size=size)
+    wake_ab_rx, wake_ab_tx = multiprocessing.Pipe(duplex=False)
+    wake_ba_rx, wake_ba_tx = multiprocessing.Pipe(duplex=False)
+
+    # End 'a' owns the shared memory; end 'b' just attaches to it.
+    end_a = ShmConnection(ring_ab, ring_ba, wake_ab_tx, wake_ba_rx)
+    end_b = ShmConnection(ShmRing(name=ring_ba.name),
+                          ShmRing(name=ring_ab.name),
+                          wake_ba_tx,
+                          wake_ab_rx)
+    return end_a, end_b
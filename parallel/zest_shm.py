@@ -0,0 +1,169 @@
+# coding: utf-8
+
+'''
+Tests for shm.py (shared-memory ring buffer transport).
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Tuple, Literal
+
+
+import multiprocessing
+from multiprocessing.connection import wait
+
+
+from veredi.zest.base.unit import ZestBase
+
+from .exceptions           import MultiProcError
+from .                     import shm
+from .multiproc            import ProcToSubComm, SubToProcComm
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+def _echo(conn: shm.ShmConnection) -> None:
+    '''
+    Sub-process: sends back everything it receives, until it gets None.
+    '''
+    while True:
+        obj = conn.recv()
+        if obj is None:
+            break
+        conn.send(obj)
+    conn.close()
+
+
+# -----------------------------------------------------------------------------
+# Test Code
+# -----------------------------------------------------------------------------
+
+class Test_Shm(ZestBase):
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self):
+        self.owner, self.other = shm.pipe(256)
+
+    def tear_down(self):
+        self.other.close()
+        self.owner.close()
+        self.owner = None
+        self.other = None
+
+    def test_send_recv(self):
+        self.assertFalse(self.other.poll())
+
+        self.owner.send(('hello', {'there': 1}))
+        self.owner.send_bytes(b'raw')
+        self.assertTrue(self.other.poll())
+        # Wake-up pipe is how waiters find out.
+        self.assertEqual(wait([self.other], 0), [self.other])
+
+        self.assertEqual(self.other.recv(), ('hello', {'there': 1}))
+        self.assertEqual(self.other.recv_bytes(), b'raw')
+        self.assertFalse(self.other.poll())
+        self.assertEqual(wait([self.other], 0), [])
+
+        # Other direction.
+        self.other.send(42)
+        self.assertTrue(self.owner.poll(0.1))
+        self.assertEqual(self.owner.recv(), 42)
+
+    def test_wake_ups(self):
+        # Sent right after the ring was emptied: waiters must still find out.
+        self.owner.send('one')
+        self.assertEqual(self.other.recv(), 'one')
+        self.owner.send('two')
+        self.assertEqual(wait([self.other], 0), [self.other])
+        self.assertEqual(self.other.recv(), 'two')
+
+        # Left-over wake-ups are gone once poll() finds nothing.
+        self.assertFalse(self.other.poll())
+        self.assertEqual(wait([self.other], 0), [])
+
+    def test_wrap_around(self):
+        # Enough traffic to wrap around the 256 byte ring several times.
+        for i in range(50):
+            data = bytes([i]) * (i + 1)
+            self.owner.send_bytes(data)
+            self.assertEqual(self.other.recv_bytes(), data)
+
+    def test_full(self):
+        with self.assertRaises(MultiProcError):
+            self.owner.send_bytes(bytes(1024))
+
+        self.owner.send_bytes(bytes(200))
+        with self.assertRaises(MultiProcError):
+            self.owner._tx.write(bytes(200), timeout=0.01)
+        self.assertEqual(len(self.other.recv_bytes()), 200)
+
+    def test_close(self):
+        self.owner.send('last')
+        self.owner.close()
+        self.assertTrue(self.other.poll())
+        self.assertEqual(self.other.recv(), 'last')
+        with self.assertRaises(EOFError):
+            self.other.recv()
+
+    def test_comms(self):
+        # Comms objects use it just like a pipe, batched or not.
+        parent = ProcToSubComm(name='parent', process=None,
+                               pipe=self.owner, shutdown=None,
+                               batched=True)
+        child = SubToProcComm(name='child', config=None, entry_fn=None,
+                              pipe=self.other, shutdown=None)
+        parent.send('one', None)
+        parent.send_many([('two', None), ('three', None)])
+        self.assertTrue(child.has_data())
+        self.assertEqual(child.recv_many(),
+                         [('one', None), ('two', None), ('three', None)])
+        self.assertFalse(child.has_data())
+
+    def test_process(self):
+        # Big enough to hold all the echoes while we're still sending.
+        owner, other = shm.pipe(64 * 1024)
+        proc = multiprocessing.Process(target=_echo, args=(other, ))
+        proc.start()
+        # Child has its own copy now.
+        other.detach()
+        self.assertTrue(other.closed)
+        try:
+            for i in range(100):
+                owner.send(('msg', i))
+            for i in range(100):
+                self.assertEqual(owner.recv(), ('msg', i))
+            owner.send(None)
+            with self.assertRaises(EOFError):
+                owner.recv()
+        finally:
+            proc.join(5)
+            owner.close()
+        self.assertEqual(proc.exitcode, 0)
+
+
+# --------------------------------Unit Testing---------------------------------
+# --                      Main Command Line Entry Point                      --
+# -----------------------------------------------------------------------------
+
+# Can't just run file from here... Do:
+#   doc-veredi python -m veredi.parallel.zest_shm
+
+if __name__ == '__main__':
+    import unittest
+    # log.set_level(log.Level.DEBUG)
+    unittest.main()
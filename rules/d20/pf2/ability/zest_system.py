@@ -255,6 +255,33 @@ class Test_AbilitySystem(ZestSystem):
         self.assertEqual(result.amount.milieu,
                          'strength.modifier')
 
+    def test_canonical(self):
+        defs = self.system._rule_defs
+
+        # Lookup table should agree with walking the definitions.
+        for name in ('strength', 'str', 'str.mod', 'strength.modifier',
+                     'str.score', 'dex.mod', 'cha'):
+            self.assertIn(name, defs._canon_table)
+            self.assertEqual(
+                defs.canonical(name, None),
+                defs._canon_walk(name, None, False, True).dotted)
+
+        self.assertEqual(defs.canonical('str.mod', None),
+                         'strength.modifier')
+        self.assertEqual(defs.canonical_path('str.mod', None),
+                         ('strength', 'modifier'))
+        self.assertEqual(defs.canonical('str', None),
+                         'strength.score')
+
+        # 'this' needs the milieu, so goes through the cache.
+        self.assertEqual(defs.canonical('this.score', 'strength.modifier'),
+                         'strength.score')
+        self.assertIn(('this.score', 'strength.modifier'), defs._canon_cache)
+
+        # Not ours.
+        self.assertFalse(defs.canonical('jeff', None))
+        self.assertEqual(defs.canonical_path('jeff', None), ())
+
     # ------------------------------
     # Commands
     # ------------------------------
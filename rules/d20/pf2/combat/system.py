@@ -15,7 +15,7 @@ That is the nexus of punching people in the face.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Set, Type, Union)
+                    Optional, Set, Type, Union, Dict)
 if TYPE_CHECKING:
     from decimal                        import Decimal
     from veredi.base.context            import VerediContext
@@ -32,6 +32,7 @@ from veredi.game.ecs.time               import TimeManager
 from veredi.game.ecs.component          import ComponentManager
 from veredi.game.ecs.entity             import EntityManager
 from veredi.game.ecs.base.component     import Component
+from veredi.game.ecs.base.identity      import EntityId
 
 from veredi.game.ecs.const              import (SystemTick,
                                                 SystemPriority)
@@ -120,6 +121,16 @@ class CombatSystem(D20RulesSystem,
                                    | SystemTick.STANDARD
                                    | SystemTick.POST)
 
+        # ---
+        # Combat Stuff
+        # ---
+        self._turn_order: Optional[Dict[EntityId, None]] = None
+        '''
+        EntityIds of everyone who can take a turn in combat, in turn order.
+        Dict is used as an insertion-ordered set. None until first filled in
+        from our entity query.
+        '''
+
     # -------------------------------------------------------------------------
     # System Registration / Definition
     # -------------------------------------------------------------------------
@@ -259,9 +270,11 @@ class CombatSystem(D20RulesSystem,
 
         tick = SystemTick.TIME
         print("TODO: THIS TICK!", tick)
-        for entity in self._wanted_entities(tick):
+        self._update_turn_order()
+        for entity_id in self._turn_order:
             # Check if entity in turn order has a combat action queued up.
             # Also make sure to check if entity/component still exist.
+            entity = self._manager.entity.get(entity_id)
             if not entity:
                 continue
             component = entity.get(AttackComponent)
@@ -292,10 +305,26 @@ class CombatSystem(D20RulesSystem,
 
         #     process action
 
-        # check for entities to add to turn order tracker
-
         return self._health_check(SystemTick.TIME)
 
+    def _update_turn_order(self) -> None:
+        '''
+        Add entities to/remove entities from the turn order. Only need the
+        changes since last tick for that, once the turn order has been filled
+        in with everyone already in our entity query.
+        '''
+        combatants = self._wanted_query()
+        if self._turn_order is None:
+            self._turn_order = {entity.id: None for entity in combatants}
+            return
+
+        for entity_id in combatants.added:
+            log.debug("Entity {} joins the turn order.", entity_id)
+            self._turn_order[entity_id] = None
+        for entity_id in combatants.removed:
+            log.debug("Entity {} leaves the turn order.", entity_id)
+            self._turn_order.pop(entity_id, None)
+
     def _update_pre(self) -> VerediHealth:
         '''
         Pre-update. For any systems that need to squeeze in something just
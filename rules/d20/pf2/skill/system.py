@@ -223,7 +223,8 @@ class SkillSystem(D20RulesSystem,
                             InputContext.input_id(context),
                             # TODO [2020-07-11]: a proper output type...
                             Recipient.BROADCAST),
-            context)
+            context,
+            fill_many_fn=self._query_many)
 
         return CommandStatus.successful(context)
 
@@ -9,7 +9,7 @@ A D20 Rules System Base Class.
 # -----------------------------------------------------------------------------
 
 from typing import (TYPE_CHECKING,
-                    Optional, Type, Union, Tuple)
+                    Optional, Type, Union, Iterable, Tuple, Dict)
 from veredi.base.null import Null, Nullable
 if TYPE_CHECKING:
     from veredi.base.context import VerediContext
@@ -147,6 +147,33 @@ class D20RulesSystem(System,
 
         return result
 
+    def _query_many(self,
+                    entity_id: EntityId,
+                    entries:   Iterable[str],
+                    context:   'VerediContext'
+                    ) -> Dict[str, Nullable[ValueMilieu]]:
+        '''
+        `_query()` for many entries at once: gets the entity's
+        `self._component_type` once and gets each entry from it.
+
+        Returns dict of entry -> result.
+        '''
+        entity, component = self._manager.get_with_log(
+            f'{self.klass}._query_many',
+            entity_id,
+            self._component_type,
+            context=context)
+        if not entity or not component:
+            return {entry: Null() for entry in entries}
+
+        results = {entry: self._query_value(component, entry)
+                   for entry in entries}
+        log.debug("'{}' results are: {}",
+                  self.klass, results,
+                  context=context)
+
+        return results
+
     def _query_value(self,
                      component: Component,
                      entry: Union[str, Tuple[str, str]]
@@ -166,8 +193,8 @@ class D20RulesSystem(System,
         if isinstance(entry, tuple):
             return self._query_this(component, *entry)
 
-        entry = self._rule_defs.canonical(entry, None)
-        return self._query_split(component, *label.regularize(entry))
+        return self._query_split(component,
+                                 *self._rule_defs.canonical_path(entry, None))
 
     def _query_this(self,
                     component: Component,
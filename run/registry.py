@@ -10,7 +10,7 @@ Set up the registries.
 
 from typing import (TYPE_CHECKING,
                     Optional, Union, Type, Any, NewType, Callable,
-                    Tuple, Set, List, Dict, Iterator)
+                    Tuple, Set, List, Dict, Iterable, Iterator)
 from veredi.base.null import Nullable, Null, null_or_none
 from types import ModuleType
 if TYPE_CHECKING:
@@ -21,6 +21,8 @@ import os
 import importlib
 import re
 import enum
+import json
+import hashlib
 
 
 from veredi.logs               import log
@@ -29,6 +31,7 @@ from veredi.base.const         import (LIB_VEREDI_ROOT,
                                        VEREDI_NAME_CODE,
                                        VEREDI_NAME_DISPLAY)
 from veredi.base.strings       import label, text
+from veredi.base               import registrar
 from veredi.data               import background
 
 # Configuration Stuff
@@ -153,6 +156,27 @@ NOTE: Regexs must return a match for strings they /do/ want to ignore.
 '''
 
 
+_MANIFEST_VERSION: int = 1
+'''
+Registration manifest format version. Manifests of any other version are
+stale.
+'''
+
+
+_MANIFEST_DIR_DEFAULT: str = '__pycache__'
+'''
+Default directory (in the registration entry's root) for its manifest.
+Already in `_FIND_MODULE_IGNORES_DIRS`, so writing the manifest doesn't
+change anything the manifest watches.
+'''
+
+
+_MANIFEST_NAME_FMT: str = 'registration.{dotted}.json'
+'''
+Default filename format for a registration entry's manifest.
+'''
+
+
 # ------------------------------
 # Config Settings
 # ------------------------------
@@ -219,6 +243,20 @@ class ConfigRegistration(enum.Enum):
     Overrides auto-detection of unit-testing that registration does.
     '''
 
+    MANIFEST = label.regularize('manifest')
+    '''
+    Registration manifest file to use/create: `true` for the default path
+    (in the root's '__pycache__' directory), or a path. While the manifest is
+    fresh, registration skips searching the file tree.
+    '''
+
+    LAZY = label.regularize('lazy')
+    '''
+    A flag to register registrees lazily, when possible: their module is
+    imported on the first `get_by_dotted()` for something it registers.
+    Requires a fresh manifest to know who registers what.
+    '''
+
     # ------------------------------
     # Helpers
     # ------------------------------
@@ -347,6 +385,39 @@ class ConfigRegistration(enum.Enum):
         '''
         return klass._get(klass.FORCE_TEST, entry)
 
+    @classmethod
+    def manifest(klass:  Type['ConfigRegistration'],
+                 entry:  Dict[str, Any],
+                 config: 'Configuration',
+                 root:   paths.Path,
+                 dotted: label.DotStr) -> Optional[paths.Path]:
+        '''
+        Returns the resolved path to the MANIFEST file of this registration
+        entry, or None if it doesn't want one.
+
+        MANIFEST can be `true` for the default path in `root`, or a path
+        (relative paths are relative to the config file).
+        '''
+        field = klass._get(klass.MANIFEST, entry)
+        if not field:
+            return None
+        if field is True:
+            return (root
+                    / _MANIFEST_DIR_DEFAULT
+                    / _MANIFEST_NAME_FMT.format(dotted=dotted))
+        return config.path(field)
+
+    @classmethod
+    def lazy(klass: Type['ConfigRegistration'],
+             entry: Dict[str, Any]) -> bool:
+        '''
+        Returns the LAZY entry of this registration entry.
+
+        LAZY, if it exists, should be true to import registrees on first use
+        instead of during registration.
+        '''
+        return bool(klass._get(klass.LAZY, entry))
+
 
 # -----------------------------------------------------------------------------
 # Initialize Registries
@@ -358,6 +429,9 @@ def registration(configuration: Configuration) -> None:
     and invisible elephants.
 
     Eagerly loads them so they are available at run-time when needed.
+      - Unless a registration entry is configured to be lazy. Then its
+        registrees are imported on first use, if its manifest knows enough
+        about them. See ConfigRegistration.MANIFEST and ConfigRegistration.LAZY.
     '''
     log_dotted = label.normalize(_DOTTED, 'registration')
     log.group_multi(_LOG_INIT,
@@ -507,6 +581,9 @@ def _register_entry(configuration: Configuration,
     ignores = (ConfigRegistration.path_ignore_files(entry) or None)
     ignore_dirs = (ConfigRegistration.path_ignore_dirs(entry) or None)
     find_ut = (ConfigRegistration.force_test(entry) or None)
+    manifest_path = ConfigRegistration.manifest(entry, configuration,
+                                                root, dotted)
+    lazy = ConfigRegistration.lazy(entry)
 
     log.group_multi(_LOG_INIT,
                     log_dotted,
@@ -524,23 +601,47 @@ def _register_entry(configuration: Configuration,
                         'registrees_test': registrees_ut,
                         'ignores': ignores,
                         'unit-test': find_ut,
+                        'manifest': manifest_path,
+                        'lazy': lazy,
                     })
 
+    # ---
+    # Manifest?
+    # ---
+    manifest = None
+    manifest_key = None
+    if manifest_path:
+        manifest_key = _manifest_key(root,
+                                     registrars, registrars_ut,
+                                     registrees, registrees_ut,
+                                     ignores, ignore_dirs,
+                                     find_ut)
+        manifest = _manifest_load(manifest_path, manifest_key, log_dotted)
+
     # ---
     # Search w/ settings.
     # ---
-    log.group_multi(_LOG_INIT,
-                    log_dotted,
-                    "Searching {} ({}) for registration...\n"
-                    "  root: {}",
-                    name, dotted, root)
-
-    module_names = _find_modules(root,
-                                 registrars, registrars_ut,
-                                 registrees, registrees_ut,
-                                 log_dotted,
-                                 ignores, ignore_dirs,
-                                 find_ut)
+    watch = None
+    if manifest:
+        module_names = (manifest['registrars'],
+                        manifest['registrees'],
+                        manifest['unknowns'])
+    else:
+        log.group_multi(_LOG_INIT,
+                        log_dotted,
+                        "Searching {} ({}) for registration...\n"
+                        "  root: {}",
+                        name, dotted, root)
+
+        # Only need to know what to watch if we're making a manifest.
+        watch = [] if manifest_path else None
+        module_names = _find_modules(root,
+                                     registrars, registrars_ut,
+                                     registrees, registrees_ut,
+                                     log_dotted,
+                                     ignores, ignore_dirs,
+                                     find_ut,
+                                     watch)
     registrar_names, registree_names, unknown_names = module_names
 
     # TODO v://future/2021-03-14T12:27:54
@@ -576,8 +677,22 @@ def _register_entry(configuration: Configuration,
     for name in registrar_names:
         imported.append(_import(name, log_dotted))
 
+    # Lazy registrees get imported on first use instead of now.
+    deferred = set()
+    if manifest and lazy:
+        deferred = _defer(manifest['lazy'], log_dotted)
+
+    # Record what each registree registers if we're making a manifest.
+    recorded = {}
     for name in registree_names:
-        imported.append(_import(name, log_dotted))
+        if name in deferred:
+            continue
+        if watch is None:
+            imported.append(_import(name, log_dotted))
+            continue
+        with registrar.recording() as registered:
+            imported.append(_import(name, log_dotted))
+        recorded[name] = registered
 
     log.group_multi(_LOG_INIT,
                     log_dotted,
@@ -586,9 +701,13 @@ def _register_entry(configuration: Configuration,
                     f"imported for {name} ({dotted}).")
 
     # If we imported nothing... that's probably a fail.
-    if len(imported) <= 0:
+    if len(imported) + len(deferred) <= 0:
         return False, dotted
 
+    if watch is not None:
+        _manifest_save(manifest_path, manifest_key, watch,
+                       module_names, recorded, log_dotted)
+
     # ---
     # Set-up modules?
     # ---
@@ -682,6 +801,227 @@ def _import(module: str, log_dotted: label.DotStr) -> ModuleType:
     return None
 
 
+# -----------------------------------------------------------------------------
+# Registration Manifest
+# -----------------------------------------------------------------------------
+# A cache of what `_find_modules()` found and what each registree module
+# registered, so start-up can skip searching the file tree (and, if lazy,
+# skip importing registrees) while nothing has changed.
+
+def _manifest_strs(values: Optional[Iterable[Union[str, re.Pattern]]]
+                   ) -> Optional[List[str]]:
+    '''
+    Returns strings/regex patterns in `values` as a sorted list of strings,
+    or None if no `values`.
+    '''
+    if not values:
+        return None
+    return sorted((value.pattern
+                   if isinstance(value, re.Pattern) else
+                   str(value))
+                  for value in values)
+
+
+def _manifest_key(root:          paths.Path,
+                  registrars:    Optional[List[str]],
+                  registrars_ut: Optional[List[str]],
+                  registrees:    Optional[List[str]],
+                  registrees_ut: Optional[List[str]],
+                  ignores:       Optional[Set[Union[str, re.Pattern]]],
+                  ignore_dirs:   Optional[Set[Union[str, re.Pattern]]],
+                  find_ut:       Optional[bool]) -> str:
+    '''
+    Hash the registration entry's search settings. A manifest made with any
+    other settings is stale.
+    '''
+    if find_ut is None:
+        find_ut = bool(background.testing.get_unit_testing())
+
+    settings = [
+        _MANIFEST_VERSION,
+        str(root),
+        _manifest_strs(registrars),
+        _manifest_strs(registrars_ut),
+        _manifest_strs(registrees),
+        _manifest_strs(registrees_ut),
+        _manifest_strs(ignores),
+        _manifest_strs(ignore_dirs),
+        find_ut,
+    ]
+    return hashlib.sha1(json.dumps(settings).encode('utf-8')).hexdigest()
+
+
+def _manifest_mtimes(watch: Iterable[str]) -> Optional[str]:
+    '''
+    Hash the modification times of all the `watch` paths.
+
+    Directories are in `watch` so that adding/removing files changes the hash;
+    files are in it so that editing them changes the hash.
+
+    Returns None if a path no longer exists.
+    '''
+    digest = hashlib.sha1()
+    try:
+        for path in watch:
+            digest.update(f"{path}\0{os.stat(path).st_mtime_ns}\n".encode())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _manifest_lazy(recorded: Dict[str, List[registrar.RecordType]]
+                   ) -> Dict[str, List[List[label.DotStr]]]:
+    '''
+    Figure out which registree modules can be registered lazily, given what
+    each registered when imported.
+
+    A registree module can be lazy if it:
+      - registered something,
+      - only registered (no ignores) with registrars that allow lazy
+        registration,
+      - and has no `_REGISTRATION_FUNC_NAME` function to run.
+
+    Returns a dict of: module name -> list of [registrar dotted, dotted].
+    '''
+    lazy = {}
+    for module_name, registered in recorded.items():
+        if not registered:
+            continue
+        if any(dotted is None or not allowed
+               for _, dotted, allowed in registered):
+            continue
+        if hasattr(importlib.import_module(module_name),
+                   _REGISTRATION_FUNC_NAME):
+            continue
+
+        lazy[module_name] = [[registrar_dotted, dotted]
+                             for registrar_dotted, dotted, _ in registered]
+    return lazy
+
+
+def _manifest_load(path:       paths.Path,
+                   key:        str,
+                   log_dotted: label.DotStr) -> Optional[Dict[str, Any]]:
+    '''
+    Load the registration manifest at `path`.
+
+    Returns the manifest if it is fresh: made with the same settings (`key`),
+    and nothing it watches has changed since.
+
+    Returns None if it doesn't exist, can't be read, or is stale.
+    '''
+    try:
+        with path.open('r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        log.group_multi(_LOG_INIT,
+                        log_dotted,
+                        "No registration manifest yet: {}",
+                        path)
+        return None
+    except (OSError, ValueError) as error:
+        log.group_multi(_LOG_INIT,
+                        log_dotted,
+                        "Could not read registration manifest; ignoring it. "
+                        "{}: {}",
+                        path, error,
+                        log_minimum=log.Level.WARNING)
+        return None
+
+    stale = None
+    if (not isinstance(manifest, dict)
+            or manifest.get('version') != _MANIFEST_VERSION):
+        stale = "manifest version changed"
+    elif manifest.get('key') != key:
+        stale = "registration settings changed"
+    elif (not manifest.get('mtimes')
+          or manifest['mtimes'] != _manifest_mtimes(manifest['watch'])):
+        stale = "file tree changed"
+
+    if stale:
+        log.group_multi(_LOG_INIT,
+                        log_dotted,
+                        "Registration manifest is stale ({}): {}",
+                        stale, path)
+        return None
+
+    log.group_multi(_LOG_INIT,
+                    log_dotted,
+                    "Registration manifest is fresh; skipping search: {}",
+                    path)
+    return manifest
+
+
+def _manifest_save(path:         paths.Path,
+                   key:          str,
+                   watch:        List[str],
+                   module_names: Tuple[List[str], List[str], List[str]],
+                   recorded:     Dict[str, List[registrar.RecordType]],
+                   log_dotted:   label.DotStr) -> None:
+    '''
+    Save a registration manifest to `path`.
+
+    `module_names` is the output of `_find_modules()`, `watch` is what it
+    scanned, and `recorded` is what each registree module registered.
+
+    Failing to save is logged, not raised; we just won't have a manifest.
+    '''
+    registrar_names, registree_names, unknown_names = module_names
+    try:
+        # Create the file before hashing so that, if it's in a directory we
+        # watch, creating it doesn't make it stale.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+        manifest = {
+            'version':    _MANIFEST_VERSION,
+            'key':        key,
+            'mtimes':     _manifest_mtimes(watch),
+            'watch':      watch,
+            'registrars': registrar_names,
+            'registrees': registree_names,
+            'unknowns':   unknown_names,
+            'lazy':       _manifest_lazy(recorded),
+        }
+        with path.open('w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+
+    except OSError as error:
+        log.group_multi(_LOG_INIT,
+                        log_dotted,
+                        "Could not save registration manifest. {}: {}",
+                        path, error,
+                        log_minimum=log.Level.WARNING)
+        return
+
+    log.group_multi(_LOG_INIT,
+                    log_dotted,
+                    "Saved registration manifest: {}",
+                    path)
+
+
+def _defer(lazy:       Dict[str, List[List[label.DotStr]]],
+           log_dotted: label.DotStr) -> Set[str]:
+    '''
+    Defer registration of all of a manifest's `lazy` registree modules until
+    something they register is asked for.
+
+    Returns the set of deferred module names.
+    '''
+    deferred = set()
+    for module_name, registered in lazy.items():
+        for registrar_dotted, dotted in registered:
+            registrar.defer(registrar_dotted, dotted, module_name)
+        deferred.add(module_name)
+
+    log.group_multi(_LOG_INIT,
+                    log_dotted,
+                    "Deferred {} registree {} for lazy registration.",
+                    len(deferred),
+                    text.plural(deferred, 'module'))
+    return deferred
+
+
 # -----------------------------------------------------------------------------
 # Smart searching?
 # -----------------------------------------------------------------------------
@@ -698,6 +1038,7 @@ def _find_modules(root:          paths.Path,
                   ignores:       Optional[Set[Union[str, re.Pattern]]] = None,
                   ignore_dirs:   Optional[Set[Union[str, re.Pattern]]] = None,
                   find_ut:       Optional[bool]                        = None,
+                  watch:         Optional[List[str]]                   = None,
                   ) -> Tuple[List[str], List[str], List[str]]:
     '''
     Finds all modules in `root` and subdirectories that match our
@@ -725,6 +1066,9 @@ def _find_modules(root:          paths.Path,
     `log_dotted` is only used for logging and will be
     `{_DOTTED}._find_modules' if not provided.
 
+    `watch`, if provided, will have every directory scanned and python file
+    found appended to it (as path strings) for the registration manifest.
+
     Returns a 3-tuple of lists of strings of module names:
       - Tuple is:
         - Tuple[0]: Registrars found.
@@ -862,7 +1206,8 @@ def _find_modules(root:          paths.Path,
                       import_registrees,
                       ignores,
                       ignore_dirs,
-                      find_ut)
+                      find_ut,
+                      watch)
 
 
 def submodule(module_relative: paths.Path) -> label.DotStr:
@@ -1147,7 +1492,8 @@ def _scan_tree(log_dotted:        Optional[label.DotStr],
                import_registrees: List[str],
                ignore_files:      Set[Union[str, re.Pattern]],
                ignore_dirs:       Set[re.Pattern],
-               find_ut:           bool
+               find_ut:           bool,
+               watch:             Optional[List[str]] = None
                ) -> Tuple[List[str], List[str], List[str]]:
     '''
     Find the import modules using os's `scandir()`, which is much faster than
@@ -1160,6 +1506,9 @@ def _scan_tree(log_dotted:        Optional[label.DotStr],
       - No way to stop it from walking all of ".git/", or other 'ignore' dirs.
       - Doesn't return DirEntry, so had to do additional `posix.stat()` to
         figure out file/dir.
+
+    If `watch` is provided, appends all scanned directories and python files
+    to it.
     '''
     # Original idea from https://stackoverflow.com/a/5135444/425816
     # But using os.walk, which uses os.scandir, which is much much more
@@ -1189,6 +1538,8 @@ def _scan_tree(log_dotted:        Optional[label.DotStr],
     # Pull the next directory string off of `scans` and do a scan of it for
     # files/dirs we want.
     for directory in scans:
+        if watch is not None:
+            watch.append(str(directory))
         with os.scandir(directory) as entries:
             for entry in entries:
                 scanned_paths += 1
@@ -1211,6 +1562,10 @@ def _scan_tree(log_dotted:        Optional[label.DotStr],
                 # ---
                 # Set-up for checking files.
                 # ---
+                if (watch is not None
+                        and entry.name.endswith(('.py', '.pyw'))):
+                    watch.append(entry.path)
+
                 path_relative = paths.cast(entry.path).relative_to(root_path)
 
                 # ---
@@ -12,15 +12,21 @@ Test our registry/registrar/registree finding functionality.
 from typing import TYPE_CHECKING, Optional, Iterable, Tuple, Literal
 from types import ModuleType
 
+import os
+import sys
+import shutil
+import tempfile
+
 
 from veredi.zest.base.unit import ZestBase
 from veredi.zest.zpath     import TestType
 
-from veredi.logs         import log
-from veredi.base.context import UnitTestContext
-from veredi.base.strings import label
-from veredi.base         import paths
-from veredi.data         import background
+from veredi.logs            import log
+from veredi.base.context    import UnitTestContext
+from veredi.base.strings    import label
+from veredi.base            import paths
+from veredi.base.exceptions import RegistryError
+from veredi.data            import background
 
 
 # ------------------------------
@@ -28,12 +34,34 @@ from veredi.data         import background
 # ------------------------------
 from . import registry
 from veredi.base import const
+from veredi.base import registrar
 
 
 # -----------------------------------------------------------------------------
 # Constants
 # -----------------------------------------------------------------------------
 
+_LAZY_MODULE: str = 'zest_run_registry_lazy_registree'
+'''
+Module name for the registree module `ZestLazyRegistration` creates.
+'''
+
+
+# -----------------------------------------------------------------------------
+# Test Registrar
+# -----------------------------------------------------------------------------
+
+class ZestLazyRegistrar(registrar.CallRegistrar,
+                        name_dotted='veredi.zest.run.registry.lazy',
+                        name_string='zest.registry.lazy',
+                        name_klass=None):
+    '''
+    Registrar for `ZestLazyRegistration`'s registree module to register to.
+    '''
+
+    instance: Optional['ZestLazyRegistrar'] = None
+    '''The instance being tested, if any.'''
+
 
 # -----------------------------------------------------------------------------
 # Base Class
@@ -141,6 +169,300 @@ class ZestFindRegistrations(ZestBase):
         self.assertFalse(found[2])
 
 
+class ZestRegistrationManifest(ZestBase):
+    '''
+    Test the veredi.run.registry's registration manifest.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Set-Up
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Defines any instance variables with type hinting, docstrs.
+        Happens ASAP during unittest.setUp().
+        '''
+        # ------------------------------
+        # Parent!
+        # ------------------------------
+        super()._define_vars()
+
+        self.temp: tempfile.TemporaryDirectory = None
+        '''
+        Temp dir for our copy of the test file tree and the manifest.
+        '''
+
+        self.path_test_root: paths.Path = None
+        '''
+        Path to our copy of the faked out directory structure for finding
+        registration files. We change it, so it can't be the original.
+        '''
+
+        self.path_manifest: paths.Path = None
+        '''
+        Path to the manifest file.
+        '''
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self) -> None:
+        '''
+        Copy the test file tree somewhere we can mess with it.
+        '''
+        self.temp = tempfile.TemporaryDirectory()
+        temp = paths.cast(self.temp.name)
+        self.path_test_root = temp / 'veredi'
+        shutil.copytree(self.type.value / 'run' / '_find_modules' / 'veredi',
+                        self.path_test_root)
+        self.path_manifest = temp / 'manifest.json'
+
+        # Back-date everything so that any change we make is a different
+        # modification time.
+        for dir_path, dir_names, file_names in os.walk(self.path_test_root):
+            for name in dir_names + file_names + ['']:
+                os.utime(os.path.join(dir_path, name), ns=(0, 0))
+
+    # -------------------------------------------------------------------------
+    # Tear-Down
+    # -------------------------------------------------------------------------
+
+    def tear_down(self) -> None:
+        '''
+        Do any of our own clean-up.
+        '''
+        self.temp.cleanup()
+        self.temp = None
+        self.path_test_root = None
+        self.path_manifest = None
+
+    # -------------------------------------------------------------------------
+    # Test Helpers
+    # -------------------------------------------------------------------------
+
+    def key(self) -> str:
+        '''
+        Get the manifest key for searching our test root with defaults.
+        '''
+        return registry._manifest_key(self.path_test_root,
+                                      None, None, None, None,
+                                      None, None, None)
+
+    def save(self) -> Tuple[list, list, list]:
+        '''
+        Search our test root and save a manifest of it.
+
+        Returns the `_find_modules()` results.
+        '''
+        watch = []
+        found = registry._find_modules(self.path_test_root, watch=watch)
+        self.assertTrue(watch)
+        self.assertIn(str(self.path_test_root), watch)
+
+        registry._manifest_save(self.path_manifest,
+                                self.key(),
+                                watch,
+                                found,
+                                {},
+                                self.dotted)
+        self.assertTrue(self.path_manifest.exists())
+        return found
+
+    def load(self) -> Optional[dict]:
+        '''
+        Load our manifest.
+        '''
+        return registry._manifest_load(self.path_manifest,
+                                       self.key(),
+                                       self.dotted)
+
+    # -------------------------------------------------------------------------
+    # Tests
+    # -------------------------------------------------------------------------
+
+    def test_fresh(self) -> None:
+        # No manifest yet.
+        self.assertIsNone(self.load())
+
+        found = self.save()
+        manifest = self.load()
+        self.assertTrue(manifest)
+        self.assertEqual(manifest['registrars'], found[0])
+        self.assertEqual(manifest['registrees'], found[1])
+        self.assertEqual(manifest['unknowns'], found[2])
+        self.assertEqual(manifest['lazy'], {})
+
+        # Different settings get a different key.
+        self.assertNotEqual(
+            registry._manifest_key(self.path_test_root,
+                                   None, None, None, None,
+                                   None, None, True),
+            registry._manifest_key(self.path_test_root,
+                                   None, None, None, None,
+                                   None, None, False))
+        self.assertIsNone(registry._manifest_load(self.path_manifest,
+                                                  'jeff',
+                                                  self.dotted))
+
+    def test_stale_edit(self) -> None:
+        self.save()
+        self.assertTrue(self.load())
+
+        # Editing a file makes it stale.
+        os.utime(self.path_test_root / 'valid' / '__register__.py')
+        self.assertIsNone(self.load())
+
+        # Until it's saved again.
+        self.save()
+        self.assertTrue(self.load())
+
+    def test_stale_add(self) -> None:
+        self.save()
+        self.assertTrue(self.load())
+
+        # Adding a file makes it stale.
+        (self.path_test_root / 'valid' / 'jeff.py').touch()
+        self.assertIsNone(self.load())
+
+    def test_lazy(self) -> None:
+        lazy_ok = ZestLazyRegistrar.dotted
+        recorded = {
+            # Registered nothing: not lazy.
+            'veredi.zest.none': [],
+            # Ignored something: not lazy.
+            'veredi.zest.ignore': [(lazy_ok, None, True)],
+            # Registrar doesn't allow lazy: not lazy.
+            'veredi.zest.eager': [(lazy_ok, 'veredi.zest.jeff', False)],
+            # Lazy.
+            __name__: [(lazy_ok, 'veredi.zest.jeff', True),
+                       (lazy_ok, 'veredi.zest.geoff', True)],
+        }
+        self.assertEqual(registry._manifest_lazy(recorded),
+                         {
+                             __name__: [[lazy_ok, 'veredi.zest.jeff'],
+                                        [lazy_ok, 'veredi.zest.geoff']],
+                         })
+
+
+class ZestLazyRegistration(ZestBase):
+    '''
+    Test recording registrations and lazily importing registrees.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Set-Up
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Defines any instance variables with type hinting, docstrs.
+        Happens ASAP during unittest.setUp().
+        '''
+        # ------------------------------
+        # Parent!
+        # ------------------------------
+        super()._define_vars()
+
+        self.temp: tempfile.TemporaryDirectory = None
+        '''
+        Temp dir for our registree module.
+        '''
+
+        self.registrar: ZestLazyRegistrar = None
+        '''
+        Registrar under test.
+        '''
+
+    def pre_set_up(self,
+                   # Ignored params:
+                   filename:  Literal[None]  = None,
+                   extra:     Literal[Tuple] = (),
+                   test_type: Literal[None]  = None) -> None:
+        super().pre_set_up(filename=__file__)
+
+    def set_up(self) -> None:
+        '''
+        Make our registrar and a registree module for it.
+        '''
+        self.registrar = ZestLazyRegistrar(None)
+        ZestLazyRegistrar.instance = self.registrar
+
+        self.temp = tempfile.TemporaryDirectory()
+        path = paths.cast(self.temp.name) / (_LAZY_MODULE + '.py')
+        path.write_text(f"from {__name__} import ZestLazyRegistrar\n"
+                        "\n"
+                        "def jeff():\n"
+                        "    return 'jeff'\n"
+                        "\n"
+                        "ZestLazyRegistrar.instance.register(\n"
+                        "    jeff, 'veredi', 'zest', 'jeff')\n")
+        sys.path.insert(0, self.temp.name)
+
+    # -------------------------------------------------------------------------
+    # Tear-Down
+    # -------------------------------------------------------------------------
+
+    def tear_down(self) -> None:
+        '''
+        Do any of our own clean-up.
+        '''
+        sys.path.remove(self.temp.name)
+        sys.modules.pop(_LAZY_MODULE, None)
+        self.temp.cleanup()
+        self.temp = None
+
+        self.registrar._ut_unregister()
+        self.registrar = None
+        ZestLazyRegistrar.instance = None
+
+    # -------------------------------------------------------------------------
+    # Tests
+    # -------------------------------------------------------------------------
+
+    def test_recording(self) -> None:
+        def geoff():
+            return 'geoff'
+
+        with registrar.recording() as recorded:
+            self.registrar.register(geoff, 'veredi', 'zest', 'geoff')
+            self.registrar.ignore(int)
+
+        self.assertEqual(recorded,
+                         [
+                             (ZestLazyRegistrar.dotted,
+                              'veredi.zest.geoff',
+                              True),
+                             (ZestLazyRegistrar.dotted, None, True),
+                         ])
+
+        # Done recording.
+        self.registrar.register(geoff, 'veredi', 'zest', 'geoff2')
+        self.assertEqual(len(recorded), 2)
+
+    def test_lazy(self) -> None:
+        registrar.defer(ZestLazyRegistrar.dotted,
+                        'veredi.zest.jeff',
+                        _LAZY_MODULE)
+        self.assertNotIn(_LAZY_MODULE, sys.modules)
+        self.assertEqual(registrar.deferred(ZestLazyRegistrar.dotted),
+                         {'veredi.zest.jeff': _LAZY_MODULE})
+
+        # First get imports it.
+        jeff = self.registrar.get_by_dotted('veredi.zest.jeff', None)
+        self.assertIn(_LAZY_MODULE, sys.modules)
+        self.assertEqual(jeff(), 'jeff')
+        self.assertFalse(registrar.deferred(ZestLazyRegistrar.dotted))
+
+        # Non-deferred misses are still misses.
+        with self.assertRaises(RegistryError):
+            self.registrar.get_by_dotted('veredi.zest.geoff', None)
+
+
 # --------------------------------Unit Testing---------------------------------
 # --                      Main Command Line Entry Point                      --
 # -----------------------------------------------------------------------------
@@ -9,9 +9,12 @@ Profile our registration functionality.
 # Imports
 # -----------------------------------------------------------------------------
 
-from typing import TYPE_CHECKING, Optional, Iterable, Literal
+from typing import TYPE_CHECKING, Optional, Iterable, Tuple, Literal
 from types import ModuleType
 
+import time
+import tempfile
+
 from veredi.zest.base.unit import ZestBase
 from veredi.zest.zpath     import TestType
 
@@ -150,6 +153,34 @@ class ZestFindRegistrations(ZestBase):
         for module in expected_registrees:
             self.assertIn(module, found_registrees)
 
+    def test_manifest(self) -> None:
+        '''
+        Time searching vs checking a fresh manifest of that search.
+        '''
+        key = registry._manifest_key(self.path_test_root,
+                                     None, None, None, None,
+                                     None, None, None)
+        with tempfile.TemporaryDirectory() as temp:
+            path = paths.cast(temp) / 'manifest.json'
+
+            start = time.perf_counter()
+            watch = []
+            found = registry._find_modules(self.path_test_root, watch=watch)
+            searched = time.perf_counter() - start
+
+            registry._manifest_save(path, key, watch, found, {}, self.dotted)
+
+            start = time.perf_counter()
+            manifest = registry._manifest_load(path, key, self.dotted)
+            checked = time.perf_counter() - start
+
+        self.assertTrue(manifest)
+        self.assertEqual(manifest['registrars'], found[0])
+        self.assertEqual(manifest['registrees'], found[1])
+        if self.debugging:
+            print(f"search: {searched:.4f} sec, "
+                  f"fresh manifest: {checked:.4f} sec")
+
 
 # --------------------------------Unit Testing---------------------------------
 # --                      Main Command Line Entry Point                      --
@@ -25,6 +25,7 @@ from .parse  import (
 # Namespaced
 from . import machine
 from . import timer
+from . import pacer
 from . import parse
 
 
@@ -71,5 +72,6 @@ __all__ = [
     # ------------------------------
     'machine',
     'timer',
+    'pacer',
     'parse',
 ]
@@ -0,0 +1,291 @@
+# coding: utf-8
+
+'''
+Real-time pacing for a fixed-timestep loop.
+'''
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Any, Callable, Dict
+
+
+import time as py_time
+from multiprocessing import connection as mp_connection
+
+
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+
+# -----------------------------------------------------------------------------
+# Pacer
+# -----------------------------------------------------------------------------
+
+class TickPacer:
+    '''
+    Paces a loop to a target ticks-per-second: call `wait()` once after each
+    tick and it sleeps until the next tick is due.
+
+    Tick deadlines are on a fixed schedule (one `period` apart), so a slow
+    tick is made up for by a shorter wait. If the loop falls behind, `wait()`
+    returns immediately until it has caught up - unless it is more than
+    `max_behind` ticks behind, in which case those ticks are skipped and the
+    schedule restarts from now.
+
+    Can also wait on 'waitables' (e.g. multiprocessing pipes) instead of just
+    sleeping. If one has data, `wait()` wakes up early and calls the
+    waitables' service functions so the data can be dealt with right away,
+    then goes back to sleep until the tick is due. Waking early never makes a
+    tick happen early; the schedule is not changed by it.
+
+    A pacer with no ticks-per-second is disabled; `wait()` does nothing.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Constants
+    # -------------------------------------------------------------------------
+
+    MAX_BEHIND_DEFAULT = 5
+    '''
+    Default max number of ticks we'll try to catch up on before giving up and
+    skipping them.
+    '''
+
+    # -------------------------------------------------------------------------
+    # Initialization
+    # -------------------------------------------------------------------------
+
+    def _define_vars(self) -> None:
+        '''
+        Instance variable definitions, type hinting, doc strings, etc.
+        '''
+        self._period: float = 0.0
+        '''Seconds per tick. 0.0 means pacing is disabled.'''
+
+        self._max_behind: int = self.MAX_BEHIND_DEFAULT
+        '''
+        Max number of ticks we'll try to catch up on before skipping them.
+        '''
+
+        self._deadline: Optional[float] = None
+        '''
+        Monotonic time when the next tick is due. None if we haven't started
+        pacing yet.
+        '''
+
+        self._waitables: Dict[Any, Callable[[], Optional[bool]]] = {}
+        '''
+        Things to wait on instead of sleeping (anything
+        `multiprocessing.connection.wait()` accepts), and the function to call
+        to service each one.
+        '''
+
+        self._drift: float = 0.0
+        '''
+        How late (in seconds) the last tick started relative to its deadline.
+        '''
+
+        self._caught_up: int = 0
+        '''Number of ticks run without waiting in order to catch up.'''
+
+        self._skipped: int = 0
+        '''Number of ticks skipped due to falling too far behind.'''
+
+        self._woken: int = 0
+        '''Number of times a waitable woke us up early.'''
+
+    def __init__(self,
+                 ticks_per_second: Optional[float] = None,
+                 max_behind:       Optional[int]   = None) -> None:
+        self._define_vars()
+
+        if ticks_per_second and ticks_per_second > 0:
+            self._period = 1.0 / ticks_per_second
+        if max_behind is not None:
+            self._max_behind = max(int(max_behind), 0)
+
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def enabled(self) -> bool:
+        '''True if we have a tick rate to pace to.'''
+        return self._period > 0
+
+    @property
+    def period(self) -> float:
+        '''Seconds per tick. 0.0 if disabled.'''
+        return self._period
+
+    @property
+    def ticks_per_second(self) -> float:
+        '''Target tick rate. 0.0 if disabled.'''
+        return (1.0 / self._period) if self._period else 0.0
+
+    @property
+    def drift(self) -> float:
+        '''
+        How late (in seconds) the last tick started relative to when it was
+        due.
+        '''
+        return self._drift
+
+    @property
+    def caught_up(self) -> int:
+        '''Number of ticks run without waiting in order to catch up.'''
+        return self._caught_up
+
+    @property
+    def skipped(self) -> int:
+        '''Number of ticks skipped due to falling too far behind.'''
+        return self._skipped
+
+    @property
+    def woken(self) -> int:
+        '''Number of times a waitable woke us up early.'''
+        return self._woken
+
+    # -------------------------------------------------------------------------
+    # Waitables
+    # -------------------------------------------------------------------------
+
+    def add_waitable(self,
+                     waitable: Any,
+                     service:  Callable[[], Optional[bool]]) -> None:
+        '''
+        Wake up early from `wait()` when `waitable` has data and call
+        `service()` to deal with it.
+
+        `service()` should not block, and should return:
+          - True if it knows there is more data ready right now (e.g. already
+            buffered, or more than it wanted to deal with in one go), so that
+            it gets called again before we go back to sleep.
+          - False if it dealt with everything.
+          - None if it can't deal with `waitable` right now (e.g. unhealthy,
+            or `waitable` is closed). It would stay readable and keep waking
+            us up, so we stop waiting on it until the next tick is due.
+        '''
+        if waitable is not None:
+            self._waitables[waitable] = service
+
+    def remove_waitable(self, waitable: Any) -> None:
+        '''
+        Stop waiting on `waitable`.
+        '''
+        self._waitables.pop(waitable, None)
+
+    # -------------------------------------------------------------------------
+    # Pacing
+    # -------------------------------------------------------------------------
+
+    @property
+    def _current(self) -> float:
+        return py_time.monotonic()
+
+    def _sleep(self,
+               seconds:   float,
+               waitables: Dict[Any, Callable[[], Optional[bool]]]) -> bool:
+        '''
+        Sleeps for `seconds`, or until one of `waitables` has data.
+
+        Returns True if woken early by a waitable.
+        '''
+        if waitables:
+            try:
+                return bool(mp_connection.wait(list(waitables), seconds))
+            except (OSError, ValueError):
+                # Something got closed on us; stop waiting on any of them.
+                self._waitables.clear()
+                waitables.clear()
+
+        py_time.sleep(seconds)
+        return False
+
+    def _service(self,
+                 waitables: Dict[Any, Callable[[], Optional[bool]]]) -> bool:
+        '''
+        Calls all of `waitables`' service functions. Drops any that can't be
+        serviced right now from `waitables`.
+
+        Returns True if any of them has more data ready right now.
+        '''
+        pending = False
+        for waitable, service in list(waitables.items()):
+            serviced = service()
+            if serviced is None:
+                waitables.pop(waitable, None)
+            elif serviced:
+                pending = True
+        return pending
+
+    def reset(self) -> None:
+        '''
+        Forget the schedule; next `wait()` starts a new one.
+        '''
+        self._deadline = None
+
+    def wait(self) -> bool:
+        '''
+        Call once after each tick. Waits until the next tick is due, servicing
+        waitables whenever they wake us up in the meantime. Only returns when
+        the next tick is due.
+
+        Returns True if woken up early by a waitable, False otherwise.
+        '''
+        if not self._period:
+            return False
+
+        if self._deadline is None:
+            self._deadline = self._current + self._period
+
+        # Waitables we can service this time; any that can't be serviced are
+        # dropped so they don't keep waking us up for nothing.
+        waitables = dict(self._waitables)
+
+        # Service first: anything already buffered won't wake us up.
+        woken = False
+        pending = bool(waitables) and self._service(waitables)
+        while self._deadline > self._current:
+            if not pending:
+                if not self._sleep(self._deadline - self._current, waitables):
+                    break
+                self._woken += 1
+                woken = True
+            pending = self._service(waitables)
+        now = self._current
+
+        # Next tick is due; figure out when the one after it is.
+        self._drift = now - self._deadline
+        behind = int(self._drift // self._period)
+        if behind > self._max_behind:
+            # Too far behind - drop those ticks and start over from now.
+            self._skipped += behind
+            self._deadline = now + self._period
+        else:
+            self._deadline += self._period
+            if self._deadline <= now:
+                self._caught_up += 1
+
+        return woken
+
+    # -------------------------------------------------------------------------
+    # Python Interfaces
+    # -------------------------------------------------------------------------
+
+    def __bool__(self) -> bool:
+        return self.enabled
+
+    def __str__(self) -> str:
+        return (f"{self.__class__.__name__}("
+                f"tps: {self.ticks_per_second:.2f}, "
+                f"drift: {self._drift:.4f}, "
+                f"caught-up: {self._caught_up}, "
+                f"skipped: {self._skipped}, "
+                f"woken: {self._woken})")
+
+    def __repr__(self) -> str:
+        return '<v.pacer:' + str(self) + '>'